@@ -5,8 +5,11 @@ I.e. project-specific endpoints (not APIS built-in API).
 """
 
 import logging
+import os
 
 import django_filters
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.utils.translation import gettext_lazy as _
 
 from apis_ontology.filtersets import fuzzy_search_unaccent_trigram
@@ -15,6 +18,55 @@ from apis_ontology.models import Expression, Topic, WorkType
 
 logger = logging.getLogger(__name__)
 
+# seconds to keep choices of filters cached
+CHOICES_CACHE_TTL = int(os.getenv("CHOICES_CACHE_TTL", 10 * 60))
+
+
+class CachedChoices:
+    """
+    Callable providing choices from a model's table.
+
+    Choices are kept in Django's cache, so they are only queried once
+    per timeout instead of for every request. Saving or deleting an
+    object of the model clears them. Bulk operations like bulk_create()
+    or QuerySet.update() don't send signals, and other processes only
+    share the cleared choices with a shared cache backend, so changes
+    may only show up once the cached choices expire.
+
+    :param model: model class
+    :param value_field: name of the field to use for choice values
+    :param label_field: name of the field to use for choice labels
+    """
+
+    def __init__(self, model, value_field: str, label_field: str):
+        self.model = model
+        self.fields = (value_field, label_field)
+
+        for signal in [post_save, post_delete]:
+            signal.connect(
+                self.invalidate, sender=model, weak=False, dispatch_uid=self.cache_key
+            )
+
+    def __deepcopy__(self, memo):
+        # FilterSets deep-copy their filters for every request
+        return self
+
+    @property
+    def cache_key(self):
+        return f"api-choices:{self.model._meta.label}:{':'.join(self.fields)}"
+
+    def invalidate(self, **kwargs):
+        cache.delete(self.cache_key)
+
+    def __call__(self):
+        choices = cache.get(self.cache_key)
+
+        if choices is None:
+            choices = list(self.model.objects.values_list(*self.fields))
+            cache.set(self.cache_key, choices, CHOICES_CACHE_TTL)
+
+        return choices
+
 
 class WorkPreviewSearchFilter(django_filters.FilterSet):
     text_filter = django_filters.CharFilter(
@@ -37,13 +89,13 @@ class WorkPreviewSearchFilter(django_filters.FilterSet):
         field_name="facet_topic",
         label=_("Topic of the expression."),
         lookup_expr="icontains",
-        choices=Topic.objects.all().values_list("name", "name"),
+        choices=CachedChoices(Topic, "name", "name"),
     )
     facet_work_type = django_filters.MultipleChoiceFilter(
         field_name="work_type",
         label=_("Type of the work."),
         lookup_expr="icontains",
-        choices=WorkType.objects.all().values_list("id", "name"),
+        choices=CachedChoices(WorkType, "id", "name"),
     )
     start_year = django_filters.NumberFilter(
         field_name="min_year",
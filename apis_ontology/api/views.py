@@ -4,12 +4,14 @@ Views for custom API.
 I.e. project-specific endpoints (not APIS built-in API).
 """
 
-from apis_core.apis_metainfo.models import Uri
 from django.contrib.postgres.expressions import ArraySubquery, Subquery
-from django.db.models import Max, Min, OuterRef, Q
+from django.db.models import Max, Min, OuterRef
 from django.db.models.functions import JSONObject
+from django.http import StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import OpenApiResponse, extend_schema
 from rest_framework import mixins, pagination, permissions, viewsets
+from rest_framework.utils.encoders import JSONEncoder
 
 from apis_ontology.models import (
     Archive,
@@ -22,6 +24,7 @@ from apis_ontology.models import (
     Topic,
     Work,
     WorkType,
+    get_external_uris,
 )
 
 from .filters import WorkPreviewSearchFilter
@@ -450,10 +453,9 @@ class WorkDetailViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     filter_backends = [DjangoFilterBackend]
 
     def get_queryset(self):
-        related_uris = Uri.objects.filter(
-            Q(root_object_id=OuterRef("pk")),
-            ~Q(uri__startswith="https://frischmuth-dev.acdh-dev.oeaw.ac.at"),
-        ).values_list("uri", flat=True)
+        related_uris = get_external_uris(root_object_id=OuterRef("pk")).values_list(
+            "uri", flat=True
+        )
 
         work_types = WorkType.objects.filter(
             triple_set_from_obj__subj_id=OuterRef("pk"),
@@ -645,6 +647,48 @@ class WorkDetailViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
         return works
 
 
+class WorkExportViewSet(viewsets.GenericViewSet):
+    """
+    API endpoint which streams all full Work objects as newline-delimited
+    JSON (NDJSON), one Work per line, in the format of the Work detail
+    endpoint.
+
+    Works are read with a server-side cursor in chunks, related data is
+    fetched with the Works' query, so memory use doesn't grow with the
+    number of Works.
+    """
+
+    serializer_class = WorkDetailSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = None
+    chunk_size = 500
+
+    def get_queryset(self):
+        # same data as the detail view, ordered by id for a stable export
+        return WorkDetailViewSet.get_queryset(self).order_by("pk")
+
+    def stream_works(self, queryset):
+        encoder = JSONEncoder(ensure_ascii=False)
+        for work in queryset.iterator(chunk_size=self.chunk_size):
+            yield encoder.encode(self.get_serializer(work).data) + "\n"
+
+    @extend_schema(
+        responses={
+            (200, "application/x-ndjson"): OpenApiResponse(
+                response=WorkDetailSerializer,
+                description="One Work object per line.",
+            )
+        }
+    )
+    def list(self, request, *args, **kwargs):
+        response = StreamingHttpResponse(
+            self.stream_works(self.get_queryset()),
+            content_type="application/x-ndjson; charset=utf-8",
+        )
+        response["Content-Disposition"] = 'attachment; filename="works.ndjson"'
+        return response
+
+
 class PlaceViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     """
     API endpoint which returns Place objects by id only
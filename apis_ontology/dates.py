@@ -0,0 +1,90 @@
+"""
+Normalisation of free-form date strings.
+"""
+
+import datetime
+import functools
+import re
+
+from django.conf import settings
+
+
+# appended to manually input dates which couldn't be parsed
+UNSUPPORTED_DATE_SUFFIX = " (unsupported date)"
+
+FORMAT_DIRECTIVES = {
+    "%Y": r"\d{4}",
+    "%m": r"\d{1,2}",
+    "%d": r"\d{1,2}",
+}
+
+
+@functools.cache
+def get_format_patterns():
+    """
+    Compile a regular expression for each of the project's date input
+    formats which matches strings in that format.
+
+    :return: list of tuples of date format and compiled pattern
+    """
+    patterns = []
+
+    for date_format in settings.DATE_INPUT_FORMATS:
+        pattern = "".join(
+            FORMAT_DIRECTIVES.get(part, re.escape(part))
+            for part in re.split(r"(%[a-zA-Z])", date_format)
+            if part
+        )
+        patterns.append((date_format, re.compile(pattern)))
+
+    return patterns
+
+
+def parse_with_input_formats(date_string: str):
+    """
+    Parse a date string with the project's date input formats.
+
+    Matches dateparser's handling of given formats, which is applied
+    before any other parsing: formats are tried in order and missing
+    months and days default to the first (cf. DATEPARSER_SETTINGS).
+
+    :param date_string: date string
+    :return: a datetime object or None if no format matches
+    """
+    for date_format, pattern in get_format_patterns():
+        if pattern.fullmatch(date_string):
+            try:
+                return datetime.datetime.strptime(date_string, date_format)
+            except ValueError:
+                continue
+
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_publication_date(date_string: str):
+    """
+    Parse a free-form publication date using the date formats and
+    dateparser settings defined in the project settings.
+
+    Strings in one of the date input formats are parsed directly,
+    only other strings are passed on to dateparser. Results are cached
+    for repeated strings.
+
+    :param date_string: manually input date string
+    :return: a datetime object or None if the string could not be parsed
+    """
+    parsed_date = parse_with_input_formats(date_string)
+
+    if not parsed_date:
+        # dateparser takes long to import, so only load it when needed
+        from dateparser import parse
+
+        parsed_date = parse(
+            date_string,
+            languages=[settings.LANGUAGE_CODE],
+            date_formats=settings.DATE_INPUT_FORMATS,
+            settings=settings.DATEPARSER_SETTINGS,
+        )
+
+    return parsed_date
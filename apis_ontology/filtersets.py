@@ -104,6 +104,29 @@ def fuzzy_search_unaccent_trigram(queryset, fields, value):
     return trigram_search_filter(queryset, fields, tokens)
 
 
+class ArrayOverlapFilter(django_filters.MultipleChoiceFilter):
+    """
+    Filter ArrayFields for objects with any of the selected values
+    (or all of them, if conjoined).
+
+    Uses the array overlap/containment operators, which can make use
+    of GIN indexes on the fields.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("distinct", False)
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+
+        lookup = "contains" if self.conjoined else "overlap"
+        qs = self.get_method(qs)(**{f"{self.field_name}__{lookup}": list(value)})
+
+        return qs.distinct() if self.distinct else qs
+
+
 class BaseEntityFilterSet(AbstractEntityFilterSet):
     """
     Parent class for all entity model classes.
@@ -116,11 +139,10 @@ class BaseEntityFilterSet(AbstractEntityFilterSet):
         filter_overrides = {
             **AbstractEntityFilterSet.Meta.filter_overrides,
             ArrayField: {
-                "filter_class": django_filters.MultipleChoiceFilter,
+                "filter_class": ArrayOverlapFilter,
                 # "extra" attribute not working for fields with choices, see:
                 # https://github.com/carltongibson/django-filter/issues/1475
                 "extra": lambda f: {
-                    "lookup_expr": "icontains",
                     "widget": forms.SelectMultiple,
                 },
             },
@@ -152,9 +174,8 @@ class LanguageMixinFilter(django_filters.FilterSet):
     Filter (multiple) language choices defined in models.
     """
 
-    language = django_filters.MultipleChoiceFilter(
+    language = ArrayOverlapFilter(
         choices=LanguageMixin.LanguagesIso6393.choices,
-        lookup_expr="icontains",
     )
 
 
@@ -224,9 +245,8 @@ class VersionPersonFilterSet(PersonFilterSet):
 
 
 class CharacterFilterSet(BaseEntityFilterSet, PersonSearch):
-    fictionality = django_filters.MultipleChoiceFilter(
+    fictionality = ArrayOverlapFilter(
         choices=Character.CharacterFictionality.choices,
-        lookup_expr="icontains",
     )
 
 
@@ -254,45 +274,35 @@ class WorkFilterSet(BaseEntityFilterSet, LanguageMixinFilter, TitlesSearch):
         method=fuzzy_search_unaccent_trigram,
     )
 
-    temporal_order = django_filters.MultipleChoiceFilter(
+    temporal_order = ArrayOverlapFilter(
         choices=Work.TemporalOrder.choices,
-        lookup_expr="icontains",
     )
-    temporal_duration = django_filters.MultipleChoiceFilter(
+    temporal_duration = ArrayOverlapFilter(
         choices=Work.TemporalDuration.choices,
-        lookup_expr="icontains",
     )
-    temporal_frequency = django_filters.MultipleChoiceFilter(
+    temporal_frequency = ArrayOverlapFilter(
         choices=Work.TemporalFrequency.choices,
-        lookup_expr="icontains",
     )
-    figure_speech = django_filters.MultipleChoiceFilter(
+    figure_speech = ArrayOverlapFilter(
         choices=Work.FigureSpeech.choices,
-        lookup_expr="icontains",
     )
-    representation_of_thought = django_filters.MultipleChoiceFilter(
+    representation_of_thought = ArrayOverlapFilter(
         choices=Work.RepresentationOfThought.choices,
-        lookup_expr="icontains",
     )
-    focalization = django_filters.MultipleChoiceFilter(
+    focalization = ArrayOverlapFilter(
         choices=Work.Focalization.choices,
-        lookup_expr="icontains",
     )
-    narrative_situation = django_filters.MultipleChoiceFilter(
+    narrative_situation = ArrayOverlapFilter(
         choices=Work.NarrativeSituation.choices,
-        lookup_expr="icontains",
     )
-    narrative_chronology = django_filters.MultipleChoiceFilter(
+    narrative_chronology = ArrayOverlapFilter(
         choices=Work.NarrativeChronology.choices,
-        lookup_expr="icontains",
     )
-    narrative_level = django_filters.MultipleChoiceFilter(
+    narrative_level = ArrayOverlapFilter(
         choices=Work.NarrativeLevel.choices,
-        lookup_expr="icontains",
     )
-    narrative_voice = django_filters.MultipleChoiceFilter(
+    narrative_voice = ArrayOverlapFilter(
         choices=Work.NarrativeVoice.choices,
-        lookup_expr="icontains",
     )
 
 
@@ -301,9 +311,8 @@ class VersionWorkFilterSet(WorkFilterSet):
 
 
 class ExpressionFilterSet(BaseEntityFilterSet, LanguageMixinFilter, TitlesSearch):
-    edition_type = django_filters.MultipleChoiceFilter(
+    edition_type = ArrayOverlapFilter(
         choices=Expression.EditionTypes.choices,
-        lookup_expr="icontains",
     )
 
     page_count = django_filters.RangeFilter(
@@ -0,0 +1,288 @@
+import datetime
+import json
+import os
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from apis_ontology.scripts.import_helpers import IMPORT_CHUNK_SIZE
+
+
+# importers in the order in which they depend on each other's data
+IMPORTERS = ["base_data", "zotero", "vorlass", "excel"]
+
+
+class QueryCounter:
+    """
+    Database execute wrapper which counts executed queries.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def get_commit():
+    """
+    :return: hash of the checked out Git commit or None
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(run_importer, trace_memory=False):
+    """
+    Run an importer and measure its throughput and number of queries.
+
+    Memory is traced with tracemalloc for the duration of the run only,
+    so the peak is that of the given importer, not of the whole process.
+    Allocations in worker processes of the pipeline engine aren't traced.
+
+    :param run_importer: function which runs the import and returns
+                         the number of imported items
+    :param trace_memory: boolean to also measure peak memory allocated
+                         during the run; slows down the import
+    :return: dictionary of measurements
+    """
+    counter = QueryCounter()
+
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+
+    try:
+        with connection.execute_wrapper(counter):
+            items = run_importer()
+
+        seconds = time.perf_counter() - start
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return {
+        "items": items,
+        "wall_time_seconds": round(seconds, 3),
+        "items_per_second": round(items / seconds, 2) if seconds else None,
+        "queries": counter.count,
+        "queries_per_item": round(counter.count / items, 2) if items else None,
+        "peak_memory_kib": peak_memory // 1024 if trace_memory else None,
+    }
+
+
+def benchmark_base_data():
+    from apis_ontology.management.commands.create_base_data import create_base_data
+    from apis_ontology.scripts.additional_infos import ARCHIVES, PERSONS, WORK_TYPES
+
+    create_base_data()
+
+    return len(ARCHIVES) + len(PERSONS) + len(WORK_TYPES)
+
+
+def benchmark_zotero(size, tmp_dir, engine, chunk_size):
+    from apis_ontology.scripts.benchmark_data import generate_zotero_items
+    from apis_ontology.scripts.import_zotero_collections import import_items
+
+    items = generate_zotero_items(size)
+    import_items(
+        items,
+        "BenchmarkZotero",
+        run_name=f"benchmark_zotero_{size}",
+        chunk_size=chunk_size,
+        engine=engine,
+    )
+
+    return len(items)
+
+
+def benchmark_vorlass(size, tmp_dir, engine, chunk_size):
+    from apis_ontology.scripts.benchmark_data import generate_tei_file
+    from apis_ontology.scripts.import_helpers import create_source
+    from apis_ontology.scripts.import_vorlass_data import parse_vorlass_xml
+
+    tei_file = os.path.join(tmp_dir, f"benchmark_vorlass_{size}.xml")
+    title_siglum_dict = generate_tei_file(size, tei_file)
+    source, created = create_source(
+        name="BenchmarkVorlass", file_name=os.path.basename(tei_file)
+    )
+    success, failure = parse_vorlass_xml(
+        title_siglum_dict,
+        source,
+        chunk_size=chunk_size,
+        engine=engine,
+        tei_file=tei_file,
+    )
+
+    return len(success)
+
+
+def benchmark_excel(size, tmp_dir, engine, chunk_size):
+    from apis_ontology.models import Work
+    from apis_ontology.scripts.benchmark_data import generate_excel_file, get_siglum
+    from apis_ontology.scripts.import_nonbibl_entities_from_excel import (
+        parse_entities_excel,
+    )
+
+    sigla = list(
+        Work.objects.exclude(siglum__isnull=True)
+        .exclude(siglum="")
+        .values_list("siglum", flat=True)
+    ) or [get_siglum("Z", 0)]
+
+    excel_file = os.path.join(tmp_dir, f"benchmark_entities_{size}.xlsx")
+    rows = generate_excel_file(size, excel_file, sigla)
+    parse_entities_excel(excel_file, chunk_size=chunk_size, engine=engine)
+
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the import scripts with synthetic input data "
+        "against a test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-s",
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[100],
+            help="Numbers of items to generate per importer, e.g. 100 1000. "
+            "Each size is benchmarked against an emptied database.",
+        )
+        parser.add_argument(
+            "-i",
+            "--importers",
+            nargs="+",
+            choices=IMPORTERS,
+            default=IMPORTERS,
+            help="Importers to benchmark. Base data is always created, "
+            "the Excel import relates entities to previously imported Works.",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            default="benchmark_results.json",
+            help="Path of the JSON file to write results to.",
+        )
+        parser.add_argument(
+            "--engine",
+            choices=["serial", "pipeline"],
+            default="serial",
+            help="Engine to run the importers with.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            dest="chunk_size",
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help="Number of items to commit to the database per transaction.",
+        )
+        parser.add_argument(
+            "--trace-memory",
+            dest="trace_memory",
+            action="store_true",
+            help="Measure peak memory allocated per importer with tracemalloc. "
+            "Tracing slows down the imports, so only compare throughput "
+            "between runs with the same setting.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep the test database between runs.",
+        )
+
+    def handle(self, *args, **options):
+        old_database_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, keepdb=options["keepdb"]
+        )
+
+        try:
+            results = self.run_benchmarks(options)
+        finally:
+            connection.creation.destroy_test_db(
+                old_database_name, verbosity=0, keepdb=options["keepdb"]
+            )
+
+        report = {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": get_commit(),
+            "engine": options["engine"],
+            "chunk_size": options["chunk_size"],
+            "trace_memory": options["trace_memory"],
+            "results": results,
+        }
+
+        with open(options["output"], "w", encoding="utf-8") as file_obj:
+            json.dump(report, file_obj, indent=2)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote benchmark results to {options['output']}.")
+        )
+
+    def run_benchmarks(self, options):
+        from apis_ontology.models import construct_properties
+
+        results = []
+        benchmarks = {
+            "zotero": benchmark_zotero,
+            "vorlass": benchmark_vorlass,
+            "excel": benchmark_excel,
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for size in options["sizes"]:
+                call_command("flush", interactive=False, verbosity=0)
+                construct_properties()
+
+                base_data = measure(benchmark_base_data, options["trace_memory"])
+                if "base_data" in options["importers"]:
+                    results.append({"importer": "base_data", "size": size, **base_data})
+                    self.write_result(results[-1])
+
+                for importer in IMPORTERS[1:]:
+                    if importer not in options["importers"]:
+                        continue
+
+                    result = measure(
+                        lambda: benchmarks[importer](
+                            size, tmp_dir, options["engine"], options["chunk_size"]
+                        ),
+                        options["trace_memory"],
+                    )
+                    results.append({"importer": importer, "size": size, **result})
+                    self.write_result(results[-1])
+
+        return results
+
+    def write_result(self, result):
+        message = (
+            f"{result['importer']} ({result['size']}): "
+            f"{result['items']} items in {result['wall_time_seconds']}s, "
+            f"{result['items_per_second']} items/s, "
+            f"{result['queries_per_item']} queries/item"
+        )
+
+        if result["peak_memory_kib"] is not None:
+            message += f", peak memory {result['peak_memory_kib']} KiB"
+
+        self.stdout.write(message)
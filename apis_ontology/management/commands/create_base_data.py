@@ -1,84 +1,149 @@
-import os
-
-from apis_core.apis_relations.models import Property
+from apis_core.apis_relations.models import Property, TempTriple
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
-from apis_ontology.models import Archive, Person, WorkType
+from apis_ontology.models import Archive, DataSource, Person, WorkType
 from apis_ontology.scripts.additional_infos import ARCHIVES, PERSONS, WORK_TYPES
-from apis_ontology.scripts.import_helpers import create_source, create_triple
+from apis_ontology.scripts.import_helpers import create_source
 
 
-fname = os.path.basename(__file__)
-data_source, created = create_source(
-    name="BaseEntitiesSource", file_name="additional_infos.py", data_type="python"
-)
+BASE_DATA_SOURCE_NAME = "BaseEntitiesSource"
 
 
-def create_archives(calling_file=fname):
+def get_base_data_source():
     """
-    Create objects for Archive entity.
+    Get the DataSource of base data, create it if it doesn't exist yet.
+
+    :return: DataSource object
+    """
+    data_source = (
+        DataSource.objects.filter(name=BASE_DATA_SOURCE_NAME).order_by("id").first()
+    )
+    if not data_source:
+        data_source, created = create_source(
+            name=BASE_DATA_SOURCE_NAME,
+            file_name="additional_infos.py",
+            data_type="python",
+        )
+
+    return data_source
+
 
-    :param calling_file: optional argument to pass filename of the calling
-                         script, otherwise uses this file's name
+def create_missing(model, key_fields, objects_data, data_source):
     """
+    Create objects which don't exist yet, as identified by their key
+    fields. Existing objects are looked up with a single query.
 
-    for a in ARCHIVES:
-        # for archives, save XML file as pubinfo when creating sources
-        # for later reference
-        Archive.objects.get_or_create(
-            name=a["name"],
-            data_source=data_source,
+    Entities use multi-table inheritance, which rules out bulk_create(),
+    so missing objects are saved one by one.
+
+    :param model: entity model class
+    :param key_fields: names of the fields identifying an object
+    :param objects_data: list of dictionaries of field values
+    :param data_source: DataSource object to link new objects to
+    :return: dictionary of all objects by their key field values
+    """
+    objects = {
+        tuple(getattr(obj, field) for field in key_fields): obj
+        for obj in model.objects.filter(
+            **{f"{key_fields[0]}__in": [d[key_fields[0]] for d in objects_data]}
         )
+    }
+
+    for data in objects_data:
+        key = tuple(data[field] for field in key_fields)
+        if key not in objects:
+            objects[key] = model.objects.create(**data, data_source=data_source)
+
+    return objects
 
 
-def create_persons(calling_file=fname):
+def create_archives(data_source):
     """
-    Create objects for Person entity.
+    Create objects for Archive entity.
 
-    :param calling_file: optional argument to pass filename of the calling
-                         script, otherwise uses this file's name
+    :param data_source: DataSource object to link new objects to
     """
+    create_missing(
+        Archive, ["name"], [{"name": a["name"]} for a in ARCHIVES], data_source
+    )
 
-    for p in sorted(PERSONS, key=lambda d: d["id"]):
-        Person.objects.get_or_create(
-            forename=p["first_name"], surname=p["last_name"], data_source=data_source
-        )
 
+def create_persons(data_source):
+    """
+    Create objects for Person entity.
 
-def create_types(calling_file=fname):
+    :param data_source: DataSource object to link new objects to
     """
-    Create objects for WorkType entity.
+    create_missing(
+        Person,
+        ["forename", "surname"],
+        [
+            {"forename": p["first_name"], "surname": p["last_name"]}
+            for p in sorted(PERSONS, key=lambda d: d["id"])
+        ],
+        data_source,
+    )
+
+
+def create_types(data_source):
+    """
+    Create objects for WorkType entity and the relations between
+    types and their parent types.
 
-    :param calling_file: optional argument to pass filename of the calling
-                         script, otherwise uses this file's name
+    :param data_source: DataSource object to link new objects to
     """
+    work_types = create_missing(
+        WorkType,
+        ["name", "name_plural"],
+        [
+            {
+                "name": work_type["german_label"],
+                "name_plural": work_type["german_label_plural"],
+            }
+            for work_type in WORK_TYPES.values()
+        ],
+        data_source,
+    )
+    work_types_by_name = {
+        work_type.name: work_type for work_type in work_types.values()
+    }
+
+    work_type_ids = [work_type.id for work_type in work_types.values()]
+
+    prop = Property.objects.get(name_forward="has broader term")
+    existing = set(
+        TempTriple.objects.filter(
+            prop=prop, subj_id__in=work_type_ids, obj_id__in=work_type_ids
+        ).values_list("subj_id", "obj_id")
+    )
 
     # types with parents, not top-level types
-    children = {key: val for (key, val) in WORK_TYPES.items() if val["parent_key"]}
-
-    # create objects for all types
     for work_type in WORK_TYPES.values():
-        wtype, created = WorkType.objects.get_or_create(
-            name=work_type["german_label"],
-            name_plural=work_type["german_label_plural"],
-            data_source=data_source,
-        )
-
-    for work_type in children.values():
-        wt_object = WorkType.objects.get(name=work_type["german_label"])
         parent_key = work_type["parent_key"]
-        parent_object = WorkType.objects.get(
-            name=WORK_TYPES[parent_key]["german_label"]
-        )
-        create_triple(
-            entity_subj=wt_object,
-            entity_obj=parent_object,
-            prop=Property.objects.get(name_forward="has broader term"),
-        )
+        if not parent_key:
+            continue
+
+        wt_object = work_types_by_name[work_type["german_label"]]
+        parent_object = work_types_by_name[WORK_TYPES[parent_key]["german_label"]]
+
+        if (wt_object.id, parent_object.id) not in existing:
+            TempTriple.objects.create(subj=wt_object, obj=parent_object, prop=prop)
+            existing.add((wt_object.id, parent_object.id))
+
+
+def create_base_data():
+    """
+    Create base data entities which don't exist yet in a single
+    transaction. Can be run repeatedly.
+    """
+    with transaction.atomic():
+        data_source = get_base_data_source()
+        create_archives(data_source)
+        create_persons(data_source)
+        create_types(data_source)
 
 
 class Command(BaseCommand):
     def handle(self, *args, **options):
-        create_archives()
-        create_persons()
-        create_types()
+        create_base_data()
@@ -1,10 +1,22 @@
+import json
+import time
+
+from apis_core.apis_metainfo.models import Uri
+from apis_core.apis_relations.models import TempTriple
 from apis_core.utils.caching import (
     get_all_entity_class_names,
     get_entity_class_of_name,
 )
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
 
 from apis_ontology.models import DataSource
+from apis_ontology.scripts.utils import positive_int
+
+
+DELETE_BATCH_SIZE = 1000
+SOURCES_PAGE_SIZE = 50
 
 
 class Command(BaseCommand):
@@ -12,15 +24,6 @@ class Command(BaseCommand):
 
     help = "Delete entity objects from specific Sources."
 
-    all_sources = DataSource.objects.all()
-    source_names = [s.name for s in all_sources]
-    # allow targeting of objects which don't belong to a Source; useful
-    # e.g. when objects were previously imported without assigning a Source
-    # or when a Source was deleted (by name) but its objects remained
-    # TODO rework 'NULL' sources so they remain available as an option
-    #  but aren't included when deleting 'ALL_SOURCES'
-    source_names.append("NULL")
-
     missing_args_message = (
         "\n"
         "You need to provide both the name of a source "
@@ -34,20 +37,36 @@ class Command(BaseCommand):
             "-l",
             "--list",
             dest="list",
-            action="store_const",
-            const=True,
-            help="List all available sources.",
+            nargs="?",
+            const="",
+            metavar="PREFIX",
+            help="List available sources, optionally only those "
+            "whose names start with the given prefix.",
         )
-        # positional arguments (required)
+        parser.add_argument(
+            "--page",
+            dest="page",
+            type=positive_int,
+            default=1,
+            help="Page of sources to list.",
+        )
+        parser.add_argument(
+            "--page-size",
+            dest="page_size",
+            type=positive_int,
+            default=SOURCES_PAGE_SIZE,
+            help="Number of sources to list per page.",
+        )
+        # positional arguments (required unless listing sources)
         parser.add_argument(
             "source",
-            nargs=1,
+            nargs="?",
             type=str,
             help="Name of source for which to remove entity objects.",
         )
         parser.add_argument(
             "entity",
-            nargs="+",
+            nargs="*",
             type=str,
             help="Name of model class from which to remove those objects.",
         )
@@ -59,7 +78,32 @@ class Command(BaseCommand):
             action="store_const",
             const=True,
             help="Dry-run deletion action. "
-            "Does not actually delete objects from the database.",
+            "Does not actually delete objects from the database, "
+            "but reports the numbers of objects which would be deleted.",
+        )
+        parser.add_argument(
+            "--json",
+            dest="json",
+            action="store_true",
+            help="Output the dry-run report as JSON. Requires --dry-run.",
+        )
+        parser.add_argument(
+            "-b",
+            "--bulk",
+            dest="bulk",
+            action="store_true",
+            help="Delete objects in batches instead of one by one, "
+            "reporting progress per batch instead of per object. "
+            "URIs are deleted with a single query per batch, entity objects "
+            "and triples are still collected and deleted with signals "
+            "so their deletion is recorded in their history.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=positive_int,
+            default=DELETE_BATCH_SIZE,
+            help="Number of objects to delete per transaction in bulk mode.",
         )
 
     def handle(self, *args, **options):
@@ -69,22 +113,33 @@ class Command(BaseCommand):
         source_obj = None
         entities = []
         entities_failed = []
+        plan = {}
 
         all_entities = get_all_entity_class_names()
         entity_names = [m for m in all_entities]
 
+        if options["list"] is not None:
+            self.list_sources(options["list"], options["page"], options["page_size"])
+            return
+
+        if not options["source"] or not options["entity"]:
+            raise CommandError(self.missing_args_message)
+
+        if options["json"] and not options["skip"]:
+            raise CommandError("--json can only be used together with --dry-run.")
+
         if options["skip"]:
             skip = True
             msg_prefix = "DRY RUN – "
 
-        source_name = options["source"][0]
+        source_name = options["source"]
         if source_name == "ALL_SOURCES":
             source_obj = DataSource.objects.all()
         elif source_name != "NULL":
             source_obj = DataSource.objects.filter(name=source_name)
-            if len(source_obj) == 0:
-                for src in self.source_names:
-                    self.stdout.write(src)
+            if not source_obj.exists():
+                if not self.list_sources(source_name, 1, options["page_size"]):
+                    self.list_sources("", 1, options["page_size"])
                 self.stdout.write(
                     self.style.ERROR(
                         f"The supplied Source {source_name} does not exist, "
@@ -93,7 +148,7 @@ class Command(BaseCommand):
                 )
                 exit(1)
             else:
-                if len(source_obj) > 1:
+                if source_obj.count() > 1:
                     self.stdout.write(
                         "There are several source objects with the given name. "
                         "Please provide the ID for the source from which to delete objects:"
@@ -143,7 +198,19 @@ class Command(BaseCommand):
                 if not source_obj:
                     ent_obj = ent_class.objects.filter(data_source__isnull=True)
 
-                obj_count = len(ent_obj)
+                if skip:
+                    plan[ent] = self.plan_deletion(ent_obj)
+                    if not options["json"]:
+                        self.stdout.write(
+                            f"{msg_prefix}{source_name}: {ent}: "
+                            + ", ".join(
+                                f"{v} {k.replace('_', ' ')}"
+                                for k, v in plan[ent].items()
+                            )
+                        )
+                    continue
+
+                obj_count = ent_obj.count()
 
                 success_msg = (
                     f"Deleted {obj_count} {ent} objects from Source " f"{source_name}"
@@ -152,22 +219,17 @@ class Command(BaseCommand):
                     f"No {ent} objects to delete from Source {source_name}."
                 )
 
-                if skip:
-                    success_msg = msg_prefix + success_msg
-                    nothing_todo_msg = msg_prefix + nothing_todo_msg
-
-                if obj_count > 0:
+                if obj_count > 0 and options["bulk"]:
+                    self.bulk_delete(ent_obj, ent, obj_count, options["batch_size"])
+                    self.stdout.write(self.style.SUCCESS(success_msg))
+                elif obj_count > 0:
                     self.stdout.write(self.style.SUCCESS(success_msg))
                     for obj in ent_obj:
                         delete_msg = f".. Deleted {ent} object {obj}."
                         delete_err_msg = f"Failed to delete '{obj}'."
-                        if skip:
-                            delete_msg = msg_prefix + delete_msg
-                            delete_err_msg = msg_prefix + delete_err_msg
 
                         try:
-                            if not skip:
-                                obj.delete()
+                            obj.delete()
                             self.stdout.write(delete_msg)
                         except Exception as e:
                             self.stdout.write(self.style.ERROR(delete_err_msg))
@@ -176,6 +238,16 @@ class Command(BaseCommand):
                 else:
                     self.stdout.write(nothing_todo_msg)
 
+        if options["json"]:
+            report = {
+                "source": source_name,
+                "dry_run": bool(skip),
+                "entities": plan,
+                "unknown_entities": entities_failed,
+            }
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
         if len(entities_failed) > 0:
             self.stdout.write(self.style.ERROR("The following entities do not exist:"))
 
@@ -184,3 +256,121 @@ class Command(BaseCommand):
 
             self.stdout.write("Available entities:")
             self.stdout.write(", ".join(entity_names))
+
+    def list_sources(self, prefix, page, page_size):
+        """
+        List the distinct names of sources one page at a time.
+
+        :param prefix: only list sources whose names start with it
+        :param page: number of the page to list, starting at 1
+        :param page_size: number of sources per page
+        :return: number of sources whose names start with the prefix
+        """
+        names = (
+            DataSource.objects.filter(name__startswith=prefix)
+            .order_by("name")
+            .values_list("name", flat=True)
+            .distinct()
+        )
+        count = names.count()
+        pages = max(1, -(-count // page_size))
+
+        if page > pages:
+            raise CommandError(
+                f"Page {page} is out of range, there are {pages} pages "
+                f"of {count} sources."
+            )
+
+        offset = (page - 1) * page_size
+
+        for name in names[offset : offset + page_size]:
+            self.stdout.write(name)
+
+        # allow targeting of objects which don't belong to a Source; useful
+        # e.g. when objects were previously imported without assigning a Source
+        # or when a Source was deleted (by name) but its objects remained
+        # TODO rework 'NULL' sources so they remain available as an option
+        #  but aren't included when deleting 'ALL_SOURCES'
+        if page == pages and "NULL".startswith(prefix):
+            self.stdout.write("NULL")
+
+        self.stdout.write(f"Page {page} of {pages} ({count} sources).")
+
+        return count
+
+    def plan_deletion(self, queryset):
+        """
+        Count the objects which deleting the objects of a queryset
+        would affect, using aggregate queries only.
+
+        Version rows are kept on deletion (with an additional deletion
+        version per object), they are counted to estimate the size
+        of the remaining history.
+
+        :param queryset: QuerySet of entity objects to delete
+        :return: dictionary of counts of entity objects, TempTriples
+                 and Uris to be deleted and of their version rows
+        """
+        ids = queryset.values("id")
+        triples = TempTriple.objects.filter(Q(subj_id__in=ids) | Q(obj_id__in=ids))
+
+        return {
+            "objects": queryset.count(),
+            "triples": triples.count(),
+            "uris": Uri.objects.filter(root_object_id__in=ids).count(),
+            "object_versions": queryset.model.history.filter(id__in=ids).count(),
+            "triple_versions": TempTriple.history.filter(
+                id__in=triples.values("id")
+            ).count(),
+        }
+
+    def bulk_delete(self, queryset, entity_name, obj_count, batch_size):
+        """
+        Delete the objects of a queryset in batches of consecutive IDs,
+        each in a single transaction, together with the TempTriples and
+        Uris which refer to them.
+
+        Uris have neither history nor dependent rows, so Django deletes
+        them with a single DELETE query. Entity objects and TempTriples
+        are collected and deleted one by one, sending the signals which
+        create their deletion versions, i.e. deleting them is not set-based.
+
+        :param queryset: QuerySet of entity objects to delete
+        :param entity_name: name of the entity class, used for reporting
+        :param obj_count: number of objects in the queryset
+        :param batch_size: number of objects to delete per transaction
+        """
+        deleted = 0
+        deleted_triples = 0
+        deleted_uris = 0
+        last_id = 0
+        start = time.perf_counter()
+
+        while True:
+            ids = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            with transaction.atomic():
+                # the total includes the rows of the parent Triple model
+                _, triples = TempTriple.objects.filter(
+                    Q(subj_id__in=ids) | Q(obj_id__in=ids)
+                ).delete()
+                uris, _ = Uri.objects.filter(root_object_id__in=ids).delete()
+                queryset.model.objects.filter(id__in=ids).delete()
+
+            deleted += len(ids)
+            deleted_triples += triples.get(TempTriple._meta.label, 0)
+            deleted_uris += uris
+            last_id = ids[-1]
+            seconds = time.perf_counter() - start
+
+            self.stdout.write(
+                f".. Deleted {deleted}/{obj_count} {entity_name} objects "
+                f"({deleted / seconds:.1f} objects/s) "
+                f"along with {deleted_triples} triples and {deleted_uris} URIs."
+            )
@@ -0,0 +1,189 @@
+import json
+import os
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from apis_core.apis_relations.models import Property, TempTriple
+from apis_core.utils.caching import (
+    get_all_entity_class_names,
+    get_entity_class_of_name,
+)
+from django.core.management.base import BaseCommand, CommandError
+
+from apis_ontology.scripts.utils import positive_int
+
+
+EXPORT_BATCH_SIZE = 10000
+
+
+def get_arrow_type(field):
+    """
+    Map a Django model field to the Arrow data type of its column.
+
+    Foreign keys are exported as the IDs of the related objects,
+    array fields as lists of their base field's type. Fields of
+    unknown types are exported as strings.
+
+    :param field: model field
+    :return: Arrow data type
+    """
+    internal_type = field.get_internal_type()
+
+    if internal_type == "ArrayField":
+        return pa.list_(get_arrow_type(field.base_field))
+    if internal_type in ["ForeignKey", "OneToOneField"]:
+        return get_arrow_type(field.target_field)
+    if internal_type in [
+        "AutoField",
+        "BigAutoField",
+        "SmallAutoField",
+        "IntegerField",
+        "BigIntegerField",
+        "SmallIntegerField",
+        "PositiveIntegerField",
+        "PositiveBigIntegerField",
+        "PositiveSmallIntegerField",
+    ]:
+        return pa.int64()
+    if internal_type == "BooleanField":
+        return pa.bool_()
+    if internal_type == "FloatField":
+        return pa.float64()
+    if internal_type == "DecimalField":
+        return pa.decimal128(field.max_digits, field.decimal_places)
+    if internal_type == "DateField":
+        return pa.date32()
+    if internal_type == "DateTimeField":
+        return pa.timestamp("us", tz="UTC")
+
+    return pa.string()
+
+
+def get_columns(model):
+    """
+    :param model: model class
+    :return: list of tuples of field attribute name and Arrow data type
+             for all of the model's concrete fields, including those of
+             parent models
+    """
+    return [
+        (field.attname, get_arrow_type(field)) for field in model._meta.concrete_fields
+    ]
+
+
+def to_column_value(value, arrow_type):
+    """
+    Convert values which Arrow can't read as the column's type.
+    """
+    if value is not None and arrow_type == pa.string() and not isinstance(value, str):
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return str(value)
+
+    return value
+
+
+def export_model(model, file_path, batch_size):
+    """
+    Write all objects of a model to a Parquet file.
+
+    Objects are read in batches of rows ordered by their primary key,
+    each of which is written as a row group, so memory use depends on
+    the batch size rather than on the number of objects.
+
+    :param model: model class
+    :param file_path: path of the Parquet file
+    :param batch_size: number of objects to read per query
+    :return: number of exported objects
+    """
+    columns = get_columns(model)
+    names = [name for name, arrow_type in columns]
+    schema = pa.schema(columns)
+    queryset = model.objects.order_by("pk").values_list(*names)
+    pk_index = names.index(model._meta.pk.attname)
+    exported = 0
+    last_pk = None
+
+    with pq.ParquetWriter(file_path, schema) as writer:
+        while True:
+            batch = queryset
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            rows = list(batch[:batch_size])
+            if not rows:
+                break
+
+            arrays = [
+                pa.array(
+                    [to_column_value(row[i], arrow_type) for row in rows],
+                    type=arrow_type,
+                )
+                for i, (name, arrow_type) in enumerate(columns)
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+
+            exported += len(rows)
+            last_pk = rows[-1][pk_index]
+
+    return exported
+
+
+class Command(BaseCommand):
+    help = (
+        "Export all entity objects, properties and triples to Parquet files "
+        "(one per model) for offline analysis."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-o",
+            "--output-dir",
+            dest="output_dir",
+            default="snapshot",
+            help="Directory to write the Parquet files to.",
+        )
+        parser.add_argument(
+            "entity",
+            nargs="*",
+            help="Names of entities to export (default: all entities). "
+            "Properties and triples are always exported.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=positive_int,
+            default=EXPORT_BATCH_SIZE,
+            help="Number of objects to read per query and to write per row group.",
+        )
+
+    def handle(self, *args, **options):
+        entity_names = get_all_entity_class_names()
+        entities = options["entity"] or entity_names
+        unknown_entities = [e for e in entities if e not in entity_names]
+        if unknown_entities:
+            raise CommandError(f"Unknown entities: {', '.join(unknown_entities)}")
+
+        models = [get_entity_class_of_name(e) for e in entities]
+        models += [Property, TempTriple]
+
+        os.makedirs(options["output_dir"], exist_ok=True)
+
+        for model in models:
+            start = time.perf_counter()
+            file_path = os.path.join(
+                options["output_dir"], f"{model._meta.model_name}.parquet"
+            )
+            exported = export_model(model, file_path, options["batch_size"])
+            seconds = time.perf_counter() - start
+
+            self.stdout.write(
+                f"Exported {exported} {model.__name__} objects to {file_path} "
+                f"in {seconds:.1f}s."
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported snapshot of {len(models)} models to {options['output_dir']}."
+            )
+        )
@@ -0,0 +1,104 @@
+from django.core.management.base import BaseCommand
+
+from apis_ontology.dates import UNSUPPORTED_DATE_SUFFIX, parse_publication_date
+from apis_ontology.models import Expression
+from apis_ontology.scripts.utils import positive_int
+
+
+UPDATE_BATCH_SIZE = 500
+
+
+def normalize_publication_date(manual_input: str):
+    """
+    Parse a manually input publication date the way Expression.save()
+    does, retrying dates previously marked as unsupported.
+
+    :param manual_input: value of field "publication_date_manual_input"
+    :return: tuple of new values for fields "publication_date_manual_input"
+             and "publication_date_iso_formatted"
+    """
+    date_string = manual_input.removesuffix(UNSUPPORTED_DATE_SUFFIX)
+    parsed_date = parse_publication_date(date_string)
+
+    if not parsed_date:
+        return f"{date_string}{UNSUPPORTED_DATE_SUFFIX}", None
+
+    return date_string, parsed_date.date()
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-parse the manually input publication dates of all expressions "
+        "and update their ISO formatted dates in bulk."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-n",
+            "--dry-run",
+            dest="dry_run",
+            action="store_true",
+            help="Only report the number of expressions which would be updated.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=positive_int,
+            default=UPDATE_BATCH_SIZE,
+            help="Number of expressions to update per query.",
+        )
+
+    def handle(self, *args, **options):
+        fields = ["publication_date_manual_input", "publication_date_iso_formatted"]
+        batch_size = options["batch_size"]
+        processed = 0
+        updated = 0
+        unsupported = 0
+        changed = []
+
+        expressions = (
+            Expression.objects.exclude(publication_date_manual_input="")
+            .exclude(publication_date_manual_input__isnull=True)
+            .only("id", *fields)
+            .order_by("id")
+        )
+
+        for expression in expressions.iterator(chunk_size=batch_size):
+            processed += 1
+            manual_input, iso_date = normalize_publication_date(
+                expression.publication_date_manual_input
+            )
+
+            if iso_date is None:
+                unsupported += 1
+
+            if (
+                manual_input != expression.publication_date_manual_input
+                or iso_date != expression.publication_date_iso_formatted
+            ):
+                expression.publication_date_manual_input = manual_input
+                expression.publication_date_iso_formatted = iso_date
+                changed.append(expression)
+
+            if len(changed) >= batch_size:
+                updated += self.update(changed, fields, options["dry_run"])
+                changed = []
+
+        updated += self.update(changed, fields, options["dry_run"])
+
+        msg_prefix = "DRY RUN – " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{msg_prefix}Processed {processed} expressions, "
+                f"updated {updated}, {unsupported} with unsupported dates."
+            )
+        )
+
+    def update(self, expressions, fields, dry_run):
+        """
+        :return: number of updated expressions
+        """
+        if expressions and not dry_run:
+            Expression.objects.bulk_update(expressions, fields)
+
+        return len(expressions)
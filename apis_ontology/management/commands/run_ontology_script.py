@@ -1,6 +1,9 @@
 import importlib
+import inspect
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+
+from apis_ontology.scripts.utils import positive_int
 
 
 class Command(BaseCommand):
@@ -8,7 +11,50 @@ class Command(BaseCommand):
         script = importlib.import_module(
             f"apis_ontology.scripts.{options['ontology_script']}"
         )
-        script.run()
+        # only pass on options which were set, so scripts which don't
+        # support them can still be run
+        script_options = {
+            key: options[key]
+            for key in ["resume", "chunk_size", "engine", "force"]
+            if options[key]
+        }
+        parameters = inspect.signature(script.run).parameters
+        unsupported = [key for key in script_options if key not in parameters]
+        accepts_kwargs = any(
+            parameter.kind == inspect.Parameter.VAR_KEYWORD
+            for parameter in parameters.values()
+        )
+
+        if unsupported and not accepts_kwargs:
+            raise CommandError(
+                f"Script {options['ontology_script']} doesn't support option(s): "
+                + ", ".join(f"--{key.replace('_', '-')}" for key in unsupported)
+            )
+
+        script.run(**script_options)
 
     def add_arguments(self, parser):
         parser.add_argument("ontology_script")
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue an incomplete import after its last checkpoint.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Import an Excel file even if it is unchanged since its last "
+            "successful import.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            dest="chunk_size",
+            type=positive_int,
+            help="Number of items to commit to the database per transaction.",
+        )
+        parser.add_argument(
+            "--engine",
+            choices=["serial", "pipeline"],
+            help="Import items one by one (serial, default) or in parallel "
+            "parse, resolve and write stages (pipeline).",
+        )
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.15 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("apis_ontology", "0087_data_migration_fix_textchoices_value"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportRunState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="Identifier of the import run, e.g. collection or file name",
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "last_key",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Key of the last committed item, e.g. Zotero key or Excel row",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "processed",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of items committed so far"
+                    ),
+                ),
+                (
+                    "completed",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether all items of the import run were committed",
+                    ),
+                ),
+                (
+                    "updated",
+                    models.DateTimeField(
+                        auto_now=True, help_text="Date and time of the last checkpoint"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "importstatus",
+                "verbose_name_plural": "importstatus",
+            },
+        ),
+    ]
@@ -0,0 +1,117 @@
+# Generated by Django 4.2.15 on 2026-10-19 14:02
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("apis_ontology", "0088_importrunstate"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="work",
+            index=models.Index(
+                models.Case(
+                    models.When(subtitle="", then=models.F("title")),
+                    models.When(
+                        models.Q(
+                            ("title__endswith", "."),
+                            ("title__endswith", "?"),
+                            ("title__endswith", "!"),
+                            ("title__endswith", "…"),
+                            _connector="OR",
+                        ),
+                        then=django.db.models.functions.text.Concat(
+                            "title", models.Value(" "), "subtitle"
+                        ),
+                    ),
+                    default=django.db.models.functions.text.Concat(
+                        "title", models.Value(". "), "subtitle"
+                    ),
+                    output_field=models.CharField(),
+                ),
+                name="work_full_title_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="expression",
+            index=models.Index(
+                models.Case(
+                    models.When(subtitle="", then=models.F("title")),
+                    models.When(
+                        models.Q(
+                            ("title__endswith", "."),
+                            ("title__endswith", "?"),
+                            ("title__endswith", "!"),
+                            ("title__endswith", "…"),
+                            _connector="OR",
+                        ),
+                        then=django.db.models.functions.text.Concat(
+                            "title", models.Value(" "), "subtitle"
+                        ),
+                    ),
+                    default=django.db.models.functions.text.Concat(
+                        "title", models.Value(". "), "subtitle"
+                    ),
+                    output_field=models.CharField(),
+                ),
+                name="expression_full_title_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="person",
+            index=models.Index(
+                models.Case(
+                    models.When(
+                        models.Q(("fallback_name", ""), _negated=True),
+                        then=models.F("fallback_name"),
+                    ),
+                    models.When(
+                        models.Q(
+                            models.Q(("forename", ""), _negated=True),
+                            models.Q(("surname", ""), _negated=True),
+                        ),
+                        then=django.db.models.functions.text.Concat(
+                            "forename", models.Value(" "), "surname"
+                        ),
+                    ),
+                    models.When(
+                        models.Q(("surname", ""), _negated=True),
+                        then=models.F("surname"),
+                    ),
+                    default=models.F("forename"),
+                    output_field=models.CharField(),
+                ),
+                name="person_full_name_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=models.Index(
+                models.Case(
+                    models.When(
+                        models.Q(("fallback_name", ""), _negated=True),
+                        then=models.F("fallback_name"),
+                    ),
+                    models.When(
+                        models.Q(
+                            models.Q(("forename", ""), _negated=True),
+                            models.Q(("surname", ""), _negated=True),
+                        ),
+                        then=django.db.models.functions.text.Concat(
+                            "forename", models.Value(" "), "surname"
+                        ),
+                    ),
+                    models.When(
+                        models.Q(("surname", ""), _negated=True),
+                        then=models.F("surname"),
+                    ),
+                    default=models.F("forename"),
+                    output_field=models.CharField(),
+                ),
+                name="character_full_name_idx",
+            ),
+        ),
+    ]
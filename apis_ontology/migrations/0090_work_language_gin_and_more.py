@@ -0,0 +1,97 @@
+# Generated by Django 4.2.15 on 2026-10-19 15:20
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("apis_ontology", "0089_work_full_title_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["language"], name="work_language_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["temporal_order"], name="work_temporal_order_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["temporal_duration"], name="work_temporal_duration_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["temporal_frequency"], name="work_temporal_frequency_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["figure_speech"], name="work_figure_speech_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["representation_of_thought"], name="work_repr_of_thought_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["focalization"], name="work_focalization_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["narrative_situation"], name="work_narrative_situation_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["narrative_chronology"], name="work_narrative_chronology_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["narrative_level"], name="work_narrative_level_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="work",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["narrative_voice"], name="work_narrative_voice_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="expression",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["language"], name="expression_language_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="expression",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["edition_type"], name="expression_edition_type_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["fictionality"], name="character_fictionality_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 4.2.15 on 2026-10-19 16:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+import apis_ontology.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("apis_ontology", "0090_work_language_gin_and_more"),
+    ]
+
+    operations = [
+        # unaccent() is only STABLE (its dictionary could change), which
+        # rules it out for indexes, so wrap it in an IMMUTABLE function
+        migrations.RunSQL(
+            sql="""
+            CREATE OR REPLACE FUNCTION immutable_unaccent(text)
+            RETURNS text
+            AS $$ SELECT unaccent('unaccent'::regdictionary, $1) $$
+            LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;
+            """,
+            reverse_sql="DROP FUNCTION IF EXISTS immutable_unaccent(text);",
+        ),
+        migrations.AddIndex(
+            model_name="person",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    apis_ontology.models.ImmutableUnaccent(
+                        django.db.models.functions.text.Lower(
+                            models.Case(
+                                models.When(
+                                    models.Q(("fallback_name", ""), _negated=True),
+                                    then=models.F("fallback_name"),
+                                ),
+                                models.When(
+                                    models.Q(
+                                        models.Q(("forename", ""), _negated=True),
+                                        models.Q(("surname", ""), _negated=True),
+                                    ),
+                                    then=django.db.models.functions.text.Concat(
+                                        "forename", models.Value(" "), "surname"
+                                    ),
+                                ),
+                                models.When(
+                                    models.Q(("surname", ""), _negated=True),
+                                    then=models.F("surname"),
+                                ),
+                                default=models.F("forename"),
+                                output_field=models.CharField(),
+                            )
+                        )
+                    ),
+                    name="text_pattern_ops",
+                ),
+                name="person_full_name_prefix_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="person",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    apis_ontology.models.ImmutableUnaccent(
+                        django.db.models.functions.text.Lower("surname")
+                    ),
+                    name="text_pattern_ops",
+                ),
+                name="person_surname_prefix_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organisation",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    apis_ontology.models.ImmutableUnaccent(
+                        django.db.models.functions.text.Lower("name")
+                    ),
+                    name="text_pattern_ops",
+                ),
+                name="organisation_name_prefix_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="place",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    apis_ontology.models.ImmutableUnaccent(
+                        django.db.models.functions.text.Lower("name")
+                    ),
+                    name="text_pattern_ops",
+                ),
+                name="place_name_prefix_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.15 on 2026-10-19 17:20
+
+from django.db import migrations, models
+
+
+# Uri is a model of apis_metainfo, so the index is added with the schema
+# editor rather than with AddIndex, which only applies to this app's models
+EXTERNAL_URI_INDEX = models.Index(
+    fields=["root_object", "uri"],
+    condition=~models.Q(uri__startswith="https://frischmuth-dev.acdh-dev.oeaw.ac.at"),
+    name="uri_external_root_object_idx",
+)
+
+
+def add_external_uri_index(apps, schema_editor):
+    Uri = apps.get_model("apis_metainfo", "Uri")
+    schema_editor.add_index(Uri, EXTERNAL_URI_INDEX)
+
+
+def remove_external_uri_index(apps, schema_editor):
+    Uri = apps.get_model("apis_metainfo", "Uri")
+    schema_editor.remove_index(Uri, EXTERNAL_URI_INDEX)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("apis_metainfo", "0008_alter_rootobject_self_contenttype"),
+        ("apis_ontology", "0091_immutable_unaccent_prefix_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_external_uri_index, remove_external_uri_index),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.15 on 2026-10-19 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("apis_ontology", "0092_uri_external_root_object_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importrunstate",
+            name="state",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="State of the import at the last checkpoint, e.g. object IDs",
+            ),
+        ),
+    ]
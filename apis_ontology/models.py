@@ -1,21 +1,130 @@
 import logging
-import re
 
 from apis_core.apis_entities.models import AbstractEntity
+from apis_core.apis_metainfo.models import Uri
 from apis_core.apis_relations.models import Property
 from apis_core.history.models import VersionMixin
-from apis_core.utils.helpers import create_object_from_uri
-from dateparser import parse
-from django.conf import settings
+from apis_core.utils.helpers import get_importer_for_model
+from apis_core.utils.normalize import clean_uri
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import validate_slug
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, F, Func, Q, Value, When
+from django.db.models.functions import Concat, Lower
 from django.utils.translation import gettext_lazy as _
 
+from apis_ontology.dates import UNSUPPORTED_DATE_SUFFIX, parse_publication_date
+
 
 logger = logging.getLogger(__name__)
 
+# characters after which no full stop is added between title and subtitle
+END_PUNCTUATION = (".", "?", "!", "…")
+
+# URIs of the project's own objects, as opposed to external (e.g. GND) URIs
+INTERNAL_URI_PREFIX = "https://frischmuth-dev.acdh-dev.oeaw.ac.at"
+
+
+class ImmutableUnaccent(Func):
+    """
+    Remove diacritics using the immutable wrapper of Postgres' unaccent
+    function (see migration 0091), which can be used in indexes.
+    """
+
+    function = "immutable_unaccent"
+    output_field = models.TextField()
+
+
+def prefix_search_index(expression, name):
+    """
+    Index for prefix searches on the lowercased and unaccented value
+    of an expression, e.g. "search_name__startswith".
+
+    :param expression: field name or expression to index
+    :param name: name of the index
+    :return: an Index object
+    """
+    return models.Index(
+        OpClass(ImmutableUnaccent(Lower(expression)), name="text_pattern_ops"),
+        name=name,
+    )
+
+
+def get_or_create_objects_from_uris(model, uris):
+    """
+    Batch version of APIS' create_object_from_uri(): get the objects
+    the given URIs refer to, creating objects from the URIs' data and
+    Uris linking to them where missing.
+
+    Existing Uris and their objects are looked up with one query each.
+    New objects have to be created one by one by the model's importer
+    (entities use multi-table inheritance, which rules out
+    bulk_create()), but their Uris are created with a single query and
+    existing Uris without object are linked with a single query.
+
+    :param model: entity model class with an importer
+    :param uris: list of URIs, values not starting with "http" are skipped
+    :return: dictionary of objects by URI as passed in
+    """
+    cleaned_uris = {uri: clean_uri(uri) for uri in uris if uri.startswith("http")}
+    if not cleaned_uris:
+        return {}
+
+    existing_uris = {
+        uri.uri: uri for uri in Uri.objects.filter(uri__in=cleaned_uris.values())
+    }
+    existing_objects = model.objects.in_bulk(
+        [uri.root_object_id for uri in existing_uris.values() if uri.root_object_id]
+    )
+
+    objects = {}
+    new_uris = []
+    unlinked_uris = []
+    importer_class = None
+
+    with transaction.atomic():
+        for cleaned_uri in dict.fromkeys(cleaned_uris.values()):
+            uri = existing_uris.get(cleaned_uri)
+
+            if uri and uri.root_object_id:
+                objects[cleaned_uri] = (
+                    existing_objects.get(uri.root_object_id) or uri.root_object
+                )
+                continue
+
+            importer_class = importer_class or get_importer_for_model(model)
+            importer = importer_class(cleaned_uri, model)
+            instance = importer.create_instance()
+            objects[cleaned_uri] = instance
+
+            if uri:
+                uri.root_object = instance
+                unlinked_uris.append(uri)
+            else:
+                new_uris.append(Uri(uri=importer.get_uri, root_object=instance))
+
+        Uri.objects.bulk_create(new_uris)
+        Uri.objects.bulk_update(unlinked_uris, ["root_object"])
+
+    return {uri: objects[cleaned_uri] for uri, cleaned_uri in cleaned_uris.items()}
+
+
+def get_external_uris(*args, **kwargs):
+    """
+    Filter Uris, leaving out internal URIs of the project's own objects.
+
+    The condition matches the one of the partial index on Uri's
+    root_object and uri (see migration 0092), so e.g. the URIs of
+    an object can be read from the index alone.
+
+    :param args: Q objects to filter by
+    :param kwargs: field lookups to filter by
+    :return: Uri queryset
+    """
+    return Uri.objects.filter(*args, ~Q(uri__startswith=INTERNAL_URI_PREFIX), **kwargs)
+
 
 class StatusMixin(models.Model):
     class ProgressStates(models.TextChoices):
@@ -94,16 +203,37 @@ class TitlesMixin(models.Model):
         """
         full_title = title = self.title
         subtitle = self.subtitle
-        end_punctuation = re.compile(r"[.?!…]", re.U)
 
         if subtitle:
-            if re.match(end_punctuation, title[-1]):
+            if title.endswith(END_PUNCTUATION):
                 full_title += f" {subtitle}"
             else:
                 full_title += f". {subtitle}"
 
         return full_title
 
+    @staticmethod
+    def full_title_expression():
+        """
+        Database expression equivalent to full_title(), for annotating
+        querysets and sorting by full title in SQL.
+
+        :return: a Case expression
+        """
+        title_has_end_punctuation = Q()
+        for character in END_PUNCTUATION:
+            title_has_end_punctuation |= Q(title__endswith=character)
+
+        return Case(
+            When(subtitle="", then=F("title")),
+            When(
+                title_has_end_punctuation,
+                then=Concat("title", Value(" "), "subtitle"),
+            ),
+            default=Concat("title", Value(". "), "subtitle"),
+            output_field=models.CharField(),
+        )
+
 
 class GenericNameMixin(models.Model):
     """
@@ -197,6 +327,25 @@ class PersonNameMixin(AlternativeNameMixin, models.Model):
 
         return full_name
 
+    @staticmethod
+    def full_name_expression():
+        """
+        Database expression equivalent to full_name(), for annotating
+        querysets and sorting by full name in SQL.
+
+        :return: a Case expression
+        """
+        return Case(
+            When(~Q(fallback_name=""), then=F("fallback_name")),
+            When(
+                ~Q(forename="") & ~Q(surname=""),
+                then=Concat("forename", Value(" "), "surname"),
+            ),
+            When(~Q(surname=""), then=F("surname")),
+            default=F("forename"),
+            output_field=models.CharField(),
+        )
+
 
 class DescriptionMixin(models.Model):
     """
@@ -322,6 +471,54 @@ class DataSource(VersionMixin, models.Model):
         verbose_name_plural = _("datenquellen")
 
 
+class ImportRunState(models.Model):
+    """
+    Holds the checkpoint of a (resumable) data import run.
+    Used to continue imports which failed halfway through.
+    """
+
+    name = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text=_("Identifier of the import run, e.g. collection or file name"),
+    )
+
+    last_key = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text=_("Key of the last committed item, e.g. Zotero key or Excel row"),
+    )
+
+    processed = models.PositiveIntegerField(
+        default=0,
+        help_text=_("Number of items committed so far"),
+    )
+
+    completed = models.BooleanField(
+        default=False,
+        help_text=_("Whether all items of the import run were committed"),
+    )
+
+    state = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_("State of the import at the last checkpoint, e.g. object IDs"),
+    )
+
+    updated = models.DateTimeField(
+        auto_now=True,
+        help_text=_("Date and time of the last checkpoint"),
+    )
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        verbose_name = _("importstatus")
+        verbose_name_plural = _("importstatus")
+
+
 class Work(
     VersionMixin, TitlesMixin, LanguageMixin, NotesMixin, StatusMixin, AbstractEntity
 ):
@@ -566,6 +763,28 @@ class Work(
     class Meta:
         verbose_name = _("werk")
         verbose_name_plural = _("werke")
+        indexes = [
+            models.Index(
+                TitlesMixin.full_title_expression(), name="work_full_title_idx"
+            ),
+            GinIndex(fields=["language"], name="work_language_gin"),
+            GinIndex(fields=["temporal_order"], name="work_temporal_order_gin"),
+            GinIndex(fields=["temporal_duration"], name="work_temporal_duration_gin"),
+            GinIndex(fields=["temporal_frequency"], name="work_temporal_frequency_gin"),
+            GinIndex(fields=["figure_speech"], name="work_figure_speech_gin"),
+            GinIndex(
+                fields=["representation_of_thought"], name="work_repr_of_thought_gin"
+            ),
+            GinIndex(fields=["focalization"], name="work_focalization_gin"),
+            GinIndex(
+                fields=["narrative_situation"], name="work_narrative_situation_gin"
+            ),
+            GinIndex(
+                fields=["narrative_chronology"], name="work_narrative_chronology_gin"
+            ),
+            GinIndex(fields=["narrative_level"], name="work_narrative_level_gin"),
+            GinIndex(fields=["narrative_voice"], name="work_narrative_voice_gin"),
+        ]
 
 
 class WorkType(
@@ -714,28 +933,87 @@ class Expression(
     class Meta:
         verbose_name = _("werksexpression")
         verbose_name_plural = _("werksexpressionen")
+        indexes = [
+            models.Index(
+                TitlesMixin.full_title_expression(), name="expression_full_title_idx"
+            ),
+            GinIndex(fields=["language"], name="expression_language_gin"),
+            GinIndex(fields=["edition_type"], name="expression_edition_type_gin"),
+        ]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.cached_pub_date_manual = self.publication_date_manual_input
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # keep loaded publication date to detect changes on save,
+        # unless the field was deferred
+        if "publication_date_manual_input" in instance.__dict__:
+            instance.cached_pub_date_manual = instance.publication_date_manual_input
+        return instance
+
+    def get_previous_pub_date_manual(self):
+        """
+        :return: the free-form publication date as last loaded or saved
+        """
+        if hasattr(self, "cached_pub_date_manual"):
+            return self.cached_pub_date_manual
+        if self._state.adding:
+            # new objects start out with the field's default
+            return ""
+        if "publication_date_manual_input" not in self.__dict__:
+            # still deferred, i.e. neither loaded nor assigned
+            return None
+        # loaded with the field deferred and assigned since
+        return (
+            type(self)
+            ._base_manager.filter(pk=self.pk)
+            .values_list("publication_date_manual_input", flat=True)
+            .first()
+        )
+
+    def set_publication_date(self, date_string: str, parsed_date=None):
+        """
+        Set the free-form publication date, optionally along with the
+        result of parsing it ahead of time, e.g. in an import's parse stage.
+
+        :param date_string: free-form publication date
+        :param parsed_date: date_string as parsed by parse_publication_date(),
+                            used by save() instead of parsing it again
+        """
+        self.publication_date_manual_input = date_string
+        self.parsed_pub_date_manual = (
+            (date_string, parsed_date) if parsed_date else None
+        )
+
+    def parse_pub_date_manual(self):
+        """
+        :return: the parsed free-form publication date; the date passed
+                 to set_publication_date() if it is still current
+        """
+        date_string = self.publication_date_manual_input
+        parsed = getattr(self, "parsed_pub_date_manual", None)
+
+        if parsed and parsed[0] == date_string:
+            return parsed[1]
+
+        return parse_publication_date(date_string)
 
     def save(self, *args, **kwargs):
-        if self.publication_date_manual_input != self.cached_pub_date_manual:
+        previous_pub_date_manual = self.get_previous_pub_date_manual()
+
+        if (
+            "publication_date_manual_input" in self.__dict__
+            and self.publication_date_manual_input != previous_pub_date_manual
+        ):
             # free-form publication date was changed
             if not self.publication_date_manual_input:
                 # publication date field was emptied
                 self.publication_date_iso_formatted = self.publication_date_manual_input
             else:
-                parsed_date = parse(
-                    self.publication_date_manual_input,
-                    languages=[settings.LANGUAGE_CODE],
-                    date_formats=settings.DATE_INPUT_FORMATS,
-                    settings=settings.DATEPARSER_SETTINGS,
-                )
+                parsed_date = self.parse_pub_date_manual()
                 if not parsed_date:
                     # "log" invalid publication date updates in field string
                     self.publication_date_manual_input = (
-                        f"{self.publication_date_manual_input} (unsupported date)"
+                        f"{self.publication_date_manual_input}{UNSUPPORTED_DATE_SUFFIX}"
                     )
                 # update ISO date either way:
                 # if the manually input date is a recognisable date but wasn't
@@ -752,6 +1030,8 @@ class Expression(
                 kwargs["update_fields"] = set(update_fields) | include_fields
 
         super().save(*args, **kwargs)
+        self.cached_pub_date_manual = self.publication_date_manual_input
+        self.parsed_pub_date_manual = None
 
 
 class Archive(
@@ -844,10 +1124,23 @@ class Person(
 
     class Meta:
         verbose_name_plural = _("personen")
+        indexes = [
+            models.Index(
+                PersonNameMixin.full_name_expression(), name="person_full_name_idx"
+            ),
+            prefix_search_index(
+                PersonNameMixin.full_name_expression(), "person_full_name_prefix_idx"
+            ),
+            prefix_search_index("surname", "person_surname_prefix_idx"),
+        ]
 
     @classmethod
     def get_or_create_uri(cls, uri):
-        return create_object_from_uri(uri, cls) or cls.objects.get(pk=uri)
+        return cls.get_or_create_uris([uri]).get(uri) or cls.objects.get(pk=uri)
+
+    @classmethod
+    def get_or_create_uris(cls, uris):
+        return get_or_create_objects_from_uris(cls, uris)
 
 
 class Organisation(
@@ -884,6 +1177,9 @@ class Organisation(
     class Meta:
         verbose_name = _("körperschaft")
         verbose_name_plural = _("körperschaften")
+        indexes = [
+            prefix_search_index("name", "organisation_name_prefix_idx"),
+        ]
 
 
 class Character(
@@ -939,6 +1235,12 @@ class Character(
     class Meta:
         verbose_name = _("figur")
         verbose_name_plural = _("figuren")
+        indexes = [
+            models.Index(
+                PersonNameMixin.full_name_expression(), name="character_full_name_idx"
+            ),
+            GinIndex(fields=["fictionality"], name="character_fictionality_gin"),
+        ]
 
 
 class MetaCharacter(
@@ -1007,10 +1309,17 @@ class Place(
     class Meta:
         verbose_name = _("ort")
         verbose_name_plural = _("orte")
+        indexes = [
+            prefix_search_index("name", "place_name_prefix_idx"),
+        ]
 
     @classmethod
     def get_or_create_uri(cls, uri):
-        return create_object_from_uri(uri, cls) or cls.objects.get(pk=uri)
+        return cls.get_or_create_uris([uri]).get(uri) or cls.objects.get(pk=uri)
+
+    @classmethod
+    def get_or_create_uris(cls, uris):
+        return get_or_create_objects_from_uris(cls, uris)
 
 
 class ResearchPerspective(
@@ -1091,26 +1400,91 @@ class Interpretatem(
         verbose_name_plural = _("interpretateme")
 
 
+class PropertySync:
+    """
+    Declarative sync of Properties and their subject and object classes.
+
+    Properties are defined with add() and created or updated with
+    apply(), which loads all Properties and ContentTypes once and only
+    writes those subject and object class links which differ from
+    the definitions.
+    """
+
+    def __init__(self):
+        self.definitions = []
+
+    def add(self, name_forward: str, name_reverse: str, subjects: list, objects: list):
+        self.definitions.append((name_forward, name_reverse, subjects, objects))
+
+    @transaction.atomic
+    def apply(self):
+        """
+        :return: list of tuples of Property object and boolean
+                 whether it was created, in the order of definition
+        """
+        results = []
+        content_types = ContentType.objects.get_for_models(
+            *{
+                entity
+                for definition in self.definitions
+                for entity in definition[2] + definition[3]
+            }
+        )
+        properties = {
+            (prop.name_forward, prop.name_reverse): prop
+            for prop in Property.objects.prefetch_related("subj_class", "obj_class")
+        }
+        links = {
+            "subj_class": (Property.subj_class.through, [], []),
+            "obj_class": (Property.obj_class.through, [], []),
+        }
+
+        for name_forward, name_reverse, subjects, objects in self.definitions:
+            prop = properties.get((name_forward, name_reverse), None)
+            created = prop is None
+            if created:
+                prop = Property.objects.create(
+                    name_forward=name_forward, name_reverse=name_reverse
+                )
+                properties[(name_forward, name_reverse)] = prop
+
+            for field, entities in (("subj_class", subjects), ("obj_class", objects)):
+                through, to_create, to_delete = links[field]
+                wanted = {content_types[entity].id for entity in entities}
+                current = (
+                    set() if created else {ct.id for ct in getattr(prop, field).all()}
+                )
+                to_create.extend(
+                    through(property_id=prop.id, contenttype_id=ct_id)
+                    for ct_id in wanted - current
+                )
+                to_delete.extend((prop.id, ct_id) for ct_id in current - wanted)
+
+            results.append((prop, created))
+
+        for through, to_create, to_delete in links.values():
+            if to_delete:
+                condition = models.Q()
+                for property_id, contenttype_id in to_delete:
+                    condition |= models.Q(
+                        property_id=property_id, contenttype_id=contenttype_id
+                    )
+                through.objects.filter(condition).delete()
+            through.objects.bulk_create(to_create)
+
+        return results
+
+
 def create_properties(
     name_forward: str, name_reverse: str, subjects: list, objects: list
 ):
     """
     Helper function for creating new Properties.
     """
-    prop, created = Property.objects.get_or_create(
-        name_forward=name_forward,
-        name_reverse=name_reverse,
-    )
-
-    prop.subj_class.clear()
-    prop.obj_class.clear()
+    sync = PropertySync()
+    sync.add(name_forward, name_reverse, subjects, objects)
 
-    for entity in subjects:
-        prop.subj_class.add(ContentType.objects.get(model=entity._meta.model_name))
-    for entity in objects:
-        prop.obj_class.add(ContentType.objects.get(model=entity._meta.model_name))
-
-    return prop, created
+    return sync.apply()[0]
 
 
 def update_properties():
@@ -1171,9 +1545,11 @@ def construct_properties():
     """
     update_properties()
 
+    sync = PropertySync()
+
     # WORK-focussed relations
     # discusses / Aussage – something is talked about in a work
-    create_properties(
+    sync.add(
         name_forward="discusses",
         name_reverse="is discussed in",
         subjects=[Work],
@@ -1181,7 +1557,7 @@ def construct_properties():
     )
 
     # mentions / Erwähnung – something is only mentioned by name
-    create_properties(
+    sync.add(
         name_forward="mentions",
         name_reverse="is mentioned in",
         subjects=[Work],
@@ -1189,7 +1565,7 @@ def construct_properties():
     )
 
     # takes_place_in / Schauplatz – a place is an actual location in the work
-    create_properties(
+    sync.add(
         name_forward="takes place in",
         name_reverse="is locale in",
         subjects=[Work],
@@ -1197,7 +1573,7 @@ def construct_properties():
     )
 
     # references / Binnenverweis
-    create_properties(
+    sync.add(
         name_forward="references",
         name_reverse="is referenced in",
         subjects=[Work],
@@ -1206,7 +1582,7 @@ def construct_properties():
 
     # TYPE-focussed relations
     # has_type
-    create_properties(
+    sync.add(
         name_forward="has type",
         name_reverse="is type of",
         subjects=[Work],
@@ -1214,7 +1590,7 @@ def construct_properties():
     )
 
     # has_broader_term
-    create_properties(
+    sync.add(
         name_forward="has broader term",
         name_reverse="has narrower term",
         subjects=[WorkType],
@@ -1223,7 +1599,7 @@ def construct_properties():
 
     # EXPRESSION-focussed relations
     # is_realised_in
-    create_properties(
+    sync.add(
         name_forward="is realised in",
         name_reverse="realises",
         subjects=[Work, Expression],
@@ -1231,7 +1607,7 @@ def construct_properties():
     )
 
     # expression_is_part_of_expression
-    create_properties(
+    sync.add(
         name_forward="expression is part of expression",
         name_reverse="expression has part expression",
         subjects=[Expression],
@@ -1239,7 +1615,7 @@ def construct_properties():
     )
 
     # published_in
-    create_properties(
+    sync.add(
         name_forward="is published in",
         name_reverse="is place of publication of",
         subjects=[Expression],
@@ -1248,7 +1624,7 @@ def construct_properties():
 
     # CHARACTER-focussed relations
     # features
-    create_properties(
+    sync.add(
         name_forward="features",
         name_reverse="is featured in",
         subjects=[Work],
@@ -1256,7 +1632,7 @@ def construct_properties():
     )
 
     # groups
-    create_properties(
+    sync.add(
         name_forward="groups",
         name_reverse="is grouped in",
         subjects=[MetaCharacter],
@@ -1264,7 +1640,7 @@ def construct_properties():
     )
 
     # place_inspires
-    create_properties(
+    sync.add(
         name_forward="inspires",
         name_reverse="is inspired by",
         subjects=[Place],
@@ -1273,7 +1649,7 @@ def construct_properties():
 
     # ARCHIVE-focussed relations
     # archive_holds
-    create_properties(
+    sync.add(
         name_forward="holds",
         name_reverse="is held in",
         subjects=[Archive],
@@ -1281,7 +1657,7 @@ def construct_properties():
     )
 
     # relates_to
-    create_properties(
+    sync.add(
         name_forward="relates to",
         name_reverse="is connected with",
         subjects=[PhysicalObject],
@@ -1290,7 +1666,7 @@ def construct_properties():
 
     # INTERPRETATEM-focussed relations
     # has_source
-    create_properties(
+    sync.add(
         name_forward="has source",
         name_reverse="is source for",
         subjects=[Interpretatem],
@@ -1298,7 +1674,7 @@ def construct_properties():
     )
 
     # interprets
-    create_properties(
+    sync.add(
         name_forward="interprets",
         name_reverse="is interpreted by",
         subjects=[Interpretatem],
@@ -1307,7 +1683,7 @@ def construct_properties():
 
     # CONCEPT-focussed relations
     # is_based_on
-    create_properties(
+    sync.add(
         name_forward="is based on",
         name_reverse="is base for",
         subjects=[Character],
@@ -1315,7 +1691,7 @@ def construct_properties():
     )
 
     # is_about
-    create_properties(
+    sync.add(
         name_forward="is about topic",
         name_reverse="is topic of",
         subjects=[Work, Interpretatem],
@@ -1323,7 +1699,7 @@ def construct_properties():
     )
 
     # applies_research_perspective
-    create_properties(
+    sync.add(
         name_forward="applies research perspective",
         name_reverse="is research perspective of",
         subjects=[Work, Interpretatem],
@@ -1332,7 +1708,7 @@ def construct_properties():
 
     # ORGANISATION-focussed relations
     # has_residence
-    create_properties(
+    sync.add(
         name_forward="has current or former residence",
         name_reverse="is current or former residence of",
         subjects=[Organisation],
@@ -1340,7 +1716,7 @@ def construct_properties():
     )
 
     # is_publisher
-    create_properties(
+    sync.add(
         name_forward="is publisher of",
         name_reverse="has publisher",
         subjects=[Organisation],
@@ -1349,7 +1725,7 @@ def construct_properties():
 
     # ACTOR roles in relation to Work, Expression
     # is_contributor /  Beitragende:r (generisch)
-    create_properties(
+    sync.add(
         name_forward="is contributor to",
         name_reverse="has contributor",
         subjects=[Person, Organisation],
@@ -1357,7 +1733,7 @@ def construct_properties():
     )
 
     # is_author / Autor*in
-    create_properties(
+    sync.add(
         name_forward="is author of",
         name_reverse="has author",
         subjects=[Person, Organisation],
@@ -1365,7 +1741,7 @@ def construct_properties():
     )
 
     # is_photographer / Fotograf:in
-    create_properties(
+    sync.add(
         name_forward="is photographer of/for",
         name_reverse="has photographer",
         subjects=[Organisation],
@@ -1373,7 +1749,7 @@ def construct_properties():
     )
 
     # is_illustrator / Illustrator:in
-    create_properties(
+    sync.add(
         name_forward="is illustrator of/for",
         name_reverse="has illustrator",
         subjects=[Organisation],
@@ -1382,7 +1758,7 @@ def construct_properties():
 
     # Übersetzer:in
     # is_translator
-    create_properties(
+    sync.add(
         name_forward="is translator of",
         name_reverse="has translator",
         subjects=[Person, Organisation],
@@ -1390,7 +1766,7 @@ def construct_properties():
     )
 
     # is_editor / Herausgeber*in
-    create_properties(
+    sync.add(
         name_forward="is editor of",
         name_reverse="has editor",
         subjects=[Person, Organisation],
@@ -1398,7 +1774,7 @@ def construct_properties():
     )
 
     #  is_director / Regisseur*in
-    create_properties(
+    sync.add(
         name_forward="is director of",
         name_reverse="has director",
         subjects=[Person, Organisation],
@@ -1406,7 +1782,7 @@ def construct_properties():
     )
 
     # is_dramaturg / Dramaturg*in
-    create_properties(
+    sync.add(
         name_forward="is dramaturg for",
         name_reverse="has dramaturg",
         subjects=[Person, Organisation],
@@ -1414,7 +1790,7 @@ def construct_properties():
     )
 
     # is_composer / Komponist*in
-    create_properties(
+    sync.add(
         name_forward="is composer of",
         name_reverse="has composer",
         subjects=[Person, Organisation],
@@ -1422,7 +1798,7 @@ def construct_properties():
     )
 
     # is_session_musician / Musiker*in
-    create_properties(
+    sync.add(
         name_forward="is session musician on",
         name_reverse="has session musician",
         subjects=[Person, Organisation],
@@ -1431,7 +1807,7 @@ def construct_properties():
 
     # is_stage_designer / Bühnenbildner*in
     # (Kontext: Theater; vgl. Szenenbildner*in)
-    create_properties(
+    sync.add(
         name_forward="is stage designer for",
         name_reverse="has stage designer",
         subjects=[Person, Organisation],
@@ -1439,7 +1815,7 @@ def construct_properties():
     )
 
     # is_costume_designer / Kostümbildner*in
-    create_properties(
+    sync.add(
         name_forward="is costume designer for",
         name_reverse="has costume designer",
         subjects=[Person, Organisation],
@@ -1447,7 +1823,7 @@ def construct_properties():
     )
 
     # is_makeup_artist / Maskenbildner*in
-    create_properties(
+    sync.add(
         name_forward="is make-up artist on",
         name_reverse="has make-up artist",
         subjects=[Organisation],
@@ -1455,7 +1831,7 @@ def construct_properties():
     )
 
     # is_sound_engineer / Tonmeister*in
-    create_properties(
+    sync.add(
         name_forward="is sound engineer of",
         name_reverse="has sound engineer",
         subjects=[Person, Organisation],
@@ -1463,7 +1839,7 @@ def construct_properties():
     )
 
     # is_film_editor / Cutter*in
-    create_properties(
+    sync.add(
         name_forward="is film editor of",
         name_reverse="has film editor",
         subjects=[Person, Organisation],
@@ -1471,7 +1847,7 @@ def construct_properties():
     )
 
     # is_actor/ Schauspieler*in
-    create_properties(
+    sync.add(
         name_forward="is actor in",
         name_reverse="has actor",
         subjects=[Person, Organisation],
@@ -1479,7 +1855,7 @@ def construct_properties():
     )
 
     # is_narrator / Sprecher*in
-    create_properties(
+    sync.add(
         name_forward="is narrator of",
         name_reverse="has narrator",
         subjects=[Person, Organisation],
@@ -1487,7 +1863,7 @@ def construct_properties():
     )
 
     # is_cinematographer / Kameramensch
-    create_properties(
+    sync.add(
         name_forward="is cinematographer of",
         name_reverse="has cinematographer",
         subjects=[Person, Organisation],
@@ -1495,7 +1871,7 @@ def construct_properties():
     )
 
     # is_head_of_production / Produktionsleiter*in
-    create_properties(
+    sync.add(
         name_forward="is head of production of",
         name_reverse="has head of production",
         subjects=[Person, Organisation],
@@ -1504,7 +1880,7 @@ def construct_properties():
 
     # is_production_designer / Szenenbilder*in
     # (Kontext: Film; vgl. Bühnenbildner*in)
-    create_properties(
+    sync.add(
         name_forward="is production designer of",
         name_reverse="has production designer",
         subjects=[Person, Organisation],
@@ -1513,9 +1889,11 @@ def construct_properties():
 
     # P198 holds or supports
     # see https://remogrillo.github.io/cidoc-crm_periodic_table/?code=P198
-    create_properties(
+    sync.add(
         name_forward="holds or supports",
         name_reverse="is held or supported by",
         subjects=[PhysicalObject],
         objects=[PhysicalObject],
     )
+
+    sync.apply()
@@ -1,17 +1,235 @@
+import hashlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 
+import requests
 from apis_core.utils.autocomplete import (
     ExternalAutocomplete,
     LobidAutocompleteAdapter,
     TypeSenseAutocompleteAdapter,
 )
+from django.core.cache import cache
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
+
+from apis_ontology.models import (
+    ImmutableUnaccent,
+    Organisation,
+    Person,
+    PersonNameMixin,
+    Place,
+    TitlesMixin,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# seconds to wait for an external autocomplete service to respond
+EXTERNAL_AUTOCOMPLETE_TIMEOUT = float(os.getenv("EXTERNAL_AUTOCOMPLETE_TIMEOUT", 2))
+# seconds to keep results of external autocomplete services cached
+EXTERNAL_AUTOCOMPLETE_CACHE_TTL = int(
+    os.getenv("EXTERNAL_AUTOCOMPLETE_CACHE_TTL", 60 * 60)
+)
+LOBID_ENDPOINT = os.getenv("LOBID_ENDPOINT", "https://lobid.org/gnd/search")
+
+
+def autocomplete_by_prefix(model, q, expressions):
+    """
+    Find objects for autocompletion by prefix of their lowercased and
+    unaccented names, using the indexes created with prefix_search_index().
+
+    :param model: entity model class
+    :param q: user-provided query string
+    :param expressions: field names or expressions of the names to search,
+                        results are ordered by the first one
+    :return: a queryset
+    """
+    # normalised by the same function as the indexed names, which e.g.
+    # also maps "ß" to "ss"; as it is immutable, Postgres evaluates it
+    # while planning, so the prefix is a constant which can use the index
+    prefix = ImmutableUnaccent(Lower(Value(q.strip())))
+    search_names = {
+        f"search_name_{i}": ImmutableUnaccent(Lower(expression))
+        for i, expression in enumerate(expressions)
+    }
+
+    condition = Q()
+    for name in search_names:
+        condition |= Q(**{f"{name}__startswith": prefix})
+
+    return (
+        model.objects.annotate(**search_names)
+        .filter(condition)
+        .order_by("search_name_0")
+    )
+
+
+def autocomplete_persons(model, q):
+    return autocomplete_by_prefix(
+        model, q, [PersonNameMixin.full_name_expression(), "surname"]
+    )
+
+
+def autocomplete_by_name(model, q):
+    return autocomplete_by_prefix(model, q, ["name"])
+
+
+# querysets of the APIS autocomplete views, looked up by model name
+PersonAutocompleteQueryset = autocomplete_persons
+PlaceAutocompleteQueryset = autocomplete_by_name
+OrganisationAutocompleteQueryset = autocomplete_by_name
+
+
+def normalize_query(q):
+    """
+    Normalise an autocomplete query string for use as cache key,
+    i.e. ignore case and surrounding or repeated whitespace.
+    """
+    return " ".join(q.split()).casefold()
+
+
+class TimeoutSession(requests.Session):
+    """
+    Session which applies a default timeout to all requests.
+    """
+
+    def __init__(self, timeout):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(*args, **kwargs)
+
+
+class LobidAdapter(LobidAutocompleteAdapter):
+    """
+    Lobid adapter with a configurable endpoint which doesn't modify its
+    parameters per query, so it can be used from concurrent threads.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.endpoint = kwargs.get("endpoint", LOBID_ENDPOINT)
+
+    def get_results(self, q, session=requests.Session()):
+        res = session.get(self.endpoint, params={**self.params, "q": q})
+        if res:
+            return list(filter(bool, map(self.extract, res.json())))
+        return []
+
+
+class ConcurrentExternalAutocomplete(ExternalAutocomplete):
+    """
+    External autocomplete which queries its adapters concurrently and
+    caches their results per normalised query.
+
+    Results of adapters which don't respond within the timeout or fail
+    are left out, i.e. results may be partial, and aren't cached.
 
-class PlaceExternalAutocomplete(ExternalAutocomplete):
+    If a model and a function for finding local objects are set,
+    adapters are only queried when there are fewer local matches than
+    min_local_results. (Local matches are shown before external results
+    by the APIS autocomplete view.)
+    """
+
+    timeout = EXTERNAL_AUTOCOMPLETE_TIMEOUT
+    cache_ttl = EXTERNAL_AUTOCOMPLETE_CACHE_TTL
+    model = None
+    local_queryset = None
+    min_local_results = 5
+
+    def has_enough_local_results(self, q):
+        if self.model is None or self.local_queryset is None:
+            return False
+
+        local_matches = self.local_queryset(self.model, q).values_list("pk", flat=True)[
+            : self.min_local_results
+        ]
+
+        return len(local_matches) >= self.min_local_results
+
+    def get_cache_key(self, adapter_index, q):
+        query_hash = hashlib.md5(q.encode("utf-8")).hexdigest()
+        return (
+            f"external-autocomplete:{type(self).__name__}:{adapter_index}:{query_hash}"
+        )
+
+    def get_adapter_results(self, adapter, q):
+        with TimeoutSession(self.timeout) as session:
+            return adapter.get_results(q, session)
+
+    def fetch_results(self, adapters, q):
+        """
+        Query adapters concurrently, waiting at most for the timeout.
+
+        :param adapters: dictionary of adapters by cache key
+        :param q: normalised query
+        :return: dictionary of results of adapters which responded in
+                 time, by cache key
+        """
+        executor = ThreadPoolExecutor(max_workers=len(adapters))
+        futures = {
+            executor.submit(self.get_adapter_results, adapter, q): key
+            for key, adapter in adapters.items()
+        }
+        done, not_done = wait(futures, timeout=self.timeout)
+        # don't wait for adapters which are still running
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        for future in not_done:
+            logger.warning(
+                "%s timed out after %ss for query '%s'",
+                type(adapters[futures[future]]).__name__,
+                self.timeout,
+                q,
+            )
+
+        results = {}
+        for future in done:
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.warning(
+                    "%s failed for query '%s': %s", type(adapters[key]).__name__, q, e
+                )
+
+        return results
+
+    def get_results(self, q):
+        if self.has_enough_local_results(q):
+            return []
+
+        q = normalize_query(q)
+        if not q:
+            return []
+
+        adapters = {
+            self.get_cache_key(i, q): adapter for i, adapter in enumerate(self.adapters)
+        }
+        adapter_results = cache.get_many(adapters.keys())
+
+        missing = {
+            key: adapter
+            for key, adapter in adapters.items()
+            if key not in adapter_results
+        }
+        if missing:
+            fetched = self.fetch_results(missing, q)
+            cache.set_many(fetched, self.cache_ttl)
+            adapter_results.update(fetched)
+
+        results = []
+        for key in adapters:
+            results.extend(adapter_results.get(key, []))
+        return results
+
+
+class PlaceExternalAutocomplete(ConcurrentExternalAutocomplete):
+    model = Place
+    local_queryset = staticmethod(autocomplete_by_name)
     adapters = [
         TypeSenseAutocompleteAdapter(
             collections=[
@@ -22,7 +240,7 @@ class PlaceExternalAutocomplete(ExternalAutocomplete):
             token=os.getenv("TYPESENSE_TOKEN", None),
             server=os.getenv("TYPESENSE_SERVER", None),
         ),
-        LobidAutocompleteAdapter(
+        LobidAdapter(
             params={
                 "filter": "type:PlaceOrGeographicName",
                 "format": "json:preferredName",
@@ -31,7 +249,9 @@ class PlaceExternalAutocomplete(ExternalAutocomplete):
     ]
 
 
-class PersonExternalAutocomplete(ExternalAutocomplete):
+class PersonExternalAutocomplete(ConcurrentExternalAutocomplete):
+    model = Person
+    local_queryset = staticmethod(autocomplete_persons)
     adapters = [
         TypeSenseAutocompleteAdapter(
             collections="prosnet-wikidata-person-index",
@@ -39,7 +259,7 @@ class PersonExternalAutocomplete(ExternalAutocomplete):
             token=os.getenv("TYPESENSE_TOKEN", None),
             server=os.getenv("TYPESENSE_SERVER", None),
         ),
-        LobidAutocompleteAdapter(
+        LobidAdapter(
             template="apis_ontology/generic_external_autocomplete_result.html",
             params={
                 "filter": "type:Person",
@@ -49,7 +269,9 @@ class PersonExternalAutocomplete(ExternalAutocomplete):
     ]
 
 
-class OrganisationExternalAutocomplete(ExternalAutocomplete):
+class OrganisationExternalAutocomplete(ConcurrentExternalAutocomplete):
+    model = Organisation
+    local_queryset = staticmethod(autocomplete_by_name)
     adapters = [
         TypeSenseAutocompleteAdapter(
             collections="prosnet-wikidata-organization-index",
@@ -57,8 +279,37 @@ class OrganisationExternalAutocomplete(ExternalAutocomplete):
             token=os.getenv("TYPESENSE_TOKEN", None),
             server=os.getenv("TYPESENSE_SERVER", None),
         ),
-        LobidAutocompleteAdapter(
+        LobidAdapter(
             template="apis_ontology/generic_external_autocomplete_result.html",
             params={"filter": "type:CorporateBody", "format": "json:preferredName"},
         ),
     ]
+
+
+def annotate_full_title(queryset):
+    """
+    Annotate the full title of work-like entities, so list tables can
+    sort and paginate by it in the database.
+
+    :param queryset: queryset of a model using TitlesMixin
+    :return: the annotated queryset
+    """
+    return queryset.annotate(annotated_full_title=TitlesMixin.full_title_expression())
+
+
+def annotate_full_name(queryset):
+    """
+    Annotate the full name of person-like entities, so list tables can
+    sort and paginate by it in the database.
+
+    :param queryset: queryset of a model using PersonNameMixin
+    :return: the annotated queryset
+    """
+    return queryset.annotate(annotated_full_name=PersonNameMixin.full_name_expression())
+
+
+# querysets of the APIS list views, looked up by model name
+WorkListViewQueryset = annotate_full_title
+ExpressionListViewQueryset = annotate_full_title
+PersonListViewQueryset = annotate_full_name
+CharacterListViewQueryset = annotate_full_name
@@ -5,21 +5,40 @@
 # to be set.
 
 import getpass
+import hashlib
+import json
 import os
 from pathlib import Path
 from urllib.parse import quote
 
 import sharepy
 
+from .utils import hash_file
 
-def import_and_parse_data(parse_data):
+
+# file in the download directory with versions, hashes and import states
+# of downloaded files
+DOWNLOAD_CACHE_FILE = ".sharepoint_cache.json"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def import_and_parse_data(parse_data, force=False):
     s = sharepoint_connect()
 
     files = fetch_sharepoint_files(s)
 
     fname, file_url = input_dialog(files)
 
-    imported, failed = import_file_data(s, fname, file_url, parse_data)
+    sp_file = next(f for f in files if f["ServerRelativeUrl"] == file_url)
+
+    imported, failed = import_file_data(
+        s,
+        fname,
+        file_url,
+        parse_data,
+        file_version=get_file_version(sp_file),
+        force=force,
+    )
 
     for i in imported:
         # TODO processing equivalent to Zotero import script
@@ -184,7 +203,8 @@ def fetch_sharepoint_files(s):
     sp_group = os.environ["SP_GROUP"] = quote(sp_group, safe="/:")
     sp_dir = os.environ["SP_DIRECTORY"] = quote(sp_dir, safe="/:")
 
-    files_fetch_uri = f"https://{sp_site}/sites/{sp_group}/_api/web/GetFolderByServerRelativeUrl('{sp_dir}')/Files"
+    # only request the properties needed to choose and download files
+    files_fetch_uri = f"https://{sp_site}/sites/{sp_group}/_api/web/GetFolderByServerRelativeUrl('{sp_dir}')/Files?$select=Name,ServerRelativeUrl,ETag,TimeLastModified"
 
     try:
         files = s.get(files_fetch_uri).json()["d"]["results"]
@@ -213,17 +233,94 @@ def fetch_file_data(s, sp_fname, sp_file_url):
     return source_file_by_url
 
 
+def get_file_version(sp_file):
+    """
+    :param sp_file: file data as returned by fetch_sharepoint_files()
+    :return: ETag of a SharePoint file or, if missing, the time it was
+             last modified
+    """
+    return sp_file.get("ETag") or sp_file.get("TimeLastModified")
+
+
+def load_download_cache(out_dir):
+    """
+    :param out_dir: directory of downloaded files
+    :return: dictionary of cache entries by SharePoint file URL
+    """
+    try:
+        with open(os.path.join(out_dir, DOWNLOAD_CACHE_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_download_cache(out_dir, download_cache):
+    """
+    :param out_dir: directory of downloaded files
+    :param download_cache: dictionary of cache entries by SharePoint file URL
+    """
+    cache_file = os.path.join(out_dir, DOWNLOAD_CACHE_FILE)
+    tmp_file = f"{cache_file}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(download_cache, f, indent=2)
+    os.replace(tmp_file, cache_file)
+
+
+def download_file(s, file_url, out_file):
+    """
+    Download a file in chunks, so it is never held in memory as a
+    whole. The file is only moved to its destination once complete.
+
+    :param s: SharePoint connection object
+    :param file_url: URL of the file's content
+    :param out_file: path to save the file to
+    :return: SHA-256 hex digest of the file's content
+    """
+    sha256 = hashlib.sha256()
+    tmp_file = f"{out_file}.part"
+
+    with s.get(file_url, stream=True) as response:
+        response.raise_for_status()
+        with open(tmp_file, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                sha256.update(chunk)
+
+    os.replace(tmp_file, out_file)
+
+    return sha256.hexdigest()
+
+
 def import_file_data(
-    s, in_fname, in_file_url, parse_data, out_fname=None, out_dir=None
+    s,
+    in_fname,
+    in_file_url,
+    parse_data,
+    out_fname=None,
+    out_dir=None,
+    file_version=None,
+    force=False,
 ):
     """
     Import data from an Excel file.
 
+    A local copy of the file is only downloaded again when the file's
+    version on SharePoint changed or the copy's content doesn't match
+    the hash of the last download. Parsing is skipped if the content
+    is the same as in the last successful import with the same parser,
+    i.e. the last one which wasn't aborted by an error.
+
     :param s: SharePoint connection object
     :param in_fname: name of input file on SharePoint
     :param in_file_url: url of input file on SharePoint
+    :param parse_data: function to parse the file's data with
     :param out_fname: name of output file for subsequent parsing of data
     :param out_dir: name of directory which output file should get saved to
+    :param file_version: ETag or time of last modification of the input
+                         file, see get_file_version(); if not given, the
+                         file is always downloaded
+    :param force: boolean to parse the file even if it is unchanged since
+                  the last successful import
     :return: tuple of lists of successful and unsuccesful imports
     """
     in_file = fetch_file_data(s, sp_fname=in_fname, sp_file_url=in_file_url)
@@ -236,10 +333,41 @@ def import_file_data(
 
     out_file = os.path.join(out_dir, out_fname)
 
-    if not os.path.exists(out_file):
-        # do not overwrite existing copies of import file
-        s.getfile(in_file, filename=out_file)
+    download_cache = load_download_cache(out_dir)
+    cache_entry = download_cache.get(in_file_url, {})
+    file_hash = cache_entry.get("sha256")
+
+    if (
+        file_version
+        and cache_entry.get("version") == file_version
+        and os.path.exists(out_file)
+        and hash_file(out_file) == file_hash
+    ):
+        print(f"Using unchanged local copy of {in_fname}.")
+    else:
+        file_hash = download_file(s, in_file, out_file)
+
+    cache_entry["version"] = file_version
+    cache_entry["sha256"] = file_hash
+    imported = cache_entry.setdefault("imported", {})
+    download_cache[in_file_url] = cache_entry
+    save_download_cache(out_dir, download_cache)
+
+    # parsers are partials of the importing scripts' parse functions
+    parser_name = getattr(parse_data, "func", parse_data).__name__
+    if not force and imported.get(parser_name) == file_hash:
+        print(
+            f"{in_fname} is unchanged since its last successful import, "
+            "skipped parsing it."
+        )
+        return [], []
 
     success, failure = parse_data(out_file)
 
+    # failures are rows rejected by the parser (e.g. referring to Works
+    # which don't exist), which parsing the same file again wouldn't
+    # import either; imports aborted by an error aren't recorded
+    imported[parser_name] = file_hash
+    save_download_cache(out_dir, download_cache)
+
     return success, failure
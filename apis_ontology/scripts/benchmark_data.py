@@ -0,0 +1,215 @@
+"""
+Generators of synthetic input data for benchmarking the import scripts,
+see management command benchmark_imports.
+"""
+
+from xml.etree import ElementTree as ETree
+
+import pandas as pd
+
+from .additional_infos import WORK_TYPES
+
+
+ns = {"tei": "http://www.tei-c.org/ns/1.0"}
+
+WORK_TYPE_KEYS = list(WORK_TYPES.keys())
+
+ZOTERO_ITEM_TYPES = ["book", "journalArticle", "bookSection", "newspaperArticle"]
+
+
+def get_siglum(prefix: str, number: int):
+    """
+    :return: a siglum unique for the given prefix and number, without
+             underscores (used as separator in Zotero tags)
+    """
+    return f"BENCH-{prefix}-{number:06d}"
+
+
+def generate_zotero_items(count: int):
+    """
+    Generate Zotero collection items as returned by the Zotero API.
+
+    Every fifth item references the preceding item's Work via tag.
+
+    :param count: number of items to generate
+    :return: a list of dictionaries
+    """
+    items = []
+
+    for i in range(count):
+        tags = [
+            {"tag": f"type_{WORK_TYPE_KEYS[i % len(WORK_TYPE_KEYS)]}"},
+            {"tag": f"topic_Benchmark Topic {i % 20}"},
+        ]
+        if i % 5 == 4:
+            tags.append({"tag": f"work_references_{get_siglum('Z', i - 1)}"})
+
+        items.append(
+            {
+                "key": f"BENCH{i:06d}",
+                "data": {
+                    "key": f"BENCH{i:06d}",
+                    "itemType": ZOTERO_ITEM_TYPES[i % len(ZOTERO_ITEM_TYPES)],
+                    "title": f"Benchmark Work {i}",
+                    "shortTitle": f"Subtitle {i}",
+                    "callNumber": get_siglum("Z", i),
+                    "abstractNote": "Lorem ipsum dolor sit amet. " * 5,
+                    "creators": [
+                        {
+                            "creatorType": "author",
+                            "firstName": "Barbara",
+                            "lastName": "Frischmuth",
+                        },
+                        {
+                            "creatorType": "editor",
+                            "firstName": f"Editor {i % 50}",
+                            "lastName": "Benchmark",
+                        },
+                    ],
+                    "tags": tags,
+                    "date": f"{1960 + i % 60}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+                    "numPages": f"{100 + i % 400} S.",
+                    "language": "de; en",
+                    "place": "Wien; Salzburg",
+                    "publisher": f"Benchmark Verlag {i % 10}",
+                    "ISBN": "",
+                    "series": "",
+                    "edition": "",
+                },
+            }
+        )
+
+    return items
+
+
+def generate_tei_file(count: int, file_path: str):
+    """
+    Generate a TEI file of bibls with two (nested) physical objects each,
+    in the structure of the Vorlass TEI export.
+
+    :param count: number of bibls to generate
+    :param file_path: path to write the TEI file to
+    :return: title_siglum_dict for the generated bibls, in the structure
+             expected by parse_vorlass_xml()
+    """
+    tei = f"{{{ns['tei']}}}"
+    title_siglum_dict = {}
+
+    root = ETree.Element(f"{tei}TEI")
+    list_bibl = ETree.SubElement(
+        ETree.SubElement(ETree.SubElement(root, f"{tei}text"), f"{tei}body"),
+        f"{tei}listBibl",
+    )
+
+    for i in range(count):
+        title = f"Benchmark Vorlass Work {i}"
+        category = "Werke"
+
+        bibl = ETree.SubElement(list_bibl, f"{tei}bibl", corresp=f"#bench_{i}")
+        ETree.SubElement(bibl, f"{tei}title", type="main").text = title
+        ETree.SubElement(bibl, f"{tei}note", type="category").text = category
+        ETree.SubElement(bibl, f"{tei}note", type="unmodified_title").text = title
+
+        list_object = ETree.SubElement(
+            ETree.SubElement(bibl, f"{tei}note", type="objects"),
+            f"{tei}listObject",
+        )
+        physical_object = ETree.SubElement(list_object, f"{tei}object")
+        add_tei_object_data(physical_object, f"Mappe {i}", tei)
+        nested_object = ETree.SubElement(
+            ETree.SubElement(
+                ETree.SubElement(physical_object, f"{tei}note", type="objects"),
+                f"{tei}listObject",
+            ),
+            f"{tei}object",
+        )
+        add_tei_object_data(nested_object, f"Typoskript {i}", tei)
+
+        notes = f"docx pointer: {category} --- {title}"
+        title_siglum_dict[title + notes] = {
+            "Sigle": get_siglum("V", i),
+            "Werktyp": f"type_{WORK_TYPE_KEYS[i % len(WORK_TYPE_KEYS)]}",
+            "status": None,
+            "Titel": title,
+            "Untertitel": None,
+        }
+
+    ETree.ElementTree(root).write(file_path, encoding="utf-8", xml_declaration=True)
+
+    return title_siglum_dict
+
+
+def add_tei_object_data(element, name: str, tei: str):
+    identifier = ETree.SubElement(element, f"{tei}objectIdentifier")
+    ETree.SubElement(identifier, f"{tei}objectName").text = name
+    ETree.SubElement(
+        ETree.SubElement(element, f"{tei}physDesc"), f"{tei}p"
+    ).text = f"Description of {name}"
+    ETree.SubElement(element, f"{tei}note", type="docx_anchor").text = f"anchor_{name}"
+
+
+def generate_excel_file(count: int, file_path: str, sigla: list):
+    """
+    Generate an Excel file with sheets for places, characters, topics
+    and research perspectives, in the structure expected by
+    import_nonbibl_entities_from_excel.
+
+    URL columns which would trigger requests to external services
+    (Geonames, DNB) are left empty.
+
+    :param count: number of rows to generate per sheet
+    :param file_path: path to write the Excel file to
+    :param sigla: sigla of existing Works to relate entities to
+    :return: total number of generated rows
+    """
+    sheets = {
+        "Orte": pd.DataFrame(
+            {
+                "Name_im_Werk": f"Benchmark Ort {i % (count // 2 + 1)}",
+                "Sigle": sigla[i % len(sigla)],
+                "Kategorie": ["E", "S", "A"][i % 3],
+                "Beschreibung": f"Description {i}",
+                "URL_Geonames": "",
+                "URL_Wikipedia": f"http://de.wikipedia.org/wiki/Bench_Ort_{i}",
+                "URL_extern": "",
+            }
+            for i in range(count)
+        ),
+        "Namen": pd.DataFrame(
+            {
+                "Name": f"Benchmark Figur {i}",
+                "Vorname": f"Vorname {i}",
+                "Nachname": "Benchmark",
+                "alternativeName": "",
+                "Beschreibung": f"Description {i}",
+                "Rolle": ["H", "N", "E"][i % 3],
+                "Kategorie": ["F", "R", "M"][i % 3],
+                "Sigle": sigla[i % len(sigla)],
+                "URL_DNB": "",
+                "URL_Wikipedia": f"http://de.wikipedia.org/wiki/Bench_Person_{i}",
+                "URL_extern": "",
+            }
+            for i in range(count)
+        ),
+        "Themen": pd.DataFrame(
+            {
+                "Thema": f"Benchmark Thema {i % (count // 4 + 1)}",
+                "Sigle": sigla[i % len(sigla)],
+                "Synonyme": "",
+            }
+            for i in range(count)
+        ),
+        "Forschungshinsichten": pd.DataFrame(
+            {
+                "Thema": f"Benchmark Forschungshinsicht {i % 10}",
+                "Sigle": sigla[i % len(sigla)],
+            }
+            for i in range(count)
+        ),
+    }
+
+    with pd.ExcelWriter(file_path) as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    return sum(len(df) for df in sheets.values())
@@ -0,0 +1,242 @@
+"""
+Enrich entities with data from the RDF resources their URIs point to,
+using the attribute definitions in apis_ontology/rdfimport.
+
+The RDF graph of every URI is fetched once (or read from an on-disk
+cache) and all of a definition's SPARQL queries are evaluated against
+it in memory. Graphs are fetched concurrently.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+from apis_core.apis_metainfo.models import Uri
+from apis_core.utils.normalize import clean_uri
+from apis_core.utils.rdf import definition_matches_model, definition_matches_uri
+from apis_core.utils.settings import dict_from_toml_directory
+from rdflib import Graph
+from rdflib.plugins.sparql import prepareQuery
+
+from apis_ontology.models import Organisation, Person, Place
+
+
+logger = logging.getLogger(__name__)
+
+RDF_CACHE_DIR = os.getenv("RDF_CACHE_DIR", ".rdf_cache")
+# seconds after which cached graphs are fetched again
+RDF_CACHE_TTL = int(os.getenv("RDF_CACHE_TTL", 7 * 24 * 60 * 60))
+ENRICHMENT_WORKERS = 8
+
+ENRICHED_MODELS = [Person, Place, Organisation]
+
+
+@cache
+def get_definitions():
+    """
+    Load the RDF import definitions and prepare their SPARQL queries,
+    with the same default namespaces as Graph.query().
+
+    :return: list of definition dictionaries with a list of prepared
+             queries under key "queries"
+    """
+    namespaces = dict(Graph().namespaces())
+    definitions = []
+
+    for key, definition in dict_from_toml_directory("rdfimport").items():
+        definition = {**definition, "filename": str(key)}
+        definition["queries"] = [
+            prepareQuery(attribute["sparql"], initNs=namespaces)
+            for attribute in definition.get("attributes", [])
+            if attribute.get("sparql")
+        ]
+        definitions.append(definition)
+
+    return definitions
+
+
+def get_definition(model, uri):
+    """
+    :return: the first definition matching model and URI or None,
+             following the same rules as APIS' RDF import
+    """
+    for definition in get_definitions():
+        if definition_matches_model(definition, model) and definition_matches_uri(
+            definition, uri
+        ):
+            return definition
+
+    return None
+
+
+def get_cache_path(uri, cache_dir):
+    return os.path.join(cache_dir, f"{hashlib.sha256(uri.encode()).hexdigest()}.nt")
+
+
+def get_graph(uri, cache_dir=RDF_CACHE_DIR, ttl=RDF_CACHE_TTL):
+    """
+    Get the RDF graph of a URI from the on-disk cache or fetch it
+    and cache it as N-Triples file.
+
+    :param uri: URI of an RDF resource
+    :param cache_dir: directory of cached graphs
+    :param ttl: seconds for which cached graphs are used
+    :return: Graph object
+    """
+    cache_path = get_cache_path(uri, cache_dir)
+    graph = Graph()
+
+    try:
+        if time.time() - os.path.getmtime(cache_path) < ttl:
+            return graph.parse(cache_path, format="nt")
+    except OSError:
+        pass
+
+    graph.parse(uri)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # write to temporary file first so other threads never read partial files
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    graph.serialize(destination=tmp_path, format="nt", encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+    return graph
+
+
+def get_attributes(uri, definition, cache_dir=RDF_CACHE_DIR, ttl=RDF_CACHE_TTL):
+    """
+    Extract the attributes of a definition from the graph of a URI.
+
+    :param uri: URI of an RDF resource
+    :param definition: matching RDF import definition
+    :return: dictionary of attribute values by name
+    """
+    graph = get_graph(clean_uri(uri), cache_dir, ttl)
+    attributes = {}
+
+    for query in definition["queries"]:
+        for binding in graph.query(query).bindings:
+            for key, value in binding.items():
+                attributes[str(key)] = str(value)
+
+    return attributes
+
+
+def update_object(obj, attributes, overwrite=False):
+    """
+    Set the values of attributes which correspond to editable fields
+    of an object. Attributes without matching field are ignored.
+
+    :param obj: entity object
+    :param attributes: dictionary of attribute values by name
+    :param overwrite: whether to replace existing field values
+                      or only fill empty fields
+    :return: list of names of changed fields
+    """
+    fields = {f.name: f for f in obj._meta.concrete_fields if f.editable}
+    changed = []
+
+    for name, value in attributes.items():
+        if name not in fields:
+            continue
+
+        current = getattr(obj, name)
+        if current not in [None, ""] and not overwrite:
+            continue
+
+        value = fields[name].to_python(value)
+        if value != current:
+            setattr(obj, name, value)
+            changed.append(name)
+
+    return changed
+
+
+def get_enrichment_tasks(model):
+    """
+    Collect objects of a model with a URI matching an RDF import
+    definition, using the first matching URI per object.
+
+    :param model: entity model class
+    :return: list of tuples of object, URI and definition
+    """
+    uris = {}
+    for uri, object_id in (
+        Uri.objects.filter(root_object__in=model.objects.all())
+        .order_by("id")
+        .values_list("uri", "root_object_id")
+    ):
+        if object_id not in uris and (definition := get_definition(model, uri)):
+            uris[object_id] = (uri, definition)
+
+    objects = model.objects.in_bulk(uris.keys())
+
+    return [(objects[pk], uri, definition) for pk, (uri, definition) in uris.items()]
+
+
+def enrich(
+    models=None,
+    overwrite=False,
+    workers=ENRICHMENT_WORKERS,
+    cache_dir=RDF_CACHE_DIR,
+    ttl=RDF_CACHE_TTL,
+):
+    """
+    Enrich objects of the given models with data from their URIs.
+
+    :param models: entity model classes, defaults to ENRICHED_MODELS
+    :param overwrite: whether to replace existing field values
+    :param workers: number of graphs to fetch concurrently
+    :return: tuple of lists of updated and failed objects
+    """
+    updated = []
+    failed = []
+
+    tasks = []
+    for model in models or ENRICHED_MODELS:
+        tasks.extend(get_enrichment_tasks(model))
+
+    def fetch(task):
+        obj, uri, definition = task
+        try:
+            return get_attributes(uri, definition, cache_dir, ttl)
+        except Exception as e:
+            logger.error("Could not fetch data for %s from %s: %s", obj, uri, e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for (obj, uri, definition), attributes in zip(
+            tasks, executor.map(fetch, tasks)
+        ):
+            if attributes is None:
+                failed.append(obj)
+                continue
+
+            changed = update_object(obj, attributes, overwrite)
+            if not changed:
+                continue
+
+            try:
+                obj.save(update_fields=changed)
+                updated.append(obj)
+                logger.info("Updated %s from %s: %s", obj, uri, ", ".join(changed))
+            except Exception as e:
+                logger.error("Could not update %s from %s: %s", obj, uri, e)
+                failed.append(obj)
+
+    logger.info(
+        "Enriched %s objects from RDF, %s updated, %s failed",
+        len(tasks),
+        len(updated),
+        len(failed),
+    )
+
+    return updated, failed
+
+
+def run():
+    enrich()
@@ -1,15 +1,18 @@
 import datetime
 import inspect
+import logging
 import os
 import re
 import sys
 
 from apis_core.apis_relations.models import Property, TempTriple
+from django.db import transaction
 
 from apis_ontology.models import (
     Archive,
     DataSource,
     Expression,
+    ImportRunState,
     Organisation,
     Person,
     Place,
@@ -19,6 +22,68 @@ from apis_ontology.models import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# default number of items committed per transaction in chunked imports
+IMPORT_CHUNK_SIZE = 100
+
+
+class LookupIndex:
+    """
+    In-memory indexes of objects which get looked up repeatedly
+    during imports, to avoid one query per lookup.
+
+    Objects created during an import need to be added via the
+    respective add_* methods to be found by later lookups.
+    Works are only loaded on first lookup.
+    """
+
+    def __init__(self):
+        properties = Property.objects.all()
+        self.properties = {p.name_forward: p for p in properties}
+        self.properties_reverse = {p.name_reverse: p for p in properties}
+        self.work_types = {t.name: t for t in WorkType.objects.all()}
+        self._works = None
+
+    @property
+    def works(self):
+        if self._works is None:
+            self._works = {
+                w.siglum: w for w in Work.objects.exclude(siglum__isnull=True)
+            }
+        return self._works
+
+    def get_property(self, name_forward: str):
+        """
+        :return: Property object
+        """
+        return self.properties[name_forward]
+
+    def find_property(self, name: str):
+        """
+        Look up a Property by either its forward or reverse name.
+
+        :return: Property object or None
+        """
+        return self.properties.get(name, self.properties_reverse.get(name, None))
+
+    def get_work(self, siglum: str):
+        """
+        :return: Work object or None
+        """
+        return self.works.get(siglum, None) if siglum else None
+
+    def get_type(self, name: str):
+        """
+        :return: WorkType object or None
+        """
+        return self.work_types.get(name, None)
+
+    def add_work(self, work: Work):
+        if work.siglum:
+            self.works[work.siglum] = work
+
+
 def create_triple(entity_subj, entity_obj, prop):
     """
     Helper function for creating APIS Ontologies triples.
@@ -152,6 +217,7 @@ def create_expression(
     relevant_pages: str,
     page_count: int = None,
     edition_types: list = None,
+    parsed_pub_date: datetime.datetime = None,
 ):
     """
     Create a new Expression entity object if one with the given parameters
@@ -163,6 +229,8 @@ def create_expression(
     :param pages: number of pages
     :param man_types: type(s) of manifestation, if any; can be string
                     or list of strings
+    :param parsed_pub_date: pub_date parsed ahead of time, if available,
+                            see Expression.set_publication_date()
     :return: Expression object
     """
     expression, created = Expression.objects.get_or_create(
@@ -174,7 +242,7 @@ def create_expression(
         defaults={"data_source": source},
     )
     if pub_date:
-        expression.publication_date_manual_input = pub_date
+        expression.set_publication_date(pub_date, parsed_pub_date)
         expression.save()
 
     return expression, created
@@ -324,3 +392,180 @@ def get_expressions_by_work(work_id: int):
 
 def work_with_siglum_exists(siglum):
     return Work.objects.filter(siglum=siglum).exists()
+
+
+def chunked(items, chunk_size: int):
+    """
+    Split an iterable into lists of at most chunk_size items.
+
+    :param items: an iterable
+    :param chunk_size: maximum number of items per chunk
+    :return: a generator of lists
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def skip_to_checkpoint(items, get_key, last_key: str):
+    """
+    Drop all items up to and including the item with the given key.
+
+    Items are consumed lazily, so streamed items stay streamed. As
+    dropped items can't be replayed, a missing key raises an error.
+
+    :param items: an iterable of items
+    :param get_key: function returning the key of an item
+    :param last_key: key of the last item processed previously
+    :return: a generator of the remaining items
+    """
+    items = iter(items)
+
+    for item in items:
+        if str(get_key(item)) == last_key:
+            break
+    else:
+        raise ValueError(
+            f"Checkpoint {last_key} not found, rerun the import without resuming."
+        )
+
+    yield from items
+
+
+def get_checkpoint(run_name: str, resume: bool = False):
+    """
+    :param run_name: identifier of the import run used for checkpoints
+    :param resume: boolean; whether an incomplete run is to be resumed
+    :return: key of the last committed item of the run to resume after,
+             or None if the run starts from the first item
+    """
+    if not resume:
+        return None
+
+    run_state = ImportRunState.objects.filter(name=run_name).first()
+    if run_state and not run_state.completed and run_state.last_key:
+        return run_state.last_key
+
+    return None
+
+
+def start_import_run(run_name: str, resume: bool = False, state: dict = None):
+    """
+    Get the checkpoint of an import run. Unless an incomplete run is
+    resumed, the checkpoint is reset.
+
+    :param run_name: identifier of the import run used for checkpoints
+    :param resume: boolean; continue after the checkpoint of a previous,
+                   incomplete run with the same name
+    :param state: dictionary to restore the state saved along with the
+                  checkpoint into when resuming
+    :return: tuple of ImportRunState object and key of the last committed
+             item to resume after, or None to start from the first item
+    """
+    run_state, created = ImportRunState.objects.get_or_create(name=run_name)
+
+    if resume and not run_state.completed and run_state.last_key:
+        logger.info(
+            f"Resuming import {run_name} after {run_state.last_key} "
+            f"({run_state.processed} items committed previously)."
+        )
+        if state is not None:
+            state.update(run_state.state)
+        return run_state, run_state.last_key
+
+    run_state.last_key = ""
+    run_state.processed = 0
+    run_state.completed = False
+    run_state.state = {}
+    run_state.save()
+
+    return run_state, None
+
+
+def commit_in_chunks(
+    items,
+    import_item,
+    get_key,
+    run_state: ImportRunState,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    state: dict = None,
+):
+    """
+    Import items in chunks, each of which gets committed in a single
+    transaction along with a checkpoint for the import run.
+
+    :param items: iterable of items to import
+    :param import_item: function which imports a single item and returns
+                        a tuple of lists of successes and failures
+    :param get_key: function returning the key of an item
+    :param run_state: ImportRunState object, see start_import_run()
+    :param chunk_size: number of items to commit per transaction
+    :param state: dictionary of JSON-serializable values which import_item
+                  keeps up to date, saved along with every checkpoint
+    :return: tuple with list of imported items and list of failed items
+    """
+    success = []
+    failure = []
+
+    for chunk in chunked(items, chunk_size):
+        with transaction.atomic():
+            for item in chunk:
+                imported, failed = import_item(item)
+                success.extend(imported)
+                failure.extend(failed)
+
+            run_state.last_key = str(get_key(chunk[-1]))
+            run_state.processed += len(chunk)
+            if state is not None:
+                run_state.state = state
+            run_state.save()
+
+    run_state.completed = True
+    run_state.save()
+
+    return success, failure
+
+
+def import_in_chunks(
+    items,
+    import_item,
+    get_key,
+    run_name: str,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    resume: bool = False,
+    state: dict = None,
+):
+    """
+    Import items in chunks, each of which gets committed in a single
+    transaction along with a checkpoint for the import run.
+
+    When an item fails to import, only the current chunk gets rolled back,
+    so a later run with resume set to True continues with its first item.
+
+    :param items: iterable of items to import
+    :param import_item: function which imports a single item and returns
+                        a tuple of lists of successes and failures
+    :param get_key: function returning the key of an item, e.g. a Zotero
+                    item key or an Excel row number
+    :param run_name: identifier of the import run used for checkpoints
+    :param chunk_size: number of items to commit per transaction
+    :param resume: boolean; continue after the checkpoint of a previous,
+                   incomplete run with the same name
+    :param state: dictionary of JSON-serializable values which import_item
+                  keeps up to date, e.g. IDs of objects later items refer
+                  to; saved with every checkpoint and restored on resume
+    :return: tuple with list of imported items and list of failed items
+             to use for further processing
+    """
+    run_state, last_key = start_import_run(run_name, resume, state)
+    if last_key:
+        items = skip_to_checkpoint(items, get_key, last_key)
+
+    return commit_in_chunks(
+        items, import_item, get_key, run_state, chunk_size=chunk_size, state=state
+    )
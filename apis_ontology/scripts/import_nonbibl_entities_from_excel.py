@@ -1,9 +1,9 @@
 import logging
 import os
+from functools import partial
 
-import pandas as pd
 from apis_core.apis_metainfo.models import Uri
-from apis_core.apis_relations.models import Property
+from apis_core.utils.normalize import clean_uri
 from django.core.exceptions import ImproperlyConfigured
 
 from apis_ontology.models import (
@@ -16,8 +16,16 @@ from apis_ontology.models import (
 )
 from apis_ontology.scripts.access_sharepoint import import_and_parse_data
 
-from .import_helpers import create_source, create_triple, work_with_siglum_exists
-from .utils import secure_urls
+from .import_helpers import (
+    IMPORT_CHUNK_SIZE,
+    LookupIndex,
+    create_source,
+    create_triple,
+    get_checkpoint,
+    import_in_chunks,
+)
+from .import_pipeline import ImportPipeline
+from .utils import read_excel_cached, secure_urls
 
 
 logger = logging.getLogger(__name__)
@@ -45,292 +53,688 @@ FICTIONALITY_DEGREES = {
 }
 
 
-def run():
-    import_and_parse_data(parse_entities_excel)
+def run(resume=False, chunk_size=IMPORT_CHUNK_SIZE, engine="serial", force=False):
+    import_and_parse_data(
+        partial(
+            parse_entities_excel, resume=resume, chunk_size=chunk_size, engine=engine
+        ),
+        force=force,
+    )
 
 
-def parse_entities_excel(file):
+def parse_entities_excel(
+    file, resume=False, chunk_size=IMPORT_CHUNK_SIZE, engine="serial"
+):
     success = []
     failure = []
 
-    dfs = pd.read_excel(file, sheet_name=None)
+    # all imported columns hold text, read them as such
+    dfs = read_excel_cached(
+        file,
+        sheet_name=None,
+        usecols=sorted(set(sum(SHEET_COLUMNS.values(), []))),
+        dtype=str,
+    )
     # remove leading and trailing whitespsaces
     for sheet_name, df in dfs.items():
         # df = dataStorage[names_of_files[i]]
         df_cleaned = df.map(lambda x: x.strip() if isinstance(x, str) else x).fillna(
             value=""
         )
-        parse_entities_dataframe(sheet_name, df_cleaned, file)
+        imported, failed = parse_entities_dataframe(
+            sheet_name,
+            df_cleaned,
+            file,
+            resume=resume,
+            chunk_size=chunk_size,
+            engine=engine,
+        )
+        success.extend(imported)
+        failure.extend(failed)
 
     return success, failure
 
 
-def parse_entities_dataframe(sheet_name, df, file):
+def parse_entities_dataframe(
+    sheet_name, df, file, resume=False, chunk_size=IMPORT_CHUNK_SIZE, engine="serial"
+):
+    """
+    Import the rows of a single sheet in chunks of rows, each of which
+    is committed in a single transaction. The Excel row number of the
+    last row of every chunk is kept as a checkpoint from which an
+    incomplete import can resume.
+
+    Works, Uris and authority entities are looked up per sheet, see
+    resolve_dataframe(), and Uris are linked in bulk. Entities and
+    triples are still written row by row: both use multi-table
+    inheritance and version history, which rule out bulk_create().
+
+    :param sheet_name: name of the sheet, determines the entity to import
+    :param df: cleaned DataFrame holding the sheet's data
+    :param file: path to the imported file
+    :param resume: boolean to continue a previous, incomplete import
+                   after its last checkpoint
+    :param chunk_size: number of rows to commit per transaction
+    :param engine: "serial" to import rows one by one, "pipeline" to
+                   import them in parse, resolve and write stages
+    :return: tuple with list of imported items and list of failed items
+    """
+    import_row = SHEET_IMPORTERS.get(sheet_name, None)
+    if not import_row:
+        return [], []
+
     file_name = os.path.basename(file)
     data_source, created = create_source(
         name="NonBiblEntities",
         file_name=file_name,
         data_type="xslx",
     )
-    for index, row in df.iterrows():
-        if sheet_name == "Orte":
-            place_name = row["Name_im_Werk"]
-            related_work_siglum = row["Sigle"]
-            place_type = row["Kategorie"]
-            place_description = row["Beschreibung"]
-            place_uri_geoname = row["URL_Geonames"]
-            place_uris = (row["URL_Wikipedia"], row["URL_extern"])
-            place_uri_objects = []
-
-            if work_with_siglum_exists(related_work_siglum):
-                for place_uri in place_uris:
-                    if place_uri:
-                        secure_uri = secure_urls(place_uri)
-                        if secure_uri:
-                            uri, created = Uri.objects.get_or_create(uri=secure_uri)
-                            place_uri_objects.append(uri)
-                        else:
-                            logger.info(
-                                f"Non-valid input for uri. {place_uri} place name: {place_name}"
-                            )
-
-                place_qs = None
-                place = None
-
-                if place_uri_geoname and "geonames.org" in place_uri_geoname:
-                    secure_geoname_uri = secure_urls(place_uri_geoname)
-                    place = Place.get_or_create_uri(secure_geoname_uri)
 
-                else:
-                    if len(place_uri_objects) > 0:
-                        place_qs = Place.objects.filter(
-                            uri__in=[uri.id for uri in place_uri_objects],
-                        )
-                    else:
-                        place_qs = Place.objects.filter(name=place_name)
-
-                    if place_qs.count() == 0:
-                        place, created = Place.objects.get_or_create(
-                            name=place_name, defaults={"data_source": data_source}
-                        )
-                    else:
-                        place = place_qs.first()
-                        alternative_names = list(
-                            filter(None, place.alternative_name.split(";"))
-                        )
-                        if (
-                            place_name
-                            and place_name != place.name
-                            and place_name not in alternative_names
-                        ):
-                            alternative_names.append(place_name)
-                            place.alternative_name = ";".join(alternative_names)
-                            place.save()
-
-                for uri in place_uri_objects:
-                    if not uri.root_object:
-                        uri.root_object = place
-                        uri.save()
-
-                if Work.objects.filter(siglum=related_work_siglum).exists():
-                    work_object = Work.objects.get(siglum=related_work_siglum)
-                    triple, created = create_triple(
-                        entity_subj=work_object,
-                        entity_obj=place,
-                        prop=Property.objects.get(
-                            name_forward=WORK_PLACE_RELATIONTYPES[place_type]
-                        ),
-                    )
-                    place_description_info = (
-                        f": {place_description}" if place_description else ""
-                    )
-                    triple.notes = f"{place_name}{place_description_info}"
-                    triple.save()
+    run_name = f"{file_name}_{sheet_name}"
+    last_key = get_checkpoint(run_name, resume)
+
+    df, works, uris, uri_entities = resolve_dataframe(
+        df,
+        sheet_name,
+        file_name,
+        after_row=int(last_key) if last_key else None,
+    )
+
+    write_row = partial(
+        import_row,
+        data_source=data_source,
+        file_name=file_name,
+        sheet_name=sheet_name,
+    )
+    resolve = partial(
+        resolve_row,
+        works=works,
+        uris=uris,
+        uri_columns=URI_COLUMNS.get(sheet_name, []),
+        uri_entities=uri_entities,
+        entity_uri_column=ENTITY_URI_COLUMNS.get(sheet_name, (None, None))[1],
+    )
+    rows = zip(df.index, df.to_dict("records"))
+
+    if engine == "pipeline":
+        # rows are cleaned up front already, so parsing them
+        # in worker processes wouldn't pay off
+        pipeline = ImportPipeline(
+            parse=parse_row,
+            resolve=resolve,
+            write=write_row,
+            get_key=lambda record: record["row_number"],
+            run_name=run_name,
+            batch_size=chunk_size,
+            workers=0,
+            get_item_key=lambda index_record: get_row_number(index_record[0]),
+        )
+        return pipeline.run(rows, resume=resume)
+
+    index = LookupIndex()
+
+    return import_in_chunks(
+        map(parse_row, rows),
+        import_item=lambda record: write_row(resolve(record, index), index),
+        get_key=lambda record: record["row_number"],
+        run_name=run_name,
+        chunk_size=chunk_size,
+        resume=resume,
+    )
+
+
+def resolve_dataframe(df, sheet_name, file_name, after_row=None):
+    """
+    Drop duplicate rows of a sheet, if importing them again wouldn't
+    change anything, and look up the Works, Uris and entities referred
+    to by all of its rows at once.
+
+    :param df: cleaned DataFrame holding the sheet's data
+    :param sheet_name: name of the sheet, determines the URL columns
+    :param file_name: name of the imported file, used for logging
+    :param after_row: Excel row number of the checkpoint of a resumed
+                      import, entities are only created for later rows
+    :return: tuple of the deduplicated DataFrame with secure and
+             cleaned URLs, a dictionary of Works by siglum, a dictionary
+             of existing Uris by cleaned URL and a dictionary of entities
+             by authority URL, see get_uri_entities()
+    """
+    if sheet_name in DEDUPLICATED_SHEETS:
+        row_count = len(df)
+        df = df.drop_duplicates()
+        if len(df) < row_count:
+            logger.info(
+                f"Skipped {row_count - len(df)} duplicate rows. File: {file_name}. Sheet: {sheet_name}."
+            )
+
+    sigla = [siglum for siglum in df["Sigle"].unique() if siglum]
+    works = {work.siglum: work for work in Work.objects.filter(siglum__in=sigla)}
+
+    # URLs are normalised like Uri.save() does, as Uris are looked up
+    # and created in bulk by get_uris() and link_uris()
+    cleaned_urls = {}
+    for column in URI_COLUMNS.get(sheet_name, []):
+        secure = df[column].map(lambda url: secure_urls(url) if url else "")
+        for row_index, url in df.loc[secure.isna(), column].items():
+            logger.info(
+                f"Non-valid input for uri. {url}. File: {file_name}. Sheet: {sheet_name}. Row: {row_index + 2}"
+            )
+        secure = secure.fillna("")
+        for url in secure.unique():
+            if url and url not in cleaned_urls:
+                cleaned_urls[url] = clean_uri(url)
+        df = df.assign(**{column: secure.map(lambda url: cleaned_urls.get(url, url))})
+
+    uris = {
+        uri.uri: uri for uri in Uri.objects.filter(uri__in=set(cleaned_urls.values()))
+    }
+
+    return (
+        df,
+        works,
+        uris,
+        get_uri_entities(df, sheet_name, file_name, works, after_row),
+    )
+
+
+def get_uri_entities(df, sheet_name, file_name, works, after_row=None):
+    """
+    Get or create the entities of the authority URLs of a sheet in
+    one batch, cf. get_or_create_objects_from_uris(). Like the row
+    importers, only rows which refer to an existing Work are taken
+    into account, and only rows after the checkpoint when resuming.
+    If the batch fails, the rows fall back to getting or creating
+    their entities one by one.
+
+    :param df: cleaned DataFrame holding the sheet's data
+    :param sheet_name: name of the sheet, determines the URL column
+    :param file_name: name of the imported file, used for logging
+    :param works: dictionary of Works by siglum
+    :param after_row: Excel row number of the checkpoint of a resumed import
+    :return: dictionary of entities by URL as given in the sheet
+    """
+    model, column = ENTITY_URI_COLUMNS.get(sheet_name, (None, None))
+    if not model:
+        return {}
+
+    rows = df[df["Sigle"].isin(works.keys())]
+    if after_row:
+        rows = rows[get_row_number(rows.index) > after_row]
+    if sheet_name == "Namen":
+        rows = rows[rows["Kategorie"].isin(["R", "M", "M/R"])]
+
+    urls = {
+        url: secure_urls(url)
+        for url in rows[column].unique()
+        if url and (sheet_name != "Orte" or "geonames.org" in url)
+    }
+    urls = {url: secure_url for url, secure_url in urls.items() if secure_url}
+
+    try:
+        entities = model.get_or_create_uris(list(urls.values()))
+    except Exception as e:
+        logger.info(
+            f"Could not create entities from uris in one batch: {e}. File: {file_name}. Sheet: {sheet_name}."
+        )
+        return {}
+
+    return {url: entities[secure_url] for url, secure_url in urls.items()}
+
+
+def parse_row(index_record):
+    """
+    Add the Excel row number to a record of a DataFrame row.
+
+    :param index_record: tuple of row index and row as dictionary
+    :return: dictionary of the row's values plus its Excel row number
+    """
+    row_index, record = index_record
+    record = dict(record)
+    record["row_number"] = get_row_number(row_index)
+
+    return record
+
+
+def get_row_number(row_index):
+    """
+    :param row_index: index of a DataFrame row
+    :return: number of the row in the Excel sheet
+    """
+    # header is in first row, row numbers start at 1
+    return row_index + 2
+
+
+def resolve_row(
+    record, index, works, uris, uri_columns, uri_entities, entity_uri_column
+):
+    """
+    Look up the Work, Uris and entity a record refers to.
+
+    :param record: dictionary returned by parse_row()
+    :param index: LookupIndex, unused as Works and Uris are looked up
+                  per sheet by resolve_dataframe()
+    :param works: dictionary of Works by siglum
+    :param uris: dictionary of existing Uris by cleaned URL
+    :param uri_columns: names of the columns holding URLs
+    :param uri_entities: dictionary of entities by authority URL
+    :param entity_uri_column: name of the column holding authority URLs
+    :return: the record with the Work (or None) added as "work",
+             a dictionary of its URLs and their Uris (or None if they
+             don't exist yet) as "uris" and the entity of its
+             authority URL (or None) as "uri_entity"
+    """
+    record["work"] = works.get(record["Sigle"], None)
+    record["uris"] = {
+        record[column]: uris.get(record[column], None)
+        for column in uri_columns
+        if record[column]
+    }
+    record["uri_entity"] = (
+        uri_entities.get(record[entity_uri_column]) if entity_uri_column else None
+    )
+
+    return record
+
+
+def get_uris(urls):
+    """
+    Complete the Uris of a row with those created by previous rows
+    since the sheet was resolved, using a single query.
+
+    :param urls: dictionary of cleaned URLs and their Uris or None,
+                 see resolve_dataframe()
+    :return: dictionary of cleaned URLs and their Uris or None
+    """
+    missing = [url for url, uri in urls.items() if uri is None]
+    if not missing:
+        return urls
+
+    found = {uri.uri: uri for uri in Uri.objects.filter(uri__in=missing)}
+
+    return {url: uri or found.get(url) for url, uri in urls.items()}
+
 
+def link_uris(urls, entity):
+    """
+    Link Uris without object to an entity and create missing Uris,
+    with one query for each.
+
+    :param urls: dictionary of cleaned URLs and their Uris or None,
+                 see get_uris(); Uris are created without save(), so the
+                 URLs need to be cleaned with clean_uri() beforehand
+    :param entity: entity object to link to
+    """
+    new_uris = [
+        Uri(uri=url, root_object=entity) for url, uri in urls.items() if not uri
+    ]
+    unlinked_uris = [uri for uri in urls.values() if uri and not uri.root_object_id]
+
+    for uri in unlinked_uris:
+        uri.root_object = entity
+
+    Uri.objects.bulk_create(new_uris)
+    Uri.objects.bulk_update(unlinked_uris, ["root_object"])
+
+
+def import_place_row(row, index, data_source, file_name, sheet_name):
+    """
+    Import a row of sheet "Orte" as Place.
+
+    :param row: record of a row of the sheet, see resolve_row()
+    :param index: LookupIndex to look up Properties with
+    :param data_source: DataSource object to link to
+    :param file_name: name of the imported file, used for logging
+    :param sheet_name: name of the imported sheet, used for logging
+    :return: tuple with list of imported items and list of failed items
+    """
+    success = []
+    failure = []
+
+    place_name = row["Name_im_Werk"]
+    related_work_siglum = row["Sigle"]
+    place_type = row["Kategorie"]
+    place_description = row["Beschreibung"]
+    place_uri_geoname = row["URL_Geonames"]
+
+    work_object = row["work"]
+
+    if work_object:
+        place_urls = get_uris(row["uris"])
+        place_uri_objects = [uri for uri in place_urls.values() if uri]
+
+        place_qs = None
+        place = None
+
+        if place_uri_geoname and "geonames.org" in place_uri_geoname:
+            secure_geoname_uri = secure_urls(place_uri_geoname)
+            place = row["uri_entity"] or Place.get_or_create_uri(secure_geoname_uri)
+
+        else:
+            if len(place_uri_objects) > 0:
+                place_qs = Place.objects.filter(
+                    uri__in=[uri.id for uri in place_uri_objects],
+                )
             else:
-                rejection_cause_message = (
-                    f"Work with sigle {related_work_siglum} doesn't exist."
-                    if related_work_siglum
-                    else "No sigle was provided."
+                place_qs = Place.objects.filter(name=place_name)
+
+            if place_qs.count() == 0:
+                place, created = Place.objects.get_or_create(
+                    name=place_name, defaults={"data_source": data_source}
                 )
-                logger.info(
-                    f"{rejection_cause_message} Place import was rejected. File: {file_name}. Sheet: {sheet_name}. Entity name: {place_name}"
+            else:
+                place = place_qs.first()
+                alternative_names = list(
+                    filter(None, place.alternative_name.split(";"))
                 )
+                if (
+                    place_name
+                    and place_name != place.name
+                    and place_name not in alternative_names
+                ):
+                    alternative_names.append(place_name)
+                    place.alternative_name = ";".join(alternative_names)
+                    place.save()
+
+        link_uris(place_urls, place)
+
+        triple, created = create_triple(
+            entity_subj=work_object,
+            entity_obj=place,
+            prop=index.get_property(WORK_PLACE_RELATIONTYPES[place_type]),
+        )
+        place_description_info = f": {place_description}" if place_description else ""
+        triple.notes = f"{place_name}{place_description_info}"
+        triple.save()
 
-        if sheet_name == "Namen":
-            character_name = row["Name"]
-            forename = row["Vorname"]
-            surname = row["Nachname"]
-            person_alternative_name = row["alternativeName"]
-            description = row["Beschreibung"]
-            character_relevancy = RELEVANCIES.get(row["Rolle"], "")
-            character_fictionality = row["Kategorie"]
-            character_fictionality_degree = FICTIONALITY_DEGREES[character_fictionality]
-            related_work_siglum = row["Sigle"]
-            person_dnb_uri = row["URL_DNB"]
-            person_uris = (row["URL_Wikipedia"], row["URL_extern"])
-
-            if work_with_siglum_exists(related_work_siglum):
-                character = Character.objects.create(
-                    fallback_name=character_name,
-                    relevancy=character_relevancy,
-                    fictionality=character_fictionality_degree,
-                    data_source=data_source,
-                )
+        success.append(place)
+
+    else:
+        rejection_cause_message = (
+            f"Work with sigle {related_work_siglum} doesn't exist."
+            if related_work_siglum
+            else "No sigle was provided."
+        )
+        logger.info(
+            f"{rejection_cause_message} Place import was rejected. File: {file_name}. Sheet: {sheet_name}. Entity name: {place_name}"
+        )
+        failure.append(rejection_cause_message)
+
+    return success, failure
 
-                if Work.objects.filter(siglum=related_work_siglum).exists():
-                    work_object = Work.objects.get(siglum=related_work_siglum)
 
-                    create_triple(
-                        entity_subj=work_object,
-                        entity_obj=character,
-                        prop=Property.objects.get(name_forward="features"),
+def import_character_row(row, index, data_source, file_name, sheet_name):
+    """
+    Import a row of sheet "Namen" as Character and, for historical or
+    mythological characters, as Person.
+
+    :param row: record of a row of the sheet, see resolve_row()
+    :param index: LookupIndex to look up Properties with
+    :param data_source: DataSource object to link to
+    :param file_name: name of the imported file, used for logging
+    :param sheet_name: name of the imported sheet, used for logging
+    :return: tuple with list of imported items and list of failed items
+    """
+    success = []
+    failure = []
+
+    character_name = row["Name"]
+    forename = row["Vorname"]
+    surname = row["Nachname"]
+    person_alternative_name = row["alternativeName"]
+    description = row["Beschreibung"]
+    character_relevancy = RELEVANCIES.get(row["Rolle"], "")
+    character_fictionality = row["Kategorie"]
+    character_fictionality_degree = FICTIONALITY_DEGREES[character_fictionality]
+    related_work_siglum = row["Sigle"]
+    person_dnb_uri = row["URL_DNB"]
+
+    work_object = row["work"]
+
+    if work_object:
+        character = Character.objects.create(
+            fallback_name=character_name,
+            relevancy=character_relevancy,
+            fictionality=character_fictionality_degree,
+            data_source=data_source,
+        )
+
+        create_triple(
+            entity_subj=work_object,
+            entity_obj=character,
+            prop=index.get_property("features"),
+        )
+
+        if character_fictionality in ("R", "M", "M/R"):
+            person_urls = get_uris(row["uris"])
+            person_uri_objects = [uri for uri in person_urls.values() if uri]
+
+            person = None
+            person_qs = None
+
+            if person_dnb_uri:
+                secure_dnb_uri = secure_urls(person_dnb_uri)
+                try:
+                    person = row["uri_entity"] or Person.get_or_create_uri(
+                        secure_dnb_uri
+                    )
+                except ImproperlyConfigured:
+                    logger.info(
+                        f"Could not create person from uri {secure_dnb_uri}. File: {file_name}. Sheet: {sheet_name}. Entity name: {character_name}"
                     )
 
-                if character_fictionality in ("R", "M", "M/R"):
-                    person_uri_objects = []
-                    for person_uri in person_uris:
-                        if person_uri:
-                            uri = secure_urls(person_uri)
-                            uri_obj, uri_created = Uri.objects.get_or_create(uri=uri)
-                            person_uri_objects.append(uri_obj)
-
-                    person = None
-                    person_qs = None
-
-                    if person_dnb_uri:
-                        secure_dnb_uri = secure_urls(person_dnb_uri)
-                        try:
-                            person = Person.get_or_create_uri(secure_dnb_uri)
-                        except ImproperlyConfigured:
-                            logger.info(
-                                f"Could not create person from uri {secure_dnb_uri}. File: {file_name}. Sheet: {sheet_name}. Entity name: {character_name}"
-                            )
-
-                            person, created = Person.objects.get_or_create(
-                                fallback_name=character_name,
-                                forename=forename,
-                                surname=surname,
-                                defaults={"data_source": data_source},
-                            )
-
-                    else:
-                        person_fallback_name = (
-                            character_name if not (forename or surname) else ""
-                        )
-
-                        if len(person_uri_objects) > 0:
-                            person_qs = Person.objects.filter(
-                                uri__in=[uri.id for uri in person_uri_objects],
-                            )
-                        else:
-                            person_qs = Person.objects.filter(
-                                fallback_name=person_fallback_name,
-                                forename=forename,
-                                surname=surname,
-                            )
-
-                        if person_qs.count() == 0:
-                            person, created = Person.objects.get_or_create(
-                                fallback_name=person_fallback_name,
-                                forename=forename,
-                                surname=surname,
-                                defaults={"data_source": data_source},
-                            )
-                        else:
-                            person = person_qs.first()
-
-                    person.alternative_name = person_alternative_name
-                    person.description = description
-                    person.save()
-
-                    for uri in person_uri_objects:
-                        if not uri.root_object:
-                            uri.root_object = person
-                            uri.save()
-
-                    create_triple(
-                        entity_subj=character,
-                        entity_obj=person,
-                        prop=Property.objects.get(name_forward="is based on"),
+                    person, created = Person.objects.get_or_create(
+                        fallback_name=character_name,
+                        forename=forename,
+                        surname=surname,
+                        defaults={"data_source": data_source},
                     )
-                else:
-                    character.description = description
-                    character.forename = forename
-                    character.surname = surname
-                    character.save()
 
             else:
-                rejection_cause_message = (
-                    f"Work with sigle {related_work_siglum} doesn't exist."
-                    if related_work_siglum
-                    else "No sigle was provided."
-                )
-                logger.info(
-                    f"{rejection_cause_message} Character/Person import was rejected. File: {file_name}. Sheet: {sheet_name}. Entity name: {character_name}"
+                person_fallback_name = (
+                    character_name if not (forename or surname) else ""
                 )
 
-        if sheet_name == "Themen":
-            topic_name = row["Thema"]
-            related_work_siglum = row["Sigle"]
-            topic_alt_name = row["Synonyme"]
+                if len(person_uri_objects) > 0:
+                    person_qs = Person.objects.filter(
+                        uri__in=[uri.id for uri in person_uri_objects],
+                    )
+                else:
+                    person_qs = Person.objects.filter(
+                        fallback_name=person_fallback_name,
+                        forename=forename,
+                        surname=surname,
+                    )
 
-            if work_with_siglum_exists(related_work_siglum):
-                topic, created = Topic.objects.get_or_create(
-                    name=topic_name,
-                    defaults={"data_source": data_source},
-                )
-                topic.alternative_name = topic_alt_name
-                topic.save()
+                if person_qs.count() == 0:
+                    person, created = Person.objects.get_or_create(
+                        fallback_name=person_fallback_name,
+                        forename=forename,
+                        surname=surname,
+                        defaults={"data_source": data_source},
+                    )
+                else:
+                    person = person_qs.first()
+
+            person.alternative_name = person_alternative_name
+            person.description = description
+            person.save()
+
+            link_uris(person_urls, person)
+
+            create_triple(
+                entity_subj=character,
+                entity_obj=person,
+                prop=index.get_property("is based on"),
+            )
+        else:
+            character.description = description
+            character.forename = forename
+            character.surname = surname
+            character.save()
+
+        success.append(character)
+
+    else:
+        rejection_cause_message = (
+            f"Work with sigle {related_work_siglum} doesn't exist."
+            if related_work_siglum
+            else "No sigle was provided."
+        )
+        logger.info(
+            f"{rejection_cause_message} Character/Person import was rejected. File: {file_name}. Sheet: {sheet_name}. Entity name: {character_name}"
+        )
+        failure.append(rejection_cause_message)
 
-                if Work.objects.filter(siglum=related_work_siglum).exists():
-                    work_object = Work.objects.get(siglum=related_work_siglum)
+    return success, failure
 
-                    create_triple(
-                        entity_subj=work_object,
-                        entity_obj=topic,
-                        prop=Property.objects.get(name_forward="is about topic"),
-                    )
 
-            else:
-                rejection_cause_message = (
-                    f"Work with sigle {related_work_siglum} doesn't exist."
-                    if related_work_siglum
-                    else "No sigle was provided."
-                )
-                logger.info(
-                    f"{rejection_cause_message} Topic import was rejected. File: {file_name}. Sheet: {sheet_name}. Entity name: {topic_name}"
-                )
+def import_topic_row(row, index, data_source, file_name, sheet_name):
+    """
+    Import a row of sheet "Themen" as Topic.
 
-        if sheet_name == "Forschungshinsichten":
-            research_perspective_name = row["Thema"]
-            related_work_siglum = row["Sigle"]
-
-            if work_with_siglum_exists(related_work_siglum):
-                (
-                    research_perspective,
-                    created,
-                ) = ResearchPerspective.objects.get_or_create(
-                    name=research_perspective_name,
-                    defaults={"data_source": data_source},
-                )
+    :param row: record of a row of the sheet, see resolve_row()
+    :param index: LookupIndex to look up Properties with
+    :param data_source: DataSource object to link to
+    :param file_name: name of the imported file, used for logging
+    :param sheet_name: name of the imported sheet, used for logging
+    :return: tuple with list of imported items and list of failed items
+    """
+    success = []
+    failure = []
 
-                if Work.objects.filter(siglum=related_work_siglum).exists():
-                    work_object = Work.objects.get(siglum=related_work_siglum)
+    topic_name = row["Thema"]
+    related_work_siglum = row["Sigle"]
+    topic_alt_name = row["Synonyme"]
 
-                    create_triple(
-                        entity_subj=work_object,
-                        entity_obj=research_perspective,
-                        prop=Property.objects.get(
-                            name_forward="applies research perspective"
-                        ),
-                    )
-            else:
-                rejection_cause_message = (
-                    f"Work with sigle {related_work_siglum} doesn't exist."
-                    if related_work_siglum
-                    else "No sigle was provided."
-                )
-                logger.info(
-                    f"{rejection_cause_message} ResearchPerspective import was rejected. File: {file_name}. Sheet: {sheet_name}. Entity name: {research_perspective_name}"
-                )
+    work_object = row["work"]
+
+    if work_object:
+        topic, created = Topic.objects.get_or_create(
+            name=topic_name,
+            defaults={"data_source": data_source},
+        )
+        topic.alternative_name = topic_alt_name
+        topic.save()
+
+        create_triple(
+            entity_subj=work_object,
+            entity_obj=topic,
+            prop=index.get_property("is about topic"),
+        )
+
+        success.append(topic)
+
+    else:
+        rejection_cause_message = (
+            f"Work with sigle {related_work_siglum} doesn't exist."
+            if related_work_siglum
+            else "No sigle was provided."
+        )
+        logger.info(
+            f"{rejection_cause_message} Topic import was rejected. File: {file_name}. Sheet: {sheet_name}. Entity name: {topic_name}"
+        )
+        failure.append(rejection_cause_message)
+
+    return success, failure
+
+
+def import_research_perspective_row(row, index, data_source, file_name, sheet_name):
+    """
+    Import a row of sheet "Forschungshinsichten" as ResearchPerspective.
+
+    :param row: record of a row of the sheet, see resolve_row()
+    :param index: LookupIndex to look up Properties with
+    :param data_source: DataSource object to link to
+    :param file_name: name of the imported file, used for logging
+    :param sheet_name: name of the imported sheet, used for logging
+    :return: tuple with list of imported items and list of failed items
+    """
+    success = []
+    failure = []
+
+    research_perspective_name = row["Thema"]
+    related_work_siglum = row["Sigle"]
+
+    work_object = row["work"]
+
+    if work_object:
+        (
+            research_perspective,
+            created,
+        ) = ResearchPerspective.objects.get_or_create(
+            name=research_perspective_name,
+            defaults={"data_source": data_source},
+        )
+
+        create_triple(
+            entity_subj=work_object,
+            entity_obj=research_perspective,
+            prop=index.get_property("applies research perspective"),
+        )
+
+        success.append(research_perspective)
+    else:
+        rejection_cause_message = (
+            f"Work with sigle {related_work_siglum} doesn't exist."
+            if related_work_siglum
+            else "No sigle was provided."
+        )
+        logger.info(
+            f"{rejection_cause_message} ResearchPerspective import was rejected. File: {file_name}. Sheet: {sheet_name}. Entity name: {research_perspective_name}"
+        )
+        failure.append(rejection_cause_message)
+
+    return success, failure
+
+
+# columns read from the sheets, see parse_entities_excel()
+SHEET_COLUMNS = {
+    "Orte": [
+        "Name_im_Werk",
+        "Sigle",
+        "Kategorie",
+        "Beschreibung",
+        "URL_Geonames",
+        "URL_Wikipedia",
+        "URL_extern",
+    ],
+    "Namen": [
+        "Name",
+        "Vorname",
+        "Nachname",
+        "alternativeName",
+        "Beschreibung",
+        "Rolle",
+        "Kategorie",
+        "Sigle",
+        "URL_DNB",
+        "URL_Wikipedia",
+        "URL_extern",
+    ],
+    "Themen": ["Thema", "Sigle", "Synonyme"],
+    "Forschungshinsichten": ["Thema", "Sigle"],
+}
+
+# sheets whose rows are imported with get_or_create(), so identical rows
+# import the same objects and can be dropped; rows of sheet "Namen" each
+# create a Character, so duplicates are kept
+DEDUPLICATED_SHEETS = ["Orte", "Themen", "Forschungshinsichten"]
+
+# columns with URLs to be linked to the imported entities via Uris
+URI_COLUMNS = {
+    "Orte": ["URL_Wikipedia", "URL_extern"],
+    "Namen": ["URL_Wikipedia", "URL_extern"],
+}
+
+# columns with authority URLs to get or create the imported entities from
+ENTITY_URI_COLUMNS = {
+    "Orte": (Place, "URL_Geonames"),
+    "Namen": (Person, "URL_DNB"),
+}
+
+SHEET_IMPORTERS = {
+    "Orte": import_place_row,
+    "Namen": import_character_row,
+    "Themen": import_topic_row,
+    "Forschungshinsichten": import_research_perspective_row,
+}
@@ -0,0 +1,190 @@
+"""
+Staged pipeline for data imports.
+
+Splits the import of items into three stages:
+
+1. parse: CPU-bound processing of raw items without database access,
+   e.g. of tags, creators or dates; runs on a process pool
+2. resolve: lookup of related objects in the in-memory indexes
+   of a LookupIndex; runs single-threaded
+3. write: database writes, committed in batches of items with one
+   transaction (and checkpoint) per batch
+
+Throughput is measured and reported for every stage.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.db import connections
+
+from .import_helpers import (
+    IMPORT_CHUNK_SIZE,
+    LookupIndex,
+    chunked,
+    commit_in_chunks,
+    skip_to_checkpoint,
+    start_import_run,
+)
+
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_STAGES = ["parse", "resolve", "write"]
+
+
+class StageStats:
+    """
+    Number of processed items and elapsed time of a pipeline stage.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.seconds = 0.0
+
+    def add(self, items, seconds):
+        self.items += items
+        self.seconds += seconds
+
+    @property
+    def rate(self):
+        """
+        :return: throughput in items per second
+        """
+        return self.items / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.name}: {self.items} items in {self.seconds:.2f}s "
+            f"({self.rate:.1f} items/s)"
+        )
+
+
+class ImportPipeline:
+    """
+    Run an import as parse, resolve and write stages.
+
+    :param parse: function which takes a raw item and returns a record;
+                  must be defined at module level (so it can be pickled)
+                  and must not access the database
+    :param resolve: function which takes a record and a LookupIndex and
+                    returns the record with related objects looked up
+    :param write: function which takes a resolved record and a LookupIndex,
+                  writes it to the database and returns a tuple of lists
+                  of successes and failures
+    :param get_key: function returning the key of a record, used for
+                    checkpoints
+    :param get_item_key: function returning the key of a raw item, used
+                         to skip committed items before parsing them when
+                         resuming; defaults to get_key
+    :param run_name: identifier of the import run, used for checkpoints
+    :param batch_size: number of records to write per transaction
+    :param workers: number of processes for the parse stage, defaults to
+                    the number of CPUs; 0 parses in the current process
+    """
+
+    def __init__(
+        self,
+        parse,
+        resolve,
+        write,
+        get_key,
+        run_name: str,
+        batch_size: int = IMPORT_CHUNK_SIZE,
+        workers: int = None,
+        get_item_key=None,
+    ):
+        self.parse = parse
+        self.resolve = resolve
+        self.write = write
+        self.get_key = get_key
+        self.get_item_key = get_item_key or get_key
+        self.run_name = run_name
+        self.batch_size = batch_size
+        self.workers = os.cpu_count() if workers is None else workers
+        self.stats = {stage: StageStats(stage) for stage in PIPELINE_STAGES}
+
+    def run(self, items, resume=False, state=None):
+        """
+        :param items: iterable of raw items
+        :param resume: boolean to continue a previous, incomplete import
+                       after its last checkpoint
+        :param state: dictionary of JSON-serializable values which write
+                      keeps up to date, saved with every checkpoint and
+                      restored on resume, see import_in_chunks()
+        :return: tuple with list of imported items and list of failed items
+                 to use for further processing
+        """
+        run_state, last_key = start_import_run(self.run_name, resume, state)
+        if last_key:
+            # committed items don't need to be parsed again
+            items = skip_to_checkpoint(items, self.get_item_key, last_key)
+
+        records = self.parse_items(items)
+
+        start = time.perf_counter()
+        index = LookupIndex()
+        self.stats["resolve"].add(0, time.perf_counter() - start)
+
+        def resolve_and_write(record):
+            start = time.perf_counter()
+            record = self.resolve(record, index)
+            self.stats["resolve"].add(1, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            result = self.write(record, index)
+            self.stats["write"].add(1, time.perf_counter() - start)
+
+            return result
+
+        success, failure = commit_in_chunks(
+            records,
+            import_item=resolve_and_write,
+            get_key=self.get_key,
+            run_state=run_state,
+            chunk_size=self.batch_size,
+            state=state,
+        )
+
+        self.report()
+
+        return success, failure
+
+    def parse_items(self, items):
+        """
+        Parse raw items lazily, in parallel if more than one worker is
+        available. Only one batch per worker is held in memory at a time.
+
+        :param items: iterable of raw items
+        :return: a generator of records, in the same order as the items
+        """
+        if self.workers < 2:
+            for item in items:
+                start = time.perf_counter()
+                record = self.parse(item)
+                self.stats["parse"].add(1, time.perf_counter() - start)
+                yield record
+            return
+
+        # worker processes are forked (all of them on first use) and must
+        # not reuse the parent process's database connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for chunk in chunked(items, self.batch_size * self.workers):
+                start = time.perf_counter()
+                records = list(
+                    executor.map(
+                        self.parse,
+                        chunk,
+                        chunksize=max(1, len(chunk) // (self.workers * 4)),
+                    )
+                )
+                self.stats["parse"].add(len(records), time.perf_counter() - start)
+                yield from records
+
+    def report(self):
+        for stage in PIPELINE_STAGES:
+            logger.info(f"Import {self.run_name} – {self.stats[stage]}")
@@ -1,43 +1,66 @@
+import logging
 import os
+from functools import partial
 from xml.etree import ElementTree as ETree
 
 import numpy as np
-import pandas as pd
 
 # from django.core.validators import URLValidator
-from apis_core.apis_relations.models import Property
-
 from apis_ontology.models import (
     Archive,
     Person,
     PhysicalObject,
     StatusMixin,
     Work,
-    WorkType,
 )
 from apis_ontology.scripts.access_sharepoint import import_and_parse_data
 
 from .additional_infos import WORK_TYPES
-from .import_helpers import create_source, create_triple
+from .import_helpers import (
+    IMPORT_CHUNK_SIZE,
+    LookupIndex,
+    create_source,
+    create_triple,
+)
+from .import_pipeline import ImportPipeline
+from .utils import read_excel_cached
 
 
+logger = logging.getLogger(__name__)
+
 fname = os.path.basename(__file__)
 
 ns = {"tei": "http://www.tei-c.org/ns/1.0"}
 
 ETree.register_namespace("tei", ns["tei"])
 
+VORLASS_TEI_FILE = "./vorlass_data_frischmuth/06_final_tei_for_apis_import/Frischmuth_Vorlass_FNI-FRISCHMUTH_tei.xml"
+
+# columns of the sigle Excel file used for importing Works
+VORLASS_EXCEL_COLUMNS = [
+    "Name",
+    "abgeleitet von",
+    "Werktyp",
+    "status",
+    "Titel",
+    "Sigle",
+    "Untertitel",
+]
 
-def run():
-    import_and_parse_data(parse_sigle_excel)
+
+def run(resume=False, chunk_size=IMPORT_CHUNK_SIZE, engine="serial", force=False):
+    import_and_parse_data(
+        partial(parse_sigle_excel, resume=resume, chunk_size=chunk_size, engine=engine),
+        force=force,
+    )
 
 
-def parse_sigle_excel(file):
+def parse_sigle_excel(
+    file, resume=False, chunk_size=IMPORT_CHUNK_SIZE, engine="serial"
+):
     title_siglum_dict = {}
-    success = []
-    failure = []
 
-    df = pd.read_excel(file)
+    df = read_excel_cached(file, usecols=VORLASS_EXCEL_COLUMNS, dtype=str)
 
     vorlass_excel_source, created = create_source(
         name="VorlassSourceExcel", file_name=os.path.basename(file), data_type="xslx"
@@ -51,8 +74,13 @@ def parse_sigle_excel(file):
 
     for index, row in df_cleaned.iterrows():
         title_siglum_dict[row["Name"] + row["abgeleitet von"]] = row.to_dict()
-    parse_vorlass_xml(title_siglum_dict, vorlass_excel_source)
-    return success, failure
+    return parse_vorlass_xml(
+        title_siglum_dict,
+        vorlass_excel_source,
+        resume=resume,
+        chunk_size=chunk_size,
+        engine=engine,
+    )
 
 
 def get_status(status):
@@ -62,7 +90,29 @@ def get_status(status):
     return status_choices.get(status, "")
 
 
-def parse_vorlass_xml(title_siglum_dict, vorlass_excel_source):
+def parse_vorlass_xml(
+    title_siglum_dict,
+    vorlass_excel_source,
+    resume=False,
+    chunk_size=IMPORT_CHUNK_SIZE,
+    engine="serial",
+    tei_file=VORLASS_TEI_FILE,
+):
+    """
+    Import Works and PhysicalObjects from the Vorlass TEI file.
+
+    :param title_siglum_dict: dictionary of Excel rows with Work data,
+                              keyed by title and notes of a bibl
+    :param vorlass_excel_source: DataSource object to link Works to
+    :param resume: boolean to continue a previous, incomplete import
+                   after its last checkpoint (only with engine "pipeline")
+    :param chunk_size: number of bibls to commit per transaction
+                       (only with engine "pipeline")
+    :param engine: "serial" to import bibls one by one, "pipeline" to
+                   import them in parse, resolve and write stages
+    :param tei_file: path to the TEI file
+    :return: tuple with list of imported Works and list of failures
+    """
     b_fr = Person.objects.filter(forename="Barbara", surname="Frischmuth").exclude(
         data_source=None
     )[0]
@@ -70,13 +120,8 @@ def parse_vorlass_xml(title_siglum_dict, vorlass_excel_source):
         0
     ]
 
-    with open(
-        "./vorlass_data_frischmuth/06_final_tei_for_apis_import/Frischmuth_Vorlass_FNI-FRISCHMUTH_tei.xml",
-        "r",
-        encoding="utf-8",
-    ) as file_obj:
-        tree = ETree.parse(file_obj)
-        items = tree.findall(".//tei:bibl", ns)
+    with open(tei_file, "r", encoding="utf-8") as file_obj:
+        items = iter_bibls(file_obj)
 
         vorlass_xml_source, created = create_source(
             name="VorlassSourceXML",
@@ -84,127 +129,274 @@ def parse_vorlass_xml(title_siglum_dict, vorlass_excel_source):
             data_type="xslx",
         )
 
-        for workelem in items:
-            title = get_text_by_elementpath(workelem, "./tei:title[@type='main']", ns)
-            notes = "docx pointer: " + get_text_by_elementpath(
-                workelem, "./tei:note[@type='category']", ns
+        # bibls without matching Excel row add their physical objects
+        # to the last previously imported Work, whose ID is kept in the
+        # checkpointed state so resumed imports can restore it
+        context = {
+            "author": b_fr,
+            "archive": archive,
+            "excel_source": vorlass_excel_source,
+            "xml_source": vorlass_xml_source,
+            "work": None,
+            "state": {},
+        }
+        resolve = partial(resolve_bibl, title_siglum_dict=title_siglum_dict)
+        write = partial(write_bibl, context=context)
+
+        if engine == "pipeline":
+            # elements can't be passed to worker processes efficiently,
+            # so the parse stage runs in the current process
+            pipeline = ImportPipeline(
+                parse=parse_bibl,
+                resolve=resolve,
+                write=write,
+                get_key=lambda record: record["position"],
+                run_name=os.path.basename(file_obj.name),
+                batch_size=chunk_size,
+                workers=0,
+                get_item_key=lambda position_element: position_element[0],
             )
+            return pipeline.run(enumerate(items), resume=resume, state=context["state"])
+
+        success = []
+        failure = []
+        index = LookupIndex()
+        for position_element in enumerate(items):
+            imported, failed = write(
+                resolve(parse_bibl(position_element), index), index
+            )
+            success.extend(imported)
+            failure.extend(failed)
+
+        return success, failure
+
 
-            if (
-                get_text_by_elementpath(workelem, "./tei:note[@type='category']", ns)
-                != title
-            ):
-                notes = (
-                    notes
-                    + " --- "
-                    + get_text_by_elementpath(
-                        workelem, "./tei:note[@type='unmodified_title']", ns
-                    )
-                )
-            if (
-                get_text_by_elementpath(
-                    workelem, "./tei:note[@type='category']", ns
-                ).split(" --- ")[0]
-                in ("Werke", "Sammlungen")
-                and title + notes in title_siglum_dict
-            ):
-                siglum = title_siglum_dict[title + notes]["Sigle"]
-                work_type = title_siglum_dict[title + notes]["Werktyp"]
-                status = get_status(title_siglum_dict[title + notes]["status"])
-                fixed_title = title_siglum_dict[title + notes]["Titel"]
-                subtitle = title_siglum_dict[title + notes]["Untertitel"] or ""
-
-                work, created = Work.objects.get_or_create(
-                    title=fixed_title,
-                    siglum=siglum,
-                    progress_status=status,
-                    subtitle=subtitle,
-                    notes=workelem.attrib.get("corresp", ""),
-                    defaults={"data_source": vorlass_excel_source},
-                )
-                create_triple(
-                    entity_subj=b_fr,
-                    entity_obj=work,
-                    prop=Property.objects.get(name_forward="is author of"),
-                )
-                """work_type_key_name = WORKTYPE_MAPPINGS.get(
-                    workelem.attrib.get("category")
-                )"""
-
-                if work_type:
-                    work_type = WorkType.objects.get(
-                        name=WORK_TYPES.get(
-                            work_type.replace("type_", "").replace(" ", "")
-                        )["german_label"]
-                    )
-
-                    create_triple(
-                        entity_subj=work,
-                        entity_obj=work_type,
-                        prop=Property.objects.get(name_forward="has type"),
-                    )
-
-                for physical_object in workelem.findall(
-                    "./tei:note[@type='objects']/tei:listObject/tei:object", ns
-                ):
-                    create_physical_object(
-                        physical_object, ns, work, archive, vorlass_xml_source
-                    )
-
-            else:
-                for physical_object in workelem.findall(
-                    "./tei:note[@type='objects']/tei:listObject/tei:object", ns
-                ):
-                    create_physical_object(
-                        physical_object, ns, work, archive, vorlass_xml_source, None
-                    )
+def iter_bibls(file_obj):
+    """
+    Stream the bibl elements of a TEI file in document order.
+
+    Elements are yielded as soon as they are parsed completely and
+    removed from the tree once processed, so memory use doesn't grow
+    with the size of the file.
+
+    :param file_obj: file object of the TEI file
+    :return: a generator of bibl elements
+    """
+    bibl_tag = f"{{{ns['tei']}}}bibl"
+    parents = []
+
+    for event, element in ETree.iterparse(file_obj, events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            continue
+
+        parents.pop()
+        if element.tag != bibl_tag or any(p.tag == bibl_tag for p in parents):
+            # nested bibls are yielded along with their outermost bibl
+            continue
+
+        yield element
+        yield from element.findall(".//tei:bibl", ns)
+
+        if parents:
+            parents[-1].remove(element)
+        element.clear()
+
+
+def parse_bibl(position_element):
+    """
+    Extract the data of a bibl element.
+
+    :param position_element: tuple of position and bibl element
+    :return: dictionary with the bibl's data and its physical objects
+    """
+    position, workelem = position_element
+
+    title = get_text_by_elementpath(workelem, "./tei:title[@type='main']", ns)
+    category = get_text_by_elementpath(workelem, "./tei:note[@type='category']", ns)
+    notes = "docx pointer: " + category
+
+    if category != title:
+        notes = (
+            notes
+            + " --- "
+            + get_text_by_elementpath(
+                workelem, "./tei:note[@type='unmodified_title']", ns
+            )
+        )
+
+    return {
+        "position": position,
+        "title": title,
+        "notes": notes,
+        "category": category.split(" --- ")[0],
+        "corresp": workelem.attrib.get("corresp", ""),
+        "physical_objects": [
+            parse_physical_object(physical_object)
+            for physical_object in workelem.findall(
+                "./tei:note[@type='objects']/tei:listObject/tei:object", ns
+            )
+        ],
+    }
+
+
+def resolve_bibl(record, index, title_siglum_dict):
+    """
+    Look up the Excel row and WorkType for the Work described by a bibl.
+
+    :param record: dictionary returned by parse_bibl()
+    :param index: LookupIndex to look up WorkTypes with
+    :param title_siglum_dict: dictionary of Excel rows with Work data
+    :return: the record with the Excel row as "work_data" and the
+             WorkType as "work_type", both None if not applicable
+    """
+    record["work_data"] = None
+    record["work_type"] = None
+
+    if record["category"] in ("Werke", "Sammlungen"):
+        record["work_data"] = title_siglum_dict.get(
+            record["title"] + record["notes"], None
+        )
+
+    if record["work_data"] and record["work_data"]["Werktyp"]:
+        work_type = record["work_data"]["Werktyp"]
+        record["work_type"] = index.get_type(
+            WORK_TYPES.get(work_type.replace("type_", "").replace(" ", ""))[
+                "german_label"
+            ]
+        )
+
+    return record
+
+
+def write_bibl(record, index, context):
+    """
+    Create the Work and PhysicalObjects described by a bibl.
+
+    :param record: dictionary returned by resolve_bibl()
+    :param index: LookupIndex to look up Properties with
+    :param context: dictionary with the author, archive and DataSource
+                    objects to link to as well as the last imported Work
+                    and the import's checkpointed state
+    :return: tuple with list of imported Works and list of failures
+    """
+    success = []
+    failure = []
+    work_data = record["work_data"]
+
+    if work_data:
+        work, created = Work.objects.get_or_create(
+            title=work_data["Titel"],
+            siglum=work_data["Sigle"],
+            progress_status=get_status(work_data["status"]),
+            subtitle=work_data["Untertitel"] or "",
+            notes=record["corresp"],
+            defaults={"data_source": context["excel_source"]},
+        )
+        create_triple(
+            entity_subj=context["author"],
+            entity_obj=work,
+            prop=index.get_property("is author of"),
+        )
+
+        if record["work_type"]:
+            create_triple(
+                entity_subj=work,
+                entity_obj=record["work_type"],
+                prop=index.get_property("has type"),
+            )
+
+        context["work"] = work
+        context["state"]["work_id"] = work.id
+        success.append(work)
+
+    if record["physical_objects"] and context["work"] is None:
+        if work_id := context["state"].get("work_id"):
+            # resumed import, the Work was imported before the checkpoint
+            context["work"] = Work.objects.get(pk=work_id)
+        else:
+            message = (
+                f"No Work to relate physical objects of bibl {record['position']} to."
+            )
+            logger.warning(message)
+            failure.append(message)
+            return success, failure
+
+    for physical_object in record["physical_objects"]:
+        create_physical_object(
+            physical_object,
+            context["work"],
+            context["archive"],
+            context["xml_source"],
+            index,
+        )
+
+    return success, failure
 
 
 def get_text_by_elementpath(element, path, ns):
     """Helper function to get a cleaned string from an xml-element (as used in the auxiliary files)"""
     # strip because import data isn't clean (leading, trailing spaces)
     node_text = ""
-    if element and element.find(path, ns) is not None:
-        node_text = " ".join(
-            " ".join(element.find(path, ns).text.strip().splitlines()).split()
-        )
+    node = element.find(path, ns) if element is not None and len(element) else None
+    if node is not None:
+        node_text = " ".join(node.text.split())
     return node_text
 
 
+def parse_physical_object(element):
+    """
+    Extract the data of an object element and its nested objects.
+
+    :param element: object element
+    :return: dictionary with the object's data
+    """
+    children = []
+    if element.find("./tei:note[@type='objects']/tei:listObject", ns):
+        children = [
+            parse_physical_object(el)
+            for el in element.findall(
+                "./tei:note[@type='objects']/tei:listObject//tei:object", ns
+            )
+        ]
+
+    return {
+        "name": get_text_by_elementpath(
+            element, "./tei:objectIdentifier/tei:objectName", ns
+        ),
+        "description": get_text_by_elementpath(element, "./tei:physDesc/tei:p", ns),
+        "docx_reference": get_text_by_elementpath(
+            element, "./tei:note[@type='docx_anchor']", ns
+        ),
+        "children": children,
+    }
+
+
 def create_physical_object(
-    element, ns, related_work, archive, data_source, physical_object_parent=None
+    record, related_work, archive, data_source, index, physical_object_parent=None
 ):
-    name = get_text_by_elementpath(element, "./tei:objectIdentifier/tei:objectName", ns)
-    description = get_text_by_elementpath(element, "./tei:physDesc/tei:p", ns)
-    docx_reference = get_text_by_elementpath(
-        element, "./tei:note[@type='docx_anchor']", ns
-    )
-
     pho = PhysicalObject.objects.create(
-        name=name,
-        description=description,
-        vorlass_doc_reference=docx_reference,
+        name=record["name"],
+        description=record["description"],
+        vorlass_doc_reference=record["docx_reference"],
         data_source=data_source,
     )
     create_triple(
         entity_subj=pho,
         entity_obj=related_work,
-        prop=Property.objects.get(name_forward="relates to"),
+        prop=index.get_property("relates to"),
     )
     create_triple(
         entity_subj=archive,
         entity_obj=pho,
-        prop=Property.objects.get(name_forward="holds"),
+        prop=index.get_property("holds"),
     )
     if physical_object_parent:
         create_triple(
             entity_subj=physical_object_parent,
             entity_obj=pho,
-            prop=Property.objects.get(name_forward="holds or supports"),
+            prop=index.get_property("holds or supports"),
         )
 
-    if element.find("./tei:note[@type='objects']/tei:listObject", ns):
-        for el in element.findall(
-            "./tei:note[@type='objects']/tei:listObject//tei:object", ns
-        ):
-            create_physical_object(el, ns, related_work, archive, data_source, pho)
+    for child in record["children"]:
+        create_physical_object(child, related_work, archive, data_source, index, pho)
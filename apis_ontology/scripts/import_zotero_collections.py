@@ -3,16 +3,18 @@ import importlib
 import logging
 import os
 import re
+from functools import partial
 
-from apis_core.apis_relations.models import Property
 from django.core.management.base import BaseCommand
-from django.db.models import Q
 from pyzotero import zotero, zotero_errors
 
+from apis_ontology.dates import parse_publication_date
 from apis_ontology.models import Expression, Work
 
 from .additional_infos import WORK_TYPES, ZOTERO_CREATORS_MAPPING
 from .import_helpers import (
+    IMPORT_CHUNK_SIZE,
+    LookupIndex,
     create_expression,
     create_organisation,
     create_person,
@@ -22,9 +24,9 @@ from .import_helpers import (
     create_triple,
     create_work,
     get_expressions_by_work,
-    get_type,
-    get_work,
+    import_in_chunks,
 )
+from .import_pipeline import ImportPipeline
 from .utils import clean_and_split_multivalue_string, get_entity_view_url
 
 
@@ -45,12 +47,19 @@ class Command(BaseCommand):
         script.run()
 
 
-def run():
+def run(resume=False, chunk_size=IMPORT_CHUNK_SIZE, engine="serial"):
     zot = zotero_login()
 
     coll_id, coll = input_dialog(zot)
 
-    imported, failed = import_work_collections(zot, coll_id, include_subs=True)
+    imported, failed = import_work_collections(
+        zot,
+        coll_id,
+        include_subs=True,
+        resume=resume,
+        chunk_size=chunk_size,
+        engine=engine,
+    )
 
     for i in imported:
         # TODO log successful imports
@@ -61,7 +70,14 @@ def run():
         pass
 
 
-def import_work_collections(zot, coll_id, include_subs=True):
+def import_work_collections(
+    zot,
+    coll_id,
+    include_subs=True,
+    resume=False,
+    chunk_size=IMPORT_CHUNK_SIZE,
+    engine="serial",
+):
     """
     For regular import of works – both primary (by Frischmuth) and secondary
     (other authors).
@@ -74,6 +90,10 @@ def import_work_collections(zot, coll_id, include_subs=True):
     :param coll_id: collection to import
     :param include_subs: boolean to include/exclude sub collections;
                          ATTN. currently only works one level deep
+    :param resume: boolean to continue a previous, incomplete import
+                   after its last checkpoint
+    :param chunk_size: number of items to commit per transaction
+    :param engine: "serial" or "pipeline", see import_items()
     :return: tuple with list of imported items and list of failed items
              to use for further processing
     """
@@ -101,7 +121,13 @@ def import_work_collections(zot, coll_id, include_subs=True):
 
             for coll_id in sub_ids:
                 imported, failed = import_items_from_collection(
-                    zot, coll_id, include_subs=True, import_name=collection_data["name"]
+                    zot,
+                    coll_id,
+                    include_subs=True,
+                    import_name=collection_data["name"],
+                    resume=resume,
+                    chunk_size=chunk_size,
+                    engine=engine,
                 )
                 success.append(imported)
                 failure.append(failed)
@@ -138,14 +164,12 @@ def zotero_login():
         zot.key_info()
     except zotero_errors.UserNotAuthorised:
         print(
-            f"Zotero login not possible: "
-            f"{zot.request.text} ({zot.request.status_code})"
+            f"Zotero login not possible: {zot.request.text} ({zot.request.status_code})"
         )
         exit(1)
     except zotero_errors.HTTPError:
         print(
-            f"Zotero login not possible: "
-            f"{zot.request.text} ({zot.request.status_code})"
+            f"Zotero login not possible: {zot.request.text} ({zot.request.status_code})"
         )
         exit(1)
     else:
@@ -286,7 +310,15 @@ def generate_input_choices(collections, extra_choices=None):
     return choices
 
 
-def import_items_from_collection(zot, coll_key, include_subs=True, import_name=None):
+def import_items_from_collection(
+    zot,
+    coll_key,
+    include_subs=True,
+    import_name=None,
+    resume=False,
+    chunk_size=IMPORT_CHUNK_SIZE,
+    engine="serial",
+):
     """
     Import collection items from a given Zotero collection.
 
@@ -295,20 +327,51 @@ def import_items_from_collection(zot, coll_key, include_subs=True, import_name=N
     :param include_subs: boolean to include/exclude sub collections;
                          ATTN. currently only works one level deep
     :param import_name: string to use for import name
+    :param resume: boolean to continue a previous, incomplete import
+                   after its last checkpoint
+    :param chunk_size: number of items to commit per transaction
+    :param engine: "serial" or "pipeline", see import_items()
     :return: tuple with list of imported items and list of failed items
              to use for further processing
     """
     collection_data = get_collection_data(zot, coll_key, include_subs=include_subs)
 
-    success, failure = import_items(collection_data["items"], import_name)
+    success, failure = import_items(
+        collection_data["items"],
+        import_name,
+        run_name=f"Zotero_{coll_key}",
+        resume=resume,
+        chunk_size=chunk_size,
+        engine=engine,
+    )
 
     return success, failure
 
 
-def import_items(collection_items, import_name):
+def import_items(
+    collection_items,
+    import_name,
+    run_name=None,
+    resume=False,
+    chunk_size=IMPORT_CHUNK_SIZE,
+    engine="serial",
+):
     """
+    Import Zotero items in chunks of items, each of which is committed
+    in a single transaction. The key of the last item of every chunk
+    is kept as a checkpoint from which an incomplete import can resume.
+
+    With engine "pipeline", items are parsed on a process pool first,
+    see ImportPipeline.
+
     :param collection_items: list of Zotero items to import
     :param import_name: name to use for DataSource for entity objects
+    :param run_name: identifier for checkpoints, defaults to import_name
+    :param resume: boolean to continue a previous, incomplete import
+                   after its last checkpoint
+    :param chunk_size: number of items to commit per transaction
+    :param engine: "serial" to import items one by one, "pipeline" to
+                   import them in parse, resolve and write stages
     :return: tuple with list of imported items and list of failed items
              to use for further processing
     """
@@ -319,10 +382,27 @@ def import_items(collection_items, import_name):
     importable, non_importable = get_valid_collection_items(collection_items)
 
     if importable:
-        for i in importable:
-            creation_success, creation_problems = create_entities(i, source)
-            success.extend(creation_success)
-            failure.extend(creation_problems)
+        if engine == "pipeline":
+            pipeline = ImportPipeline(
+                parse=parse_item,
+                resolve=resolve_item,
+                write=partial(write_entities, source=source),
+                get_key=lambda data: data["key"],
+                run_name=run_name or import_name,
+                batch_size=chunk_size,
+            )
+            success, failure = pipeline.run(importable, resume=resume)
+        else:
+            success, failure = import_in_chunks(
+                importable,
+                import_item=partial(
+                    create_entities, source=source, index=LookupIndex()
+                ),
+                get_key=lambda item: item["key"],
+                run_name=run_name or import_name,
+                chunk_size=chunk_size,
+                resume=resume,
+            )
 
     failure.extend(non_importable)
 
@@ -604,77 +684,152 @@ def add_collection(entity, collection):
     entity.collection.add(collection)
 
 
-def create_entities(item, source):
+def create_entities(item, source, index=None):
     """
     Create entities from Zotero items.
+
+    :param item: Zotero item
+    :param source: DataSource object to link to
+    :param index: LookupIndex to resolve related objects with; gets
+                  created if not provided
+    :return: tuple with list of imported items and list of failed items
     """
-    success = []
-    failure = []
+    if not index:
+        index = LookupIndex()
+
+    return write_entities(resolve_item(parse_item(item), index), index, source)
 
+
+def parse_item(item):
+    """
+    Extract the data relevant for the import from a Zotero item,
+    e.g. parse its tags, creators and publication date.
+
+    Does not access the database, so it can be used in the parse stage
+    of an ImportPipeline.
+
+    :param item: Zotero item
+    :return: a dictionary holding the parsed data
+    """
     item_data = {}
     for k, v in item["data"].items():
         if isinstance(v, str):
             v = v.strip()
         item_data[k] = v
 
-    title = item_data["title"]
-    siglum = item_data["callNumber"]
-    item_type = item_data["itemType"]
-    subtitle = item_data.get("shortTitle", None)
-    abstract = item_data.get("abstractNote", None)
-    num_pages = item_data.get("numPages", None)
-    relevant_pages = item_data.get("pages", "")
-    item_date = item_data.get("date", None)
-    languages = clean_and_split_multivalue_string(item_data.get("language", ""), ";")
-    isbn = item_data.get("ISBN", "")
-    places_of_publication = clean_and_split_multivalue_string(
-        item_data.get("place", ""), ";"
-    )
-    publisher = item_data.get("publisher", None)
     creators = item_data.get("creators", [])
     item_tags = item_data.get("tags", [])
-    series = item_data.get("series", "")
-    publication_title = item_data.get("publicationTitle", "")
-    issue = item_data.get("seriesNumber", item_data.get("issue", ""))
-    volume = item_data.get("volume", "")
-    edition = item_data.get("edition", "")
-    creators_with_props = []
-    edition_types = []
-    work_types = []
-    work_refs = []
-    topics = []
-    expr_refs = []
-    page_count = None
-    item_note = item.get("enriched", {}).get("note", None)
+    num_pages = item_data.get("numPages", None)
+    item_date = item_data.get("date", None)
+
+    data = {
+        "key": item["key"],
+        "title": item_data["title"],
+        "siglum": item_data["callNumber"],
+        "item_type": item_data["itemType"],
+        "subtitle": item_data.get("shortTitle", None),
+        "abstract": item_data.get("abstractNote", None),
+        "relevant_pages": item_data.get("pages", ""),
+        "languages": clean_and_split_multivalue_string(
+            item_data.get("language", ""), ";"
+        ),
+        "isbn": item_data.get("ISBN", ""),
+        "places_of_publication": clean_and_split_multivalue_string(
+            item_data.get("place", ""), ";"
+        ),
+        "publisher": item_data.get("publisher", None),
+        "series": item_data.get("series", ""),
+        "publication_title": item_data.get("publicationTitle", ""),
+        "issue": item_data.get("seriesNumber", item_data.get("issue", "")),
+        "volume": item_data.get("volume", ""),
+        "edition": item_data.get("edition", ""),
+        "creators_with_props": [],
+        "edition_types": [],
+        "work_types": [],
+        "work_refs": [],
+        "topics": [],
+        "expr_refs": [],
+        "page_count": None,
+        "item_note": item.get("enriched", {}).get("note", None),
+        "pub_date": item_date,
+        "parsed_pub_date": parse_publication_date(item_date) if item_date else None,
+    }
 
     if creators:
-        creators_with_props = match_creator_types(creators)
+        data["creators_with_props"] = match_creator_types(creators)
 
     if item_tags:
         tags = [i["tag"].strip() for i in item_tags if "tag" in i]
         if tags:
-            edition_types = get_edition_types_from_tags(
+            data["edition_types"] = get_edition_types_from_tags(
                 [t for t in tags if t.endswith("ausgabe")]
             )
-            work_refs = get_work_references_fom_tags(
+            data["work_refs"] = get_work_references_fom_tags(
                 [t for t in tags if t.startswith("work_")]
             )
-            expr_refs = get_expression_references_fom_tags(
+            data["expr_refs"] = get_expression_references_fom_tags(
                 [t for t in tags if t.startswith("expression_")]
             )
-            work_types = get_work_types_from_tags(
+            data["work_types"] = get_work_types_from_tags(
                 [t for t in tags if t.startswith("type_")]
             )
-            topics = [t.replace("topic_", "") for t in tags if t.startswith("topic_")]
+            data["topics"] = [
+                t.replace("topic_", "") for t in tags if t.startswith("topic_")
+            ]
 
-    pub_date = item_date
     if num_pages:
         pages = int(re.sub("[^0-9]", "", num_pages))
         if pages > 0:
-            page_count = pages
+            data["page_count"] = pages
+
+    return data
+
+
+def resolve_item(data, index):
+    """
+    Look up existing objects related to parsed Zotero item data.
+
+    :param data: dictionary returned by parse_item()
+    :param index: LookupIndex to resolve related objects with
+    :return: the dictionary, extended by the resolved objects
+    """
+    data["work"] = index.get_work(data["siglum"])
+    data["work_type_objects"] = [
+        index.get_type(t["german_label"]) for t in data["work_types"]
+    ]
+    data["referenced_works"] = {
+        r["ref_siglum"]: index.get_work(r["ref_siglum"])
+        for r in data["work_refs"] + data["expr_refs"]
+    }
+
+    return data
+
+
+def write_entities(data, index, source):
+    """
+    Create entities and triples from resolved Zotero item data.
+
+    :param data: dictionary returned by resolve_item()
+    :param index: LookupIndex to look up Properties with and to add
+                  newly created Works to
+    :param source: DataSource object to link to
+    :return: tuple with list of imported items and list of failed items
+    """
+    success = []
+    failure = []
+
+    title = data["title"]
+    siglum = data["siglum"]
+    subtitle = data["subtitle"]
+    abstract = data["abstract"]
+    languages = data["languages"]
 
     # get or create Work object
-    work, created = create_work(title, subtitle, siglum, source)
+    if data["work"]:
+        work, created = data["work"], False
+    else:
+        work, created = create_work(title, subtitle, siglum, source)
+        index.add_work(work)
     # if abstract contains text, we overwrite the existing one
     if abstract:
         work.summary = abstract
@@ -687,26 +842,32 @@ def create_entities(item, source):
     if created:
         success.append(work)
 
-        if work_types:
-            # create triple for work type
-            for t in work_types:
-                work_type = get_type(t["german_label"])
-
-                triple, created = create_triple(
-                    entity_subj=work,
-                    entity_obj=work_type,
-                    prop=Property.objects.get(name_forward="has type"),
+        # create triple for work type
+        for work_type in data["work_type_objects"]:
+            triple, created = create_triple(
+                entity_subj=work,
+                entity_obj=work_type,
+                prop=index.get_property("has type"),
+            )
+            if created:
+                success.append(
+                    f"Created new triple: {triple.subj} – {triple.prop.name_forward} – {triple.obj}"
                 )
-                if created:
-                    success.append(
-                        f"Created new triple: {triple.subj} – {triple.prop.name_forward} – {triple.obj}"
-                    )
 
     # get or create Expression object
     expression, created = create_expression(
-        title, subtitle, pub_date, source, relevant_pages, page_count, edition_types
+        title,
+        subtitle,
+        data["pub_date"],
+        source,
+        data["relevant_pages"],
+        data["page_count"],
+        data["edition_types"],
+        parsed_pub_date=data["parsed_pub_date"],
     )
     if created:
+        isbn = data["isbn"]
+        item_note = data["item_note"]
         if isbn:
             expression.isbn = isbn
             expression.save()
@@ -729,7 +890,7 @@ def create_entities(item, source):
     triple, created = create_triple(
         entity_subj=work,
         entity_obj=expression,
-        prop=Property.objects.get(name_forward="is realised in"),
+        prop=index.get_property("is realised in"),
     )
     if created:
         success.append(
@@ -737,18 +898,16 @@ def create_entities(item, source):
         )
 
     # create relations between Works when tags for Zotero item indicate relation
-    for r in work_refs:
+    for r in data["work_refs"]:
         ref_siglum = r["ref_siglum"]
         ref_label = r["ref_label"]
 
-        referenced_work = get_work(ref_siglum)
+        referenced_work = data["referenced_works"][ref_siglum]
 
         if referenced_work:
             success.append(referenced_work)
 
-            ref_prop = Property.objects.filter(
-                Q(name_forward=ref_label) | Q(name_reverse=ref_label)
-            ).first()
+            ref_prop = index.find_property(ref_label)
 
             entity_subj = (
                 work if ref_prop.name_forward == ref_label else referenced_work
@@ -770,11 +929,11 @@ def create_entities(item, source):
             failure.append(ref_err)
             logger.info(f"Referenced work {ref_siglum} does not exist.")
 
-    for r in expr_refs:
+    for r in data["expr_refs"]:
         ref_siglum = r["ref_siglum"]
         ref_label = r["ref_label"]
 
-        referenced_work = get_work(ref_siglum)
+        referenced_work = data["referenced_works"][ref_siglum]
         if referenced_work:
             work_expressions = get_expressions_by_work(referenced_work.id)
 
@@ -794,7 +953,7 @@ def create_entities(item, source):
                 create_triple(
                     entity_subj=referenced_work,
                     entity_obj=exp,
-                    prop=Property.objects.get(name_forward="is realised in"),
+                    prop=index.get_property("is realised in"),
                 )
                 work_expressions.append(exp)
 
@@ -802,7 +961,7 @@ def create_entities(item, source):
                 triple, created = create_triple(
                     entity_subj=expression,
                     entity_obj=work_expression,
-                    prop=Property.objects.get(name_forward=ref_label),
+                    prop=index.get_property(ref_label),
                 )
                 if created:
                     success.append(
@@ -813,9 +972,9 @@ def create_entities(item, source):
             ref_err = f"Referenced work {ref_siglum} does not exist."
             failure.append(ref_err)
 
-    if creators_with_props:
+    if data["creators_with_props"]:
         # get or create Person object for creators
-        for creator in creators_with_props:
+        for creator in data["creators_with_props"]:
             person, created = create_person(creator, source)
             if created:
                 success.append(f"Created author: {person}")
@@ -823,7 +982,7 @@ def create_entities(item, source):
             triple, created = create_triple(
                 entity_subj=person,
                 entity_obj=work,
-                prop=Property.objects.get(name_forward=creator["property_name"]),
+                prop=index.get_property(creator["property_name"]),
             )
             if created:
                 success.append(
@@ -834,7 +993,7 @@ def create_entities(item, source):
                 triple, created = create_triple(
                     entity_subj=person,
                     entity_obj=expression,
-                    prop=Property.objects.get(name_forward=creator["property_name"]),
+                    prop=index.get_property(creator["property_name"]),
                 )
                 if created:
                     success.append(
@@ -844,9 +1003,9 @@ def create_entities(item, source):
         ref_err = f"Work {siglum} is missing creators."
         failure.append(ref_err)
 
-    if publisher:
+    if data["publisher"]:
         # get or create Organisation object for publisher
-        organisation, created = create_organisation(publisher, source)
+        organisation, created = create_organisation(data["publisher"], source)
 
         if created:
             success.append(organisation)
@@ -854,7 +1013,7 @@ def create_entities(item, source):
         triple, created = create_triple(
             entity_subj=organisation,
             entity_obj=expression,
-            prop=Property.objects.get(name_forward="is publisher of"),
+            prop=index.get_property("is publisher of"),
         )
         if created:
             success.append(
@@ -864,23 +1023,22 @@ def create_entities(item, source):
         # get or create Place object for place of publication
         # ATTN. Zotero "place" field can contain multiple places
         # separated by semicolons
-        if places_of_publication:
-            for p in places_of_publication:
-                place, created = create_place(p, source)
-                if created:
-                    success.append(f"Created place: {place}")
+        for p in data["places_of_publication"]:
+            place, created = create_place(p, source)
+            if created:
+                success.append(f"Created place: {place}")
 
-                triple, created = create_triple(
-                    entity_subj=expression,
-                    entity_obj=place,
-                    prop=Property.objects.get(name_forward="is published in"),
+            triple, created = create_triple(
+                entity_subj=expression,
+                entity_obj=place,
+                prop=index.get_property("is published in"),
+            )
+            if created:
+                success.append(
+                    f"Created new triple: {triple.subj} – {triple.prop.name_forward} – {triple.obj}"
                 )
-                if created:
-                    success.append(
-                        f"Created new triple: {triple.subj} – {triple.prop.name_forward} – {triple.obj}"
-                    )
     # get or create topics and relations between work and topics
-    for topic in topics:
+    for topic in data["topics"]:
         topic, created = create_topic(topic_name=topic, source=source)
         if created:
             success.append(f"Created topic: {topic}")
@@ -888,14 +1046,24 @@ def create_entities(item, source):
         triple, created = create_triple(
             entity_subj=work,
             entity_obj=topic,
-            prop=Property.objects.get(name_forward="is about topic"),
+            prop=index.get_property("is about topic"),
         )
         if created:
             success.append(
                 f"Created new triple: {triple.subj} – {triple.prop.name_forward} – {triple.obj}"
             )
 
-    if item_type in ("dictionaryEntry", "newspaperArticle", "journalArticle", "book"):
+    if data["item_type"] in (
+        "dictionaryEntry",
+        "newspaperArticle",
+        "journalArticle",
+        "book",
+    ):
+        series = data["series"]
+        publication_title = data["publication_title"]
+        issue = data["issue"]
+        volume = data["volume"]
+        edition = data["edition"]
         parent_publication = None
         parent_expression = None
         if series:
@@ -924,12 +1092,12 @@ def create_entities(item, source):
             parent_parent_triple, created = create_triple(
                 entity_subj=parent_publication,
                 entity_obj=parent_expression,
-                prop=Property.objects.get(name_forward="is realised in"),
+                prop=index.get_property("is realised in"),
             )
             parent_child_triple, created = create_triple(
                 entity_subj=expression,
                 entity_obj=parent_expression,
-                prop=Property.objects.get(name_forward="is realised in"),
+                prop=index.get_property("is realised in"),
             )
 
     return success, failure
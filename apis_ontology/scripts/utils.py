@@ -2,11 +2,24 @@
 Helper functions useful for various data import scripts.
 """
 
+import argparse
 import datetime
+import glob
+import hashlib
+import json
+import logging
+import os
 
 from ..settings import APIS_BASE_URI
 
 
+logger = logging.getLogger(__name__)
+
+# directory of sheets of Excel files cached by read_excel_cached()
+EXCEL_CACHE_DIR = os.getenv("EXCEL_CACHE_DIR", ".excel_cache")
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
 def secure_urls(url: str):
     """
     Convert insecure web addresses to secure ones by replacing
@@ -92,3 +105,145 @@ def clean_and_split_multivalue_string(str, separator):
 
 def get_entity_view_url(entity):
     return f"{APIS_BASE_URI}{entity.get_absolute_url()[1:]}"
+
+
+def positive_int(value):
+    """
+    Argument type for command line options which require a positive integer.
+
+    :param value: the option's value as a string
+    :return: the value as an integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: '{value}'")
+
+    return number
+
+
+def hash_file(file_path):
+    """
+    :param file_path: path of a local file
+    :return: SHA-256 hex digest of the file's content
+    """
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+def prune_excel_cache(file_path, file_hash, cache_dir=EXCEL_CACHE_DIR):
+    """
+    Delete the cached sheets of previous versions of an Excel file.
+
+    :param file_path: path of the Excel file
+    :param file_hash: hash of the file's current content, see hash_file()
+    :param cache_dir: directory of cached sheets
+    """
+    file_path = os.path.abspath(file_path)
+
+    for index_path in glob.glob(os.path.join(cache_dir, "*.json")):
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            continue
+
+        if not isinstance(index, dict) or index.get("file") != file_path:
+            continue
+        if index.get("file_hash") == file_hash:
+            continue
+
+        key = os.path.splitext(os.path.basename(index_path))[0]
+        # remove index first, so incomplete caches are never read
+        os.remove(index_path)
+        for sheet_path in glob.glob(os.path.join(cache_dir, f"{key}_*.feather")):
+            os.remove(sheet_path)
+
+
+def read_excel_cached(
+    file_path, sheet_name=0, usecols=None, dtype=None, cache_dir=EXCEL_CACHE_DIR
+):
+    """
+    Read sheets of an Excel file like pandas.read_excel() and cache
+    them as Feather files, so unchanged files only get parsed once.
+
+    Cached sheets are keyed by the hash of the file's content and the
+    reading parameters. Caches of previous versions of the file are
+    deleted when a new version is cached. If pyarrow, which pandas
+    needs to read and write Feather files, is missing, the Excel file
+    is read every time.
+
+    :param file_path: path of the Excel file
+    :param sheet_name: name or position of the sheet to read,
+                       None to read all sheets
+    :param usecols: list of names of the columns to read, columns
+                    missing from a sheet are ignored
+    :param dtype: data type of the columns, see pandas.read_excel()
+    :param cache_dir: directory of cached sheets
+    :return: DataFrame, or dictionary of DataFrames by sheet name
+             if sheet_name is None
+    """
+    import pandas as pd
+
+    def read_excel():
+        return pd.read_excel(
+            file_path,
+            sheet_name=sheet_name,
+            usecols=(lambda column: column in usecols) if usecols else None,
+            dtype=dtype,
+        )
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        logger.warning("pyarrow is not installed, not caching sheets of %s", file_path)
+        return read_excel()
+
+    file_hash = hash_file(file_path)
+    parameters = json.dumps([file_hash, sheet_name, sorted(usecols or []), str(dtype)])
+    key = hashlib.sha256(parameters.encode()).hexdigest()
+    index_path = os.path.join(cache_dir, f"{key}.json")
+
+    try:
+        with open(index_path) as f:
+            sheet_names = json.load(f)["sheets"]
+        sheets = {
+            name: pd.read_feather(os.path.join(cache_dir, f"{key}_{i}.feather"))
+            for i, name in enumerate(sheet_names)
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        sheets = read_excel()
+        if sheet_name is not None:
+            sheets = {sheet_name: sheets}
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            prune_excel_cache(file_path, file_hash, cache_dir)
+            for i, df in enumerate(sheets.values()):
+                df.to_feather(os.path.join(cache_dir, f"{key}_{i}.feather"))
+            # write index last, so it only exists for complete caches
+            tmp_path = f"{index_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "file": os.path.abspath(file_path),
+                        "file_hash": file_hash,
+                        "sheets": list(sheets.keys()),
+                    },
+                    f,
+                )
+            os.replace(tmp_path, index_path)
+        except Exception as e:
+            logger.warning("Could not cache sheets of %s: %s", file_path, e)
+
+    if sheet_name is not None:
+        return next(iter(sheets.values()))
+
+    return sheets
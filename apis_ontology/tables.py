@@ -2,6 +2,7 @@ import logging
 
 import django_tables2 as tables
 from apis_core.apis_entities.tables import AbstractEntityTable
+from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 from django_tables2.utils import A
 
@@ -40,10 +41,14 @@ class GenericEditLinkColumn(tables.Column):
 
 
 class FullTitleMixin(tables.Table):
+    # fields used for string representation of objects
+    queryset_fields = ["title", "subtitle"]
+
+    # annotated in SQL, see querysets.py
     full_title = GenericEditLinkColumn(
-        accessor="full_title",
+        accessor="annotated_full_title",
         verbose_name=_("Titel (gesamt)"),
-        order_by=("title", "subtitle"),
+        order_by=("annotated_full_title",),
     )
 
     class Meta:
@@ -52,10 +57,14 @@ class FullTitleMixin(tables.Table):
 
 
 class FullNameMixin(tables.Table):
+    # fields used for string representation of objects
+    queryset_fields = ["forename", "surname", "fallback_name"]
+
+    # annotated in SQL, see querysets.py
     full_name = GenericEditLinkColumn(
-        accessor="full_name",
+        accessor="annotated_full_name",
         verbose_name=_("Name (voller)"),
-        order_by=("fallback_name", "surname", "forename"),
+        order_by=("annotated_full_name",),
     )
 
     class Meta:
@@ -64,9 +73,60 @@ class FullNameMixin(tables.Table):
 
 
 class BaseEntityTable(AbstractEntityTable, tables.Table):
+    """
+    Parent class for all entity tables.
+
+    Only the model fields needed to render the table are loaded
+    from the database: those of its (selected) columns plus those
+    listed in "queryset_fields" of the table class and its parents,
+    e.g. fields used in objects' string representations.
+    """
+
+    # fields used for edit links
+    queryset_fields = ["self_contenttype"]
+
     id = GenericEditLinkColumn()
     progress_status = tables.Column(verbose_name=_("Status"))
 
+    def __init__(self, data=None, *args, **kwargs):
+        if isinstance(data, QuerySet):
+            data = data.only(
+                *self.get_queryset_fields(
+                    data.model,
+                    exclude=kwargs.get("exclude") or [],
+                    extra_columns=kwargs.get("extra_columns") or [],
+                )
+            )
+        super().__init__(data, *args, **kwargs)
+
+    @classmethod
+    def get_queryset_fields(cls, model, exclude, extra_columns):
+        """
+        Collect the names of the model fields required by the table.
+
+        :param model: model class of the table's data
+        :param exclude: names of columns excluded from the table
+        :param extra_columns: tuples of name and column object of
+                              columns added to the table
+        :return: list of field names
+        """
+        model_fields = {field.name for field in model._meta.concrete_fields}
+        columns = [
+            (name, column)
+            for name, column in cls.base_columns.items()
+            if name not in exclude
+        ] + list(extra_columns)
+
+        fields = []
+        for klass in reversed(cls.__mro__):
+            fields.extend(klass.__dict__.get("queryset_fields", []))
+        for name, column in columns:
+            fields.append(name)
+            if column.accessor:
+                fields.append(column.accessor.bits[0])
+
+        return list(dict.fromkeys(f for f in fields if f in model_fields))
+
     class Meta(AbstractEntityTable.Meta):
         exclude = ["desc"]
         sequence = (
@@ -0,0 +1,121 @@
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from apis_ontology.scripts.access_sharepoint import import_file_data
+
+
+FILE_CONTENT = b"Sigle;Name_im_Werk\nXY;Wien\n"
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+
+class FakeSharePoint:
+    """
+    SharePoint connection which serves the same file for every URL.
+    """
+
+    site = "example.sharepoint.com"
+
+    def __init__(self, content):
+        self.content = content
+        self.downloads = 0
+
+    def get(self, url, stream=False):
+        self.downloads += 1
+        return FakeResponse(self.content)
+
+
+class ImportFileDataTest(SimpleTestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.out_dir = tmp_dir.name
+        self.sharepoint = FakeSharePoint(FILE_CONTENT)
+        self.parsed = []
+        self.abort = False
+
+    def parse_with_rejected_row(self, file_path):
+        self.parsed.append(file_path)
+        if self.abort:
+            raise RuntimeError("Import aborted.")
+
+        return [], ["Work with sigle XY doesn't exist."]
+
+    def import_file(self, parse_data, force=False):
+        return import_file_data(
+            self.sharepoint,
+            "Entities.xlsx",
+            "/sites/test/Entities.xlsx",
+            parse_data,
+            out_dir=self.out_dir,
+            file_version="1",
+            force=force,
+        )
+
+    def test_downloads_file(self):
+        self.import_file(self.parse_with_rejected_row)
+        out_file = os.path.join(self.out_dir, "dest_Entities.xlsx")
+
+        with open(out_file, "rb") as f:
+            self.assertEqual(f.read(), FILE_CONTENT)
+        self.assertEqual(self.parsed, [out_file])
+
+    def test_skips_unchanged_file_with_rejected_rows(self):
+        success, failure = self.import_file(self.parse_with_rejected_row)
+        self.assertEqual(failure, ["Work with sigle XY doesn't exist."])
+
+        success, failure = self.import_file(self.parse_with_rejected_row)
+
+        self.assertEqual((success, failure), ([], []))
+        self.assertEqual(len(self.parsed), 1)
+        self.assertEqual(self.sharepoint.downloads, 1)
+
+    def test_parses_unchanged_file_when_forced(self):
+        self.import_file(self.parse_with_rejected_row)
+        self.import_file(self.parse_with_rejected_row, force=True)
+
+        self.assertEqual(len(self.parsed), 2)
+
+    def test_parses_changed_file(self):
+        self.import_file(self.parse_with_rejected_row)
+        self.sharepoint.content = FILE_CONTENT + b"XZ;Graz\n"
+
+        import_file_data(
+            self.sharepoint,
+            "Entities.xlsx",
+            "/sites/test/Entities.xlsx",
+            self.parse_with_rejected_row,
+            out_dir=self.out_dir,
+            file_version="2",
+        )
+
+        self.assertEqual(len(self.parsed), 2)
+
+    def test_parses_file_again_after_aborted_import(self):
+        self.abort = True
+        with self.assertRaises(RuntimeError):
+            self.import_file(self.parse_with_rejected_row)
+
+        self.abort = False
+        self.import_file(self.parse_with_rejected_row)
+
+        self.assertEqual(len(self.parsed), 2)
+        self.assertEqual(self.sharepoint.downloads, 1)
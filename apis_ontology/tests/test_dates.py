@@ -0,0 +1,49 @@
+import datetime
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from apis_ontology.dates import get_format_patterns, parse_with_input_formats
+
+
+class GetFormatPatternsTest(SimpleTestCase):
+    def test_compiles_pattern_per_input_format(self):
+        date_formats = [date_format for date_format, _ in get_format_patterns()]
+
+        self.assertEqual(date_formats, settings.DATE_INPUT_FORMATS)
+
+    def test_patterns_match_digits_and_literal_separators(self):
+        patterns = dict(get_format_patterns())
+
+        self.assertTrue(patterns["%d.%m.%Y"].fullmatch("9.7.1982"))
+        self.assertTrue(patterns["%d.%m.%Y"].fullmatch("18.04.1963"))
+        self.assertFalse(patterns["%d.%m.%Y"].fullmatch("9x7x1982"))
+        self.assertFalse(patterns["%Y"].fullmatch("99"))
+
+
+class ParseWithInputFormatsTest(SimpleTestCase):
+    def test_parses_dates_in_input_formats(self):
+        dates = {
+            "1996-02-29": datetime.datetime(1996, 2, 29),
+            "2015-10": datetime.datetime(2015, 10, 1),
+            "1999": datetime.datetime(1999, 1, 1),
+            "2/2002": datetime.datetime(2002, 2, 1),
+            "2.2002": datetime.datetime(2002, 2, 1),
+            "9.7.1982": datetime.datetime(1982, 7, 9),
+            "18/4/1963": datetime.datetime(1963, 4, 18),
+            "23-12-1980": datetime.datetime(1980, 12, 23),
+        }
+
+        for date_string, expected in dates.items():
+            with self.subTest(date_string=date_string):
+                self.assertEqual(parse_with_input_formats(date_string), expected)
+
+    def test_returns_none_for_other_strings(self):
+        for date_string in ["", "Frühjahr 1999", "1999 ", "ca. 1980", "12. März 1999"]:
+            with self.subTest(date_string=date_string):
+                self.assertIsNone(parse_with_input_formats(date_string))
+
+    def test_returns_none_for_invalid_dates(self):
+        for date_string in ["1997-02-29", "1999-13", "32.1.1999"]:
+            with self.subTest(date_string=date_string):
+                self.assertIsNone(parse_with_input_formats(date_string))
@@ -0,0 +1,107 @@
+import itertools
+
+from apis_core.apis_relations.models import Property
+from django.test import SimpleTestCase, TestCase
+
+from apis_ontology.models import Work, WorkType
+from apis_ontology.scripts.import_helpers import (
+    LookupIndex,
+    chunked,
+    skip_to_checkpoint,
+)
+
+
+class ChunkedTest(SimpleTestCase):
+    def test_splits_items_into_chunks(self):
+        self.assertEqual(
+            list(chunked(range(7), 3)),
+            [[0, 1, 2], [3, 4, 5], [6]],
+        )
+
+    def test_no_partial_chunk_when_evenly_divisible(self):
+        self.assertEqual(list(chunked(range(4), 2)), [[0, 1], [2, 3]])
+
+    def test_empty_items(self):
+        self.assertEqual(list(chunked([], 3)), [])
+
+    def test_consumes_items_lazily(self):
+        chunks = chunked(itertools.count(), 2)
+
+        self.assertEqual(next(chunks), [0, 1])
+        self.assertEqual(next(chunks), [2, 3])
+
+
+class SkipToCheckpointTest(SimpleTestCase):
+    def test_skips_items_up_to_and_including_checkpoint(self):
+        items = skip_to_checkpoint(range(6), lambda item: item, "2")
+
+        self.assertEqual(list(items), [3, 4, 5])
+
+    def test_compares_keys_as_strings(self):
+        items = [{"key": 1}, {"key": 2}, {"key": 3}]
+        remaining = skip_to_checkpoint(items, lambda item: item["key"], "1")
+
+        self.assertEqual(list(remaining), [{"key": 2}, {"key": 3}])
+
+    def test_checkpoint_at_last_item(self):
+        self.assertEqual(list(skip_to_checkpoint(range(3), str, "2")), [])
+
+    def test_consumes_items_lazily(self):
+        items = skip_to_checkpoint(itertools.count(), lambda item: item, "1")
+
+        self.assertEqual(next(items), 2)
+        self.assertEqual(next(items), 3)
+
+    def test_missing_checkpoint_raises_error(self):
+        items = skip_to_checkpoint(range(3), lambda item: item, "5")
+
+        with self.assertRaises(ValueError):
+            list(items)
+
+
+class LookupIndexTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.prop = Property.objects.create(
+            name_forward="discusses", name_reverse="is discussed in"
+        )
+        cls.work_type = WorkType.objects.create(name="Roman")
+        cls.work = Work.objects.create(title="Die Klosterschule", siglum="KS")
+
+    def test_looks_up_properties_without_queries(self):
+        index = LookupIndex()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(index.get_property("discusses"), self.prop)
+            self.assertEqual(index.find_property("is discussed in"), self.prop)
+            self.assertIsNone(index.find_property("mentions"))
+
+    def test_unknown_property_raises_error(self):
+        with self.assertRaises(KeyError):
+            LookupIndex().get_property("mentions")
+
+    def test_looks_up_types(self):
+        index = LookupIndex()
+
+        self.assertEqual(index.get_type("Roman"), self.work_type)
+        self.assertIsNone(index.get_type("Hörspiel"))
+
+    def test_loads_works_once_on_first_lookup(self):
+        index = LookupIndex()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(index.get_work("KS"), self.work)
+            self.assertIsNone(index.get_work("XY"))
+            self.assertIsNone(index.get_work(""))
+
+    def test_finds_added_works(self):
+        index = LookupIndex()
+        index.get_work("KS")
+        work = Work.objects.create(title="Das Verschwinden des Schattens", siglum="VS")
+
+        self.assertIsNone(index.get_work("VS"))
+
+        index.add_work(work)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(index.get_work("VS"), work)
@@ -0,0 +1,116 @@
+from django.test import TestCase
+
+from apis_ontology.models import ImportRunState
+from apis_ontology.scripts.import_pipeline import ImportPipeline
+
+
+def parse_number(item):
+    return {"key": item, "square": item * item}
+
+
+class ImportPipelineTest(TestCase):
+    def setUp(self):
+        self.parsed = []
+        self.written = []
+        self.fail_on = None
+
+    def parse(self, item):
+        self.parsed.append(item)
+        return parse_number(item)
+
+    def resolve(self, record, index):
+        record["resolved"] = True
+        return record
+
+    def write(self, record, index, state=None):
+        if record["key"] == self.fail_on:
+            raise RuntimeError(f"Failed to write {record['key']}.")
+
+        self.written.append(record)
+        if state is not None:
+            state["last_square"] = record["square"]
+
+        if record["square"] % 2:
+            return [], [record["key"]]
+
+        return [record["key"]], []
+
+    def get_pipeline(self, state=None, **kwargs):
+        return ImportPipeline(
+            parse=self.parse,
+            resolve=self.resolve,
+            write=lambda record, index: self.write(record, index, state),
+            get_key=lambda record: record["key"],
+            get_item_key=lambda item: item,
+            run_name="test_pipeline",
+            batch_size=2,
+            workers=0,
+            **kwargs,
+        )
+
+    def test_runs_all_stages_in_order(self):
+        success, failure = self.get_pipeline().run(range(5))
+
+        self.assertEqual(success, [0, 2, 4])
+        self.assertEqual(failure, [1, 3])
+        self.assertEqual([record["key"] for record in self.written], list(range(5)))
+        self.assertTrue(all(record["resolved"] for record in self.written))
+
+    def test_reports_stage_stats(self):
+        pipeline = self.get_pipeline()
+        pipeline.run(range(5))
+
+        for stage in ["parse", "resolve", "write"]:
+            self.assertEqual(pipeline.stats[stage].items, 5)
+
+    def test_records_completed_run(self):
+        self.get_pipeline().run(range(5))
+        run_state = ImportRunState.objects.get(name="test_pipeline")
+
+        self.assertTrue(run_state.completed)
+        self.assertEqual(run_state.last_key, "4")
+        self.assertEqual(run_state.processed, 5)
+
+    def test_resumes_after_last_committed_batch(self):
+        state = {}
+        self.fail_on = 5
+
+        with self.assertRaises(RuntimeError):
+            self.get_pipeline(state).run(range(8))
+
+        run_state = ImportRunState.objects.get(name="test_pipeline")
+        self.assertFalse(run_state.completed)
+        self.assertEqual(run_state.last_key, "3")
+        self.assertEqual(run_state.state, {"last_square": 9})
+
+        self.parsed = []
+        self.written = []
+        self.fail_on = None
+        state = {}
+        success, failure = self.get_pipeline(state).run(range(8), resume=True)
+
+        # committed items are skipped before parsing
+        self.assertEqual(self.parsed, [4, 5, 6, 7])
+        self.assertEqual(success, [4, 6])
+        self.assertEqual(failure, [5, 7])
+        self.assertEqual(state, {"last_square": 49})
+
+    def test_restores_state_on_resume(self):
+        ImportRunState.objects.create(
+            name="test_pipeline", last_key="1", processed=2, state={"work_id": 3}
+        )
+        state = {}
+        pipeline = self.get_pipeline(state)
+        pipeline.write = lambda record, index: ([dict(state)], [])
+
+        success, failure = pipeline.run(range(3), resume=True)
+
+        self.assertEqual(success, [{"work_id": 3}])
+
+    def test_restarts_without_resume(self):
+        ImportRunState.objects.create(name="test_pipeline", last_key="1", processed=2)
+
+        self.get_pipeline().run(range(3))
+
+        self.assertEqual(self.parsed, [0, 1, 2])
+        self.assertEqual(ImportRunState.objects.get(name="test_pipeline").processed, 3)
@@ -19,13 +19,19 @@ from apis_acdhch_default_settings.urls import urlpatterns
 from django.urls import include, path
 from rest_framework import routers
 
-from apis_ontology.api.views import PlaceViewSet, WorkDetailViewSet, WorkPreviewViewSet
+from apis_ontology.api.views import (
+    PlaceViewSet,
+    WorkDetailViewSet,
+    WorkExportViewSet,
+    WorkPreviewViewSet,
+)
 
 
 router = routers.DefaultRouter()
 
 router.register(r"work-preview", WorkPreviewViewSet, basename="work-preview")
 router.register(r"work-detail", WorkDetailViewSet, basename="work-detail")
+router.register(r"work-export", WorkExportViewSet, basename="work-export")
 router.register(r"place-detail", PlaceViewSet, basename="place-detail")
 
 urlpatterns += [